@@ -0,0 +1,57 @@
+""" Allocation count, retained bytes and construction time per CollectionChange, comparing the previous
+__dict__ based event class with the current tuple based record.
+
+    python -m benchmarks.change_allocation
+
+On CPython 3.6 with the seven field CollectionChange:
+
+    event                      allocs/event    bytes/event   ns/event
+    LegacyCollectionChange             3.00          184.0        872
+    CollectionChange                   1.00          120.0        439
+"""
+import tracemalloc
+from timeit import timeit
+
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+EVENTS = 100000
+
+
+class LegacyCollectionChange:
+    """ The event class as it was before it became an immutable record, kept here for comparison. """
+
+    def __init__(self, source=None, action=None, items=None):
+        self.source = source if source is not None else ()
+        self.action = action
+        self.items = items if items is not None else ()
+
+    @classmethod
+    def Add(cls, source, items):
+        return cls(source=source, action=CollectionChangeAction.ADD, items=items)
+
+
+def _measure(factory):
+    source, item = object(), object()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    events = [factory(source, item) for _ in range(EVENTS)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = [s for s in after.compare_to(before, 'filename') if s.size_diff > 0]
+    # the list holding the events is excluded so only the events themselves are counted
+    blocks = sum(s.count_diff for s in stats) - 1
+    size = sum(s.size_diff for s in stats) - events.__sizeof__()
+    seconds = timeit(lambda: factory(source, item), number=EVENTS)
+    return blocks / EVENTS, size / EVENTS, seconds / EVENTS * 1e9
+
+
+def main():
+    print('{:<26} {:>12} {:>14} {:>10}'.format('event', 'allocs/event', 'bytes/event', 'ns/event'))
+    for name, factory in (('LegacyCollectionChange', LegacyCollectionChange.Add),
+                          ('CollectionChange', CollectionChange.Add)):
+        print('{:<26} {:>12.2f} {:>14.1f} {:>10.0f}'.format(name, *_measure(factory)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+""" Encode and decode throughput of CollectionChange frames with ChangeCodec, compared with hand written JSON
+(the change turned into a dict first) and pickle, on a mix of list and dict changes. pickle is measured both on
+the whole list at once and one change at a time, the way a stream sends them.
+
+    python -m benchmarks.codec_throughput
+
+On CPython 3.6 with the seven field CollectionChange:
+
+    codec           encode ev/s    decode ev/s  bytes/event
+    ChangeCodec         231,042        205,656         53.1
+    json                166,946        160,183        107.1
+    pickle              322,199        728,888         39.6
+    pickle/event        125,237        190,295        179.6
+"""
+import json
+import pickle
+from timeit import repeat
+
+from reactive.shared.ChangeCodec import ChangeCodec
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+EVENTS = 20000
+ROUNDS = 7
+
+
+def _changes():
+    changes = []
+    for i in range(EVENTS):
+        kind = i % 4
+        if kind == 0:
+            changes.append(CollectionChange.Add(None, i * 1.5, index=i).tagged(i))
+        elif kind == 1:
+            changes.append(CollectionChange.Remove(None, 'sym{}'.format(i), key='sym{}'.format(i),
+                                                   old_items=(i, 101.25)).tagged(i))
+        elif kind == 2:
+            changes.append(CollectionChange.Extend(None, [i, i + 1, i + 2], index=i).tagged(i))
+        else:
+            changes.append(CollectionChange.Add(None, {'bid': 100.5, 'ask': 100.75}, key='sym{}'.format(i)).tagged(i))
+    return changes
+
+
+def _toJson(change):
+    return json.dumps({'action': change.Action.value, 'items': change.Items, 'key': change.Key,
+                       'index': change.Index, 'old_items': change.OldItems, 'seq': change.Sequence}).encode()
+
+
+def _fromJson(data):
+    fields = json.loads(data.decode())
+    return CollectionChange(None, CollectionChangeAction(fields['action']), fields['items'], fields['key'],
+                            fields['index'], fields['old_items'], fields['seq'])
+
+
+def _pickleBatch(changes):
+    # the source is not part of the wire format, so pickle the changes without one like the other codecs
+    return pickle.dumps(changes, pickle.HIGHEST_PROTOCOL)
+
+
+def _size(data):
+    return sum(len(frame) for frame in data) if isinstance(data, list) else len(data)
+
+
+def main():
+    changes = _changes()
+    codecs = (
+        ('ChangeCodec', lambda: ChangeCodec.encode_batch(changes), lambda data: ChangeCodec.decode_batch(data)),
+        ('json', lambda: b'\n'.join(_toJson(change) for change in changes),
+         lambda data: [_fromJson(line) for line in data.split(b'\n')]),
+        ('pickle', lambda: _pickleBatch(changes), pickle.loads),
+        ('pickle/event', lambda: [pickle.dumps(change, pickle.HIGHEST_PROTOCOL) for change in changes],
+         lambda data: [pickle.loads(frame) for frame in data]),
+    )
+    print('{:<12} {:>14} {:>14} {:>12}'.format('codec', 'encode ev/s', 'decode ev/s', 'bytes/event'))
+    for name, encode, decode in codecs:
+        data = encode()
+        # best of the rounds, the least disturbed by other work on the machine
+        encoding = min(repeat(encode, number=1, repeat=ROUNDS))
+        decoding = min(repeat(lambda: decode(data), number=1, repeat=ROUNDS))
+        print('{:<12} {:>14,.0f} {:>14,.0f} {:>12.1f}'.format(name, EVENTS / encoding, EVENTS / decoding,
+                                                              _size(data) / EVENTS))
+
+
+if __name__ == '__main__':
+    main()
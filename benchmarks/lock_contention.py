@@ -0,0 +1,60 @@
+""" Read-mostly contention on ObservableDict: 16 threads doing 50 reads per write, comparing the default RLock
+with ReaderWriterLock. Reports total throughput and the worst time a single read waited.
+
+    python -m benchmarks.lock_contention
+
+On CPython 3.6 with the seven field CollectionChange:
+
+    lock                        ops/s  worst read (ms)
+    RLock                      414624           665.39
+    ReaderWriterLock           129221           211.91
+"""
+import threading
+import time
+
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.ReaderWriterLock import ReaderWriterLock
+
+THREADS = 16
+ROUNDS = 400
+READS_PER_WRITE = 50
+KEYS = 1000
+
+
+def _run(lock):
+    od = ObservableDict({k: k for k in range(KEYS)}, lock=lock)
+    od.when_collection_changes().subscribe(lambda change: None)
+    start = threading.Barrier(THREADS + 1)
+    worst = []
+
+    def worker(seed):
+        slowest = 0.0
+        start.wait()
+        for i in range(ROUNDS):
+            for r in range(READS_PER_WRITE):
+                began = time.perf_counter()
+                od[(seed + i * r) % KEYS]
+                slowest = max(slowest, time.perf_counter() - began)
+            od.update({(seed + i) % KEYS: i})
+        worst.append(slowest)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    for t in threads:
+        t.start()
+    start.wait()
+    began = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - began
+    operations = THREADS * ROUNDS * (READS_PER_WRITE + 1)
+    return operations / elapsed, max(worst) * 1e3
+
+
+def main():
+    print('{:<18} {:>14} {:>16}'.format('lock', 'ops/s', 'worst read (ms)'))
+    for name, factory in (('RLock', lambda: None), ('ReaderWriterLock', ReaderWriterLock)):
+        print('{:<18} {:>14.0f} {:>16.2f}'.format(name, *_run(factory())))
+
+
+if __name__ == '__main__':
+    main()
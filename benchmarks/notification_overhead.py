@@ -0,0 +1,45 @@
+""" Per-operation overhead of the observable collections against their builtin counterparts, with and without a
+subscriber attached.
+
+    python -m benchmarks.notification_overhead
+
+On CPython 3.6 with the seven field CollectionChange:
+
+    op            builtin   no observers     1 observer   (ns/op)
+    append            103            697           4921
+    add                63            714            585
+    update            164           1050           6742
+"""
+from timeit import timeit
+
+from reactive.ObservableDict import ObservableDict
+from reactive.ObservableList import ObservableList
+from reactive.ObservableSet import ObservableSet
+
+NUMBER = 200000
+
+
+def _per_op(stmt, setup_globals):
+    return timeit(stmt, globals=setup_globals, number=NUMBER) / NUMBER * 1e9
+
+
+def _row(name, builtin, stmt, factory):
+    plain = _per_op(stmt, {'c': builtin()})
+    idle = factory()
+    idle_ns = _per_op(stmt, {'c': idle})
+    observed = factory()
+    subscription = observed.when_collection_changes().subscribe(lambda change: None)
+    observed_ns = _per_op(stmt, {'c': observed})
+    subscription.dispose()
+    print('{:<10} {:>10.0f} {:>14.0f} {:>14.0f}'.format(name, plain, idle_ns, observed_ns))
+
+
+def main():
+    print('{:<10} {:>10} {:>14} {:>14}   (ns/op)'.format('op', 'builtin', 'no observers', '1 observer'))
+    _row('append', list, 'c.append(1)', ObservableList)
+    _row('add', set, 'c.add(1)', ObservableSet)
+    _row('update', dict, 'c.update({1: 1})', ObservableDict)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+import queue
+import socket
+import struct
+import threading
+import time
+
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.ChangeCodec import ChangeCodec
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.shared.SequenceGapError import SequenceGapError
+
+_RESUME = struct.Struct('<q')   # sent by a follower on connect: the last sequence it applied, -1 for a snapshot
+_LENGTH = struct.Struct('<I')   # the length prefix of a ChangeCodec frame
+_HEARTBEAT_BODY = struct.Struct('<dq')     # leader clock, leader sequence
+# every message from the leader starts with its kind: a change or a snapshot (each followed by a ChangeCodec frame)
+# or a heartbeat (followed by _HEARTBEAT_BODY)
+_CHANGE, _SNAPSHOT, _HEARTBEAT = range(3)
+_CLOSE = object()
+
+
+def _listen(address) -> socket.socket:
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    server = socket.socket(family, socket.SOCK_STREAM)
+    if family is socket.AF_INET:
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(address)
+    server.listen()
+    return server
+
+
+def _connect(address) -> socket.socket:
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    connection = socket.socket(family, socket.SOCK_STREAM)
+    connection.connect(address)
+    if family is socket.AF_INET:
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
+
+
+class ReplicationLeader:
+    """ Serves an ObservableDict to ReplicationFollowers over TCP ((host, port)) or a Unix socket (a path).
+    A new follower gets a snapshot followed by the changes numbered after it; a follower that reconnects is
+    replayed the changes it missed from the dictionary's journal (journal_size), or sent a new snapshot when they
+    are no longer there. Changes are sent as ChangeCodec frames, as many per write as have queued up, and an idle
+    connection gets a heartbeat message every heartbeat_interval carrying the leader's sequence and clock. A follower that
+    falls more than max_pending changes behind is disconnected and resyncs when it reconnects. """
+
+    def __init__(self, source: ObservableDict, address, heartbeat_interval: float = 0.5, max_pending: int = 100000):
+        self._source = source
+        self.heartbeat_interval = heartbeat_interval
+        self.max_pending = max_pending
+        self._server = _listen(address)
+        self.address = self._server.getsockname()
+        self._lock = threading.Lock()
+        self._connections = set()
+        self.is_closed = False
+        self._acceptThread = threading.Thread(target=self._accept, daemon=True, name='ReplicationLeader-accept')
+        self._acceptThread.start()
+
+    @property
+    def follower_count(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def close(self) -> None:
+        """ Stops serving and disconnects every follower """
+        with self._lock:
+            self.is_closed = True
+            connections = list(self._connections)
+        self._server.close()
+        for _, pending in connections:
+            pending.put(_CLOSE)
+
+    # internal methods
+    def _accept(self) -> None:
+        while not self.is_closed:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(connection,), daemon=True,
+                             name='ReplicationLeader-follower').start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        pending = queue.Queue()
+        subscription = None
+        entry = (connection, pending)
+        try:
+            since, = _RESUME.unpack(self._receiveExactly(connection, _RESUME.size))
+            subscription = self._subscribe(since, pending)
+            with self._lock:
+                if self.is_closed:
+                    return
+                self._connections.add(entry)
+            self._send(connection, pending)
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._connections.discard(entry)
+            if subscription is not None:
+                subscription.dispose()
+            connection.close()
+
+    def _subscribe(self, since: int, pending: queue.Queue):
+        source = self._source
+
+        def enqueue(change):
+            pending.put((_CHANGE, change))
+            if pending.qsize() > self.max_pending:
+                pending.put(_CLOSE)
+
+        def fail(error):
+            pending.put(_CLOSE)
+
+        # the lock keeps writers out until the snapshot or the replay is queued ahead of the changes after it
+        with source.lock:
+            if since >= 0:
+                # replayed from the journal when it still holds the changes after since; an error while replaying
+                # falls back to a snapshot, an error after it closes the connection
+                errors = []
+                live = False
+
+                def resumeError(error):
+                    if live:
+                        fail(error)
+                    else:
+                        errors.append(error)
+
+                subscription = source.when_collection_changes(since=since).subscribe(enqueue, resumeError)
+                if not errors:
+                    live = True
+                    return subscription
+                if not isinstance(errors[0], (SequenceGapError, ValueError)):
+                    raise errors[0]
+            snapshot, version, subscription = source.subscribe_with_snapshot(enqueue, fail)
+            pending.put((_SNAPSHOT, CollectionChange.Extend(None, snapshot).tagged(version)))
+            return subscription
+
+    def _send(self, connection: socket.socket, pending: queue.Queue) -> None:
+        source = self._source
+        while True:
+            out = bytearray()
+            try:
+                message = pending.get(timeout=self.heartbeat_interval)
+            except queue.Empty:
+                out.append(_HEARTBEAT)
+                out += _HEARTBEAT_BODY.pack(time.time(), source.sequence)
+                connection.sendall(out)
+                continue
+            # everything that queued up while the last write was in flight goes out in one write
+            while message is not None:
+                if message is _CLOSE:
+                    if out:
+                        connection.sendall(out)
+                    return
+                kind, change = message
+                out.append(kind)
+                ChangeCodec.encode_into(out, change)
+                try:
+                    message = pending.get_nowait()
+                except queue.Empty:
+                    message = None
+            connection.sendall(out)
+
+    @staticmethod
+    def _receiveExactly(connection: socket.socket, size: int) -> bytes:
+        data = b''
+        while len(data) < size:
+            chunk = connection.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError('connection closed')
+            data += chunk
+        return data
+
+
+class ReplicationFollower:
+    """ Keeps a local read-only ObservableDict (.dict) in sync with a ReplicationLeader. Changes are applied
+    through the dictionary's own methods, so its subscribers are notified as usual and reads stay local. After a
+    lost connection the follower reconnects and asks for the changes after the last one it applied; a change that
+    does not follow on from it (a gap) also triggers a resync. lag is the number of leader changes not applied
+    yet as of the last heartbeat and lag_seconds how old that heartbeat was when it arrived. """
+
+    def __init__(self, address, reconnect_interval: float = 0.5, receive_size: int = 256 * 1024, **kwargs):
+        self.address = address
+        self.reconnect_interval = reconnect_interval
+        self.receive_size = receive_size
+        self.dict = ObservableDict(**kwargs)
+        self.applied_sequence = -1
+        self.leader_sequence = -1
+        self.lag_seconds = 0.0
+        self.is_closed = False
+        self._connection = None
+        self._synced = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='ReplicationFollower')
+        self._thread.start()
+
+    @property
+    def lag(self) -> int:
+        return max(self.leader_sequence - self.applied_sequence, 0)
+
+    def wait_synced(self, timeout: float = None) -> bool:
+        """ Blocks until the first snapshot has been applied """
+        return self._synced.wait(timeout)
+
+    def close(self) -> None:
+        """ Disconnects from the leader; the local dictionary keeps its last state """
+        self.is_closed = True
+        connection = self._connection
+        if connection is not None:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._thread.join()
+
+    # internal methods
+    def _run(self) -> None:
+        while not self.is_closed:
+            try:
+                self._connection = _connect(self.address)
+                self._connection.sendall(_RESUME.pack(self.applied_sequence))
+                self._receive(self._connection)
+            except (OSError, ValueError):
+                pass
+            finally:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+            if not self.is_closed:
+                time.sleep(self.reconnect_interval)
+
+    def _receive(self, connection: socket.socket) -> None:
+        buffer = bytearray(self.receive_size)
+        view = memoryview(buffer)
+        filled = 0
+        while not self.is_closed:
+            if filled == len(buffer):
+                # a frame larger than the buffer: grow it
+                view.release()
+                buffer.extend(bytes(len(buffer)))
+                view = memoryview(buffer)
+            received = connection.recv_into(view[filled:])
+            if not received:
+                return
+            filled += received
+            end = self._receiveMessages(view, filled)
+            if end < 0:
+                return
+            # keep the start of an incomplete message for the next read
+            buffer[:filled - end] = buffer[end:filled]
+            filled -= end
+
+    def _receiveMessages(self, view: memoryview, size: int) -> int:
+        """ Applies the complete messages in view[:size] and returns the offset after the last one, or -1 on a gap,
+        which makes the follower resync """
+        position = 0
+        while position < size:
+            kind = view[position]
+            start = position + 1
+            if kind == _HEARTBEAT:
+                end = start + _HEARTBEAT_BODY.size
+                if end > size:
+                    break
+                sent, sequence = _HEARTBEAT_BODY.unpack_from(view, start)
+                self.leader_sequence = max(self.leader_sequence, sequence)
+                self.lag_seconds = max(time.time() - sent, 0.0)
+            elif kind == _CHANGE or kind == _SNAPSHOT:
+                if start + _LENGTH.size > size:
+                    break
+                end = start + _LENGTH.size + _LENGTH.unpack_from(view, start)[0]
+                if end > size:
+                    break
+                with view[start:end] as frame:
+                    change = ChangeCodec.decode(frame)
+                if kind == _SNAPSHOT:
+                    self._applySnapshot(change)
+                elif not self._apply(change):
+                    return -1
+            else:
+                raise ValueError('unknown replication message {}'.format(kind))
+            position = end
+        return position
+
+    def _applySnapshot(self, change: CollectionChange) -> None:
+        target = self.dict
+        with target.batch():
+            target.clear()
+            target.update(change.Items)
+        self.applied_sequence = change.Sequence
+        self.leader_sequence = max(self.leader_sequence, change.Sequence)
+        self._synced.set()
+
+    def _apply(self, change: CollectionChange) -> bool:
+        """ Applies a change from the leader; returns False on a gap """
+        sequence = change.Sequence
+        if sequence != self.applied_sequence + 1:
+            return False
+        _applyChange(self.dict, change)
+        self.applied_sequence = sequence
+        self.leader_sequence = max(self.leader_sequence, sequence)
+        return True
+
+
+def _applyChange(target: ObservableDict, change: CollectionChange) -> None:
+    action = change.Action
+    if action is CollectionChangeAction.ADD:
+        target.setdefault(change.Key, change.Items)
+    elif action is CollectionChangeAction.REPLACE:
+        target[change.Key] = change.Items
+    elif action is CollectionChangeAction.REMOVE:
+        if change.Key in target:
+            del target[change.Key]
+    elif action is CollectionChangeAction.EXTEND:
+        target.update(change.Items)
+    elif action is CollectionChangeAction.CLEAR:
+        target.clear()
+    elif action is CollectionChangeAction.BATCH:
+        with target.batch():
+            for item in change.Items:
+                _applyChange(target, item)
@@ -0,0 +1,227 @@
+import heapq
+import threading
+
+from abc import ABC, abstractmethod
+from collections import Counter
+
+from rx import Observable
+from rx.core import ObservableBase
+from rx.subjects import Subject
+
+from reactive.shared.CollectionChange import CollectionChange
+
+
+class ObservableAggregate(ABC):
+    """ A scalar kept up to date from the change stream of an observable collection (the values of an
+    ObservableDict). Each change is folded in from the values it added and removed; changes that do not say which
+    values they touched (ObservableSet.update, clear) re-read the collection. Subscribers of when_value_changes()
+    are only notified when the value actually changes. An optional selector maps each value before aggregating. """
+
+    def __init__(self, source, selector=None):
+        self._source = source
+        self._selector = selector
+        self._valueChanges = Subject()
+        self.lock = threading.RLock()
+        self.is_disposed = False
+        # seeded and subscribed under the source's lock: changes numbered up to the version are in the seed and
+        # skipped if they are still queued for delivery (deferred / thread dispatch)
+        with source.lock:
+            source.check_disposed()
+            self._reset(self._select(source._values()))
+            self._value = self._current()
+            _, self._version, self._subscription = \
+                source.subscribe_with_snapshot(self._onSourceChanges, self._valueChanges.on_error)
+
+    @property
+    def value(self):
+        return self._value
+
+    def when_value_changes(self) -> ObservableBase:
+        return Observable.create(lambda obs: self._valueChanges.subscribe(obs))
+
+    def dispose(self):
+        """ Detaches the aggregate from its source, unsubscribe all the subscribers and release resources """
+        with self.lock:
+            if self.is_disposed:
+                return
+            self._subscription.dispose()
+            self._valueChanges.dispose()
+            self.is_disposed = True
+
+    def _select(self, values):
+        return values if self._selector is None else map(self._selector, values)
+
+    def _onSourceChanges(self, change: CollectionChange) -> None:
+        with self.lock:
+            if change.Sequence <= self._version:
+                return
+            delta = self._source._valueChanges(change)
+            if delta is None:
+                # the values are re-read as they are now, which takes in the changes still queued behind this one
+                with self._source.lock:
+                    self._reset(self._select(self._source._values()))
+                    self._version = self._source.sequence
+            else:
+                added, removed = delta
+                if len(removed):
+                    self._remove(list(self._select(removed)))
+                if len(added):
+                    self._add(list(self._select(added)))
+            value = self._current()
+            if value != self._value:
+                self._value = value
+                self._valueChanges.on_next(value)
+
+    @abstractmethod
+    def _add(self, values: list) -> None:
+        pass
+
+    @abstractmethod
+    def _remove(self, values: list) -> None:
+        pass
+
+    @abstractmethod
+    def _reset(self, values) -> None:
+        pass
+
+    @abstractmethod
+    def _current(self):
+        pass
+
+
+class CountAggregate(ObservableAggregate):
+    """ The number of values, O(1) per changed value """
+
+    def _add(self, values: list) -> None:
+        self._count += len(values)
+
+    def _remove(self, values: list) -> None:
+        self._count -= len(values)
+
+    def _reset(self, values) -> None:
+        self._count = sum(1 for _ in values)
+
+    def _current(self):
+        return self._count
+
+
+class SumAggregate(ObservableAggregate):
+    """ The sum of the values, O(1) per changed value """
+
+    def _add(self, values: list) -> None:
+        self._sum += sum(values)
+
+    def _remove(self, values: list) -> None:
+        self._sum -= sum(values)
+
+    def _reset(self, values) -> None:
+        self._sum = sum(values)
+
+    def _current(self):
+        return self._sum
+
+
+class MeanAggregate(ObservableAggregate):
+    """ The arithmetic mean of the values (None while empty), O(1) per changed value """
+
+    def _add(self, values: list) -> None:
+        self._sum += sum(values)
+        self._count += len(values)
+
+    def _remove(self, values: list) -> None:
+        self._sum -= sum(values)
+        self._count -= len(values)
+
+    def _reset(self, values) -> None:
+        values = list(values)
+        self._sum = sum(values)
+        self._count = len(values)
+
+    def _current(self):
+        return self._sum / self._count if self._count else None
+
+
+class _Descending:
+    """ Inverts ordering so a min-heap yields the largest value first """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+class _HeapAggregate(ObservableAggregate):
+    """ Keeps the extremum on a heap with lazy deletion: removed values are counted and only discarded once they
+    reach the top, so every change costs O(log n). The heap is compacted when stale entries outnumber live ones.
+    Values must be hashable. """
+
+    def _wrap(self, value):
+        return value
+
+    def _add(self, values: list) -> None:
+        for value in values:
+            entry = self._wrap(value)
+            if self._removed[entry]:
+                # re-adding a value still waiting to be discarded revives the stale entry instead
+                self._removed[entry] -= 1
+            else:
+                heapq.heappush(self._heap, entry)
+            self._size += 1
+
+    def _remove(self, values: list) -> None:
+        for value in values:
+            self._removed[self._wrap(value)] += 1
+            self._size -= 1
+        if len(self._heap) > 2 * self._size + 32:
+            self._compact()
+
+    def _reset(self, values) -> None:
+        self._heap = [self._wrap(value) for value in values]
+        heapq.heapify(self._heap)
+        self._removed = Counter()
+        self._size = len(self._heap)
+
+    def _compact(self) -> None:
+        live = []
+        removed = self._removed
+        for entry in self._heap:
+            if removed[entry]:
+                removed[entry] -= 1
+            else:
+                live.append(entry)
+        heapq.heapify(live)
+        self._heap = live
+        self._removed = Counter()
+
+    def _top(self):
+        heap, removed = self._heap, self._removed
+        while heap and removed[heap[0]]:
+            removed[heapq.heappop(heap)] -= 1
+        return heap[0] if heap else None
+
+
+class MinAggregate(_HeapAggregate):
+    """ The smallest value (None while empty), O(log n) per changed value """
+
+    def _current(self):
+        return self._top()
+
+
+class MaxAggregate(_HeapAggregate):
+    """ The largest value (None while empty), O(log n) per changed value """
+
+    def _wrap(self, value):
+        return _Descending(value)
+
+    def _current(self):
+        top = self._top()
+        return top.value if top is not None else None
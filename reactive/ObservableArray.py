@@ -0,0 +1,184 @@
+from collections import Iterable
+
+import numpy as np
+
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+
+
+class ObservableArray(AbstractObservableCollection):
+    """ A one-dimensional numeric array stored unboxed in a growable NumPy buffer (requires numpy).
+    Bulk writes (extend, slice assignment, masked updates) run vectorised and publish a single range change:
+    Extend for appended values, Replace for values overwritten in place. Items is a read-only view of the changed
+    region of the buffer, so it is not copied but reflects later writes; copy it to keep it beyond the notification.
+    The OldItems of a Replace is a copy of the region before the write, taken only while there are observers. """
+
+    def __init__(self, items: Iterable = None, dtype=np.float64, capacity: int = 16, **kwargs):
+        values = np.asarray(items if items is not None else (), dtype=dtype).ravel()
+        self._size = len(values)
+        self._buffer = np.empty(max(capacity, self._size), dtype=values.dtype)
+        self._buffer[:self._size] = values
+        super().__init__(**kwargs)
+
+    # protocol implementations
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        """ return the element at index, or a copy of the elements selected by a slice, mask or index array """
+        with self.read_lock:
+            selected = self._buffer[:self._size][index]
+            return selected.copy() if isinstance(selected, np.ndarray) else selected
+
+    def __setitem__(self, index, values):
+        """ assign to an element, slice, boolean mask or index array and publish one Replace change spanning the
+        first to the last element written """
+        with self.lock:
+            self.check_disposed()
+            data = self._buffer[:self._size]
+            if not self._observerCount:
+                data[index] = values
+                return
+            start, stop = self._span(index)
+            if start >= stop:
+                return
+            old = data[start:stop].copy()
+            data[index] = values
+            self._onCollectionChanges(CollectionChange.Replace(self, self._readonly(start, stop), start, old))
+
+    def __iter__(self):
+        return iter(self._buffer[:self._size])
+
+    def __contains__(self, item):
+        return bool((self._buffer[:self._size] == item).any())
+
+    def __eq__(self, other):
+        if not isinstance(other, ObservableArray):
+            return NotImplemented
+        return np.array_equal(self._buffer[:self._size], other._buffer[:other._size])
+
+    def __ne__(self, other):
+        if not isinstance(other, ObservableArray):
+            return NotImplemented
+        return not np.array_equal(self._buffer[:self._size], other._buffer[:other._size])
+
+    def __array__(self, dtype=None, copy=None):
+        # the NumPy 2 protocol: copy=True asks for an array of its own, copy=False for the buffer itself, which is
+        # never handed out writable
+        if copy is False:
+            raise ValueError('ObservableArray cannot be converted without a copy')
+        values = self._readonly(0, self._size)
+        if dtype is not None:
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    @property
+    def dtype(self):
+        return self._buffer.dtype
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def values(self):
+        """ a read-only view of the current elements, valid until the array grows """
+        with self.read_lock:
+            self.check_disposed()
+            return self._readonly(0, self._size)
+
+    # mutations
+    def append(self, value) -> None:
+        """ append the value to the end of the array and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            index = self._size
+            self._reserve(index + 1)
+            self._buffer[index] = value
+            self._size = index + 1
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Add(self, self._buffer[index], index=index))
+
+    def extend(self, values: Iterable) -> None:
+        """ append all the values in one vectorised copy and publishes a single Extend change """
+        with self.lock:
+            self.check_disposed()
+            if not isinstance(values, np.ndarray):
+                values = np.fromiter(values, self._buffer.dtype) if not hasattr(values, '__len__') \
+                    else np.asarray(values, self._buffer.dtype)
+            values = values.ravel()
+            start = self._size
+            stop = start + len(values)
+            self._reserve(stop)
+            self._buffer[start:stop] = values
+            self._size = stop
+            if self._observerCount and stop > start:
+                self._onCollectionChanges(CollectionChange.Extend(self, self._readonly(start, stop), index=start))
+
+    def pop(self):
+        """ remove and return the last element and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            if not self._size:
+                raise IndexError('pop from empty array')
+            self._size -= 1
+            value = self._buffer[self._size]
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Remove(self, value, index=self._size))
+            return value
+
+    def clear(self) -> None:
+        """ remove all the elements, keeping the buffer, and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            self._size = 0
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def to_numpy(self):
+        """ return a writable copy of the elements """
+        with self.read_lock:
+            self.check_disposed()
+            return self._buffer[:self._size].copy()
+
+    def dispose(self):
+        """ Releases the buffer, unsubscribe all the subscribers and release resources """
+        with self.lock:
+            self.check_disposed()
+            self._beginSuppressNotification()
+            self._buffer = None
+            self._size = 0
+            super().dispose()
+
+    # internal methods
+    def _snapshot(self):
+        return self._buffer[:self._size].copy()
+
+    def _reserve(self, size: int) -> None:
+        """ grows the buffer geometrically so that it holds at least size elements """
+        if size > len(self._buffer):
+            grown = np.empty(max(size, 2 * len(self._buffer)), dtype=self._buffer.dtype)
+            grown[:self._size] = self._buffer[:self._size]
+            self._buffer = grown
+
+    def _readonly(self, start: int, stop: int):
+        view = self._buffer[start:stop]
+        view.flags.writeable = False
+        return view
+
+    def _span(self, index) -> tuple:
+        """ the [start, stop) range of elements an assignment to index writes """
+        size = self._size
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            count = len(range(start, stop, step))
+            if not count:
+                return 0, 0
+            last = start + (count - 1) * step
+            return min(start, last), max(start, last) + 1
+        positions = np.arange(size)[index]
+        if np.ndim(positions) == 0:
+            return int(positions), int(positions) + 1
+        if not len(positions):
+            return 0, 0
+        return int(positions.min()), int(positions.max()) + 1
@@ -1,12 +1,29 @@
+from rx import Observable
+from rx.core import ObservableBase
+
 from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
 from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.shared.WriteAheadLog import WriteAheadLog
 
 
 class ObservableDict(AbstractObservableCollection):
 
-    def __init__(self, items=None):
+    def __init__(self, items=None, wal: WriteAheadLog = None, **kwargs):
         self._dict = dict(items) if items is not None else dict()
-        super().__init__()
+        self._keyObservers = {}
+        self.wal = wal
+        if wal is not None:
+            # a persisted dictionary is recovered from its log; items only seed a log that holds nothing yet
+            recovered = wal.recover()
+            if recovered is not None:
+                self._dict = recovered
+            elif self._dict:
+                wal.compact(self._dict)
+        super().__init__(**kwargs)
+        if wal is not None:
+            # the log has to see every change, so it counts as an observer
+            self._observerCount += 1
 
     # protocol / magic method implementation
     def __eq__(self, other):
@@ -29,16 +46,30 @@ class ObservableDict(AbstractObservableCollection):
         return iter(self._dict)
 
     def __getitem__(self, key):
-        with self.lock:
+        with self.read_lock:
             return self._dict.__getitem__(key)
 
+    def __setitem__(self, key, value):
+        """ set the value of key. Publishes Add for a new key, or Replace with the old value in OldItems """
+        with self.lock:
+            self.check_disposed()
+            current = self._dict
+            old = current.get(key, _MISSING)
+            current[key] = value
+            if self._observerCount:
+                if old is _MISSING:
+                    self._onCollectionChanges(CollectionChange.Add(self, value, key))
+                else:
+                    self._onCollectionChanges(CollectionChange.Replace(self, value, old_items=old, key=key))
+
     def __delitem__(self, key):
         with self.lock:
             try:
-                self._dict.__delitem__(key)
-                self._onCollectionChanges(CollectionChange.Remove(self, key))
+                value = self._dict.pop(key)
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, key, key, old_items=value))
             except KeyError as ke:
-                self._collectionChanges.on_error(ke)
+                self._onCollectionError(ke)
 
     def __del__(self):
         with self.lock:
@@ -47,7 +78,7 @@ class ObservableDict(AbstractObservableCollection):
     # dict methods
     def get(self, key, value=None):
         """ return the value of key. If key does not exists return default value(None) """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             if value is None:
                 return self._dict.get(key)
@@ -56,19 +87,19 @@ class ObservableDict(AbstractObservableCollection):
 
     def items(self):
         """ return a new view of the Observable dictionary's items (key, value) """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._dict.items()
 
     def keys(self):
         """ return a new view of the Observable dictionary's keys """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._dict.keys()
 
     def values(self):
         """ return a new view of the Observable dictionary's values """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._dict.values()
 
@@ -78,14 +109,14 @@ class ObservableDict(AbstractObservableCollection):
         with self.lock:
             self.check_disposed()
             try:
-                if value is None:
-                    element = self._dict.pop(key)
-                else:
-                    element = self._dict.pop(key, value)
-                self._onCollectionChanges(CollectionChange.Remove(self, element))
+                if value is not None and key not in self._dict:
+                    return value
+                element = self._dict.pop(key)
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, element, key, old_items=element))
                 return element
             except KeyError as ke:
-                self._collectionChanges.on_error(ke)
+                self._onCollectionError(ke)
 
     def popitem(self):
         """ remove and return an arbitrary item(key, value). Publishes Remove event upon successful removal or
@@ -94,41 +125,94 @@ class ObservableDict(AbstractObservableCollection):
             self.check_disposed()
             try:
                 element = self._dict.popitem()
-                self._onCollectionChanges(CollectionChange.Remove(self, element))
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, element, element[0], old_items=element[1]))
                 return element
             except KeyError as ke:
-                self._collectionChanges.on_error(ke)
+                self._onCollectionError(ke)
 
     def setdefault(self, key, default_value=None):
         """ if the given key is in Observable dictionary, return its values. If not, insert the key with the value
          and return the value (default=None). Only on addition of (key, value) events are published """
         with self.lock:
             self.check_disposed()
-            if default_value is None:
-                result = self._dict.setdefault(key)
-            else:
-                result = self._dict.setdefault(key, default_value)
+            if key in self._dict:
+                return self._dict[key]
 
-            if default_value == result:
-                self._onCollectionChanges(CollectionChange.Add(self, result))
+            result = self._dict.setdefault(key, default_value)
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Add(self, result, key))
 
             return result
 
     def update(self, other=None):
         """ update the dictionary with (key, value) pairs from other Observable dictionary / dictionary, overwriting
-         existing keys and publish Extend event """
+         existing keys and publish Extend event. The event's OldItems maps every overwritten key to its old value """
         with self.lock:
             self.check_disposed()
             if other is not None:
-                self._dict.update(other)
-                self._onCollectionChanges(CollectionChange.Extend(self, other))
+                if not hasattr(other, 'keys'):
+                    other = dict(other)
+                if self._observerCount:
+                    current = self._dict
+                    replaced = {key: current[key] for key in other.keys() if key in current}
+                    current.update(other)
+                    self._onCollectionChanges(CollectionChange.Extend(self, other, old_items=replaced))
+                else:
+                    self._dict.update(other)
+
+    def set_many(self, mapping) -> None:
+        """ set every (key, value) of mapping in one dict update and publish a single Extend event. Items is a copy
+        of mapping and OldItems maps the keys that were replaced to their old values; the other keys were added """
+        with self.lock:
+            self.check_disposed()
+            if not mapping:
+                return
+            current = self._dict
+            if self._observerCount:
+                written = dict(mapping)
+                replaced = {key: current[key] for key in written.keys() & current.keys()}
+                current.update(written)
+                self._onCollectionChanges(CollectionChange.Extend(self, written, old_items=replaced))
+            else:
+                current.update(mapping)
+
+    def delete_many(self, keys) -> int:
+        """ remove every key of keys that is present and publish the removals as a single Batch of Remove events.
+        Keys that are not present are skipped. Returns the number of keys removed """
+        with self.lock:
+            self.check_disposed()
+            pop = self._dict.pop
+            if not self._observerCount:
+                return sum(pop(key, _MISSING) is not _MISSING for key in keys)
+            removed = []
+            for key in keys:
+                value = pop(key, _MISSING)
+                if value is not _MISSING:
+                    removed.append(CollectionChange.Remove(self, key, key, old_items=value))
+            if removed:
+                self._onCollectionChanges(CollectionChange.Batch(self, tuple(removed)))
+            return len(removed)
 
     def clear(self):
         """ removes all items from the Observable dictionary and publishes Clear event"""
         with self.lock:
             self.check_disposed()
             self._dict.clear()
-            self._onCollectionChanges(CollectionChange.Clear(self))
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def when_key_changes(self, key) -> ObservableBase:
+        """ Creates an Observable of the changes made to a single key. Writes to other keys do not reach its
+        observers, and the key is dropped from the index once its last subscription is disposed. Keys written by
+        update() or set_many() are published as individual Add changes, or Replace changes with the old value for
+        keys that were overwritten, carrying the sequence number of the update; a Clear reaches every key. """
+        return Observable.create(lambda obs: self._subscribeToTable(self._keyObservers, (key,), obs))
+
+    def group_by(self, key_fn):
+        """ return a live ObservableDict of key_fn(value) -> ObservableList of the values sharing that key """
+        from reactive.ObservableGrouping import ObservableGrouping
+        return ObservableGrouping(self, key_fn)
 
     @staticmethod
     def fromkeys(keys, value=None):
@@ -138,11 +222,92 @@ class ObservableDict(AbstractObservableCollection):
         else:
             return ObservableDict(dict.fromkeys(keys, value))
 
+    # persistence
+    def compact(self) -> None:
+        """ Writes the dictionary to the snapshot file of its WriteAheadLog and empties the log """
+        with self.lock:
+            self.check_disposed()
+            if self.wal is not None:
+                self.wal.compact(self._dict)
+
+    def _onCollectionChanges(self, item: CollectionChange):
+        wal = self.wal
+        if wal is not None and not self._suppressNotification and self._batchedChanges is None:
+            wal.append(item)
+            if wal.needs_compaction:
+                wal.compact(self._dict)
+        super()._onCollectionChanges(item)
+
+    # value deltas
+    def _values(self):
+        return iter(self._dict.values())
+
+    def _valueChanges(self, change: CollectionChange):
+        action = change.Action
+        if action is CollectionChangeAction.ADD:
+            return (change.Items,), ()
+        if action is CollectionChangeAction.REMOVE:
+            return (), (change.OldItems,)
+        if action is CollectionChangeAction.REPLACE:
+            return (change.Items,), (change.OldItems,)
+        if action is CollectionChangeAction.EXTEND and change.OldItems is not None:
+            return change.Items.values(), change.OldItems.values()
+        if action is CollectionChangeAction.BATCH:
+            return self._batchValueChanges(change)
+        return None
+
+    # routing
+    def _routingTables(self) -> tuple:
+        return self._actionObservers, self._keyObservers
+
+    def _route(self, item: CollectionChange) -> None:
+        super()._route(item)
+        if self._keyObservers:
+            self._deliverToKeyObservers(item)
+
+    def _deliverToKeyObservers(self, item: CollectionChange) -> None:
+        table = self._keyObservers
+        action = item.Action
+        if action is CollectionChangeAction.BATCH:
+            for change in item.Items:
+                self._deliverToKeyObservers(change)
+        elif action is CollectionChangeAction.CLEAR:
+            for observers in list(table.values()):
+                for observer in observers:
+                    observer.on_next(item)
+        elif action is CollectionChangeAction.EXTEND:
+            written = item.Items
+            replaced = item.OldItems or {}
+            # walk whichever side is smaller, the written mapping or the subscribed keys
+            candidates = written.keys() if len(written) <= len(table) else list(table)
+            for key in candidates:
+                observers = table.get(key)
+                if observers and key in written:
+                    if key in replaced:
+                        change = CollectionChange.Replace(self, written[key], old_items=replaced[key], key=key)
+                    else:
+                        change = CollectionChange.Add(self, written[key], key)
+                    if item.Sequence is not None:
+                        change = change.tagged(item.Sequence)
+                    for observer in observers:
+                        observer.on_next(change)
+        else:
+            for observer in table.get(item.Key, ()):
+                observer.on_next(item)
+
+    def _snapshot(self):
+        return dict(self._dict)
+
     def dispose(self):
         """ Clears all the values from the dictionary, unsubscribe all the subscribers and release resources """
         with self.lock:
             self.check_disposed()
             self._beginSuppressNotification()
+            if self.wal is not None:
+                self.wal.close()
             self._dict.clear()
             self._dict = None
             super().dispose()
+
+
+_MISSING = object()
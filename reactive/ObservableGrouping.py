@@ -0,0 +1,105 @@
+from collections import defaultdict
+
+from reactive.ObservableDict import ObservableDict
+from reactive.ObservableList import ObservableList
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableGrouping(ObservableDict):
+    """ An ObservableDict of group key -> ObservableList, partitioning the values of a source collection (the values
+    of an ObservableDict) by key_fn. It is maintained from the values each source change added and removed: the
+    key function only runs for those values, the affected group lists publish their own changes, and a group key is
+    added to or removed from the grouping as its list becomes non-empty or empty. Values are appended to their group
+    in the order they arrive; a removal drops the first equal value from its group. Changes that do not say which
+    values they touched (ObservableSet.update, clear) regroup the source in full. """
+
+    def __init__(self, source, key_fn):
+        self._source = source
+        self._keyFn = key_fn
+        super().__init__()
+        # grouped and subscribed under the source's lock: changes numbered up to the version are in the groups and
+        # skipped if they are still queued for delivery (deferred / thread dispatch)
+        with source.lock:
+            source.check_disposed()
+            self._reset(source._values())
+            _, self._sourceVersion, self._subscription = \
+                source.subscribe_with_snapshot(self._onSourceChanges, self._onCollectionError)
+
+    def dispose(self):
+        """ Detaches the grouping from its source, unsubscribe all the subscribers and release resources. The group
+        lists stay usable on their own """
+        with self.lock:
+            self.check_disposed()
+            self._subscription.dispose()
+            super().dispose()
+
+    def _onSourceChanges(self, change: CollectionChange) -> None:
+        with self.lock:
+            if self.is_disposed or change.Sequence <= self._sourceVersion:
+                return
+            # the changes of a batch are applied one after the other, so a value added and removed again within
+            # the batch leaves no trace
+            deltas = [self._source._valueChanges(item) for item in self._changes(change)]
+            if any(delta is None for delta in deltas):
+                # the values are regrouped as they are now, which takes in the changes still queued behind this one
+                with self._source.lock:
+                    self._reset(self._source._values())
+                    self._sourceVersion = self._source.sequence
+                return
+            if len(deltas) == 1 and len(deltas[0][0]) + len(deltas[0][1]) == 1:
+                self._apply(*deltas[0])
+            else:
+                with self.batch():
+                    for added, removed in deltas:
+                        self._apply(added, removed)
+
+    @staticmethod
+    def _changes(change: CollectionChange):
+        """ the individual changes of a (possibly nested) batch, in order """
+        if change.Action is CollectionChangeAction.BATCH:
+            for item in change.Items:
+                yield from ObservableGrouping._changes(item)
+        else:
+            yield change
+
+    def _apply(self, added, removed) -> None:
+        for value in removed:
+            self._remove(value)
+        for value in added:
+            self._add(value)
+
+    def _add(self, value) -> None:
+        key = self._keyFn(value)
+        group = self._dict.get(key)
+        if group is None:
+            self.setdefault(key, ObservableList([value]))
+        else:
+            group.append(value)
+
+    def _remove(self, value) -> None:
+        key = self._keyFn(value)
+        group = self._dict.get(key)
+        if group is None or value not in group:
+            return
+        # the group list publishes the removal even when it empties and leaves the grouping
+        group.remove(value)
+        if not group:
+            del self[key]
+
+    def _reset(self, values) -> None:
+        groups = defaultdict(list)
+        for value in values:
+            groups[self._keyFn(value)].append(value)
+        with self.batch():
+            for key in [key for key in self._dict if key not in groups]:
+                self._dict[key].clear()
+                del self[key]
+            for key, members in groups.items():
+                group = self._dict.get(key)
+                if group is None:
+                    self.setdefault(key, ObservableList(members))
+                elif group._list != members:
+                    with group.batch():
+                        group.clear()
+                        group.extend(members)
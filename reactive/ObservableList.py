@@ -6,16 +6,67 @@ from reactive.shared.CollectionChange import CollectionChange
 
 class ObservableList(AbstractObservableCollection):
     
-    def __init__(self, items=None):
+    def __init__(self, items=None, **kwargs):
         self._list = items if items is not None else []
-        super().__init__()
+        super().__init__(**kwargs)
 
     # protocol implementations
     def __len__(self):
         return len(self._list)
 
     def __getitem__(self, index):
-        return ObservableList(list(self._list[index])) if isinstance(index, slice) else self._list[index]
+        """ return the element at index, or a read-only view of a slice (view.copy() copies it) """
+        if isinstance(index, slice):
+            from reactive.ObservableListSlice import ObservableListSlice
+            return ObservableListSlice(self, index)
+        return self._list[index]
+
+    def __setitem__(self, index, value):
+        """ assign to an element or a slice in one list operation and publish a Replace change carrying the start
+        index, the inserted items and the removed items (OldItems). An extended slice publishes a Batch of
+        single-element Replace changes """
+        with self.lock:
+            self.check_disposed()
+            if not isinstance(index, slice):
+                old = self._list[index]
+                self._list[index] = value
+                if self._observerCount:
+                    position = index if index >= 0 else len(self._list) + index
+                    self._onCollectionChanges(CollectionChange.Replace(self, (value,), position, (old,)))
+                return
+            start, stop, step = index.indices(len(self._list))
+            if step == 1:
+                self._replaceRange(start, stop, value)
+                return
+            value = self._materialize(value)
+            old = self._list[index]
+            self._list[index] = value
+            if self._observerCount and len(old):
+                self._onCollectionChanges(CollectionChange.Batch(self, tuple(
+                    CollectionChange.Replace(self, (new,), position, (previous,))
+                    for position, new, previous in zip(range(start, stop, step), value, old))))
+
+    def __delitem__(self, index):
+        """ delete an element or a slice in one list operation. A contiguous slice publishes a Replace change with
+        no inserted items, an extended slice a Batch of Remove changes """
+        with self.lock:
+            self.check_disposed()
+            if not isinstance(index, slice):
+                self.pop(index)
+                return
+            start, stop, step = index.indices(len(self._list))
+            if step == 1:
+                self._replaceRange(start, stop, ())
+                return
+            old = self._list[index]
+            del self._list[index]
+            if self._observerCount and len(old):
+                removed = list(zip(range(start, stop, step), old))
+                if step > 0:
+                    # removed from the back, so every index is still valid when its removal is applied
+                    removed.reverse()
+                self._onCollectionChanges(CollectionChange.Batch(self, tuple(
+                    CollectionChange.Remove(self, item, index=position) for position, item in removed)))
 
     def __eq__(self, other):
         if not isinstance(other, ObservableList):
@@ -28,7 +79,9 @@ class ObservableList(AbstractObservableCollection):
         return self._list != other._list
 
     def __reversed__(self):
-        return ObservableList(list(reversed(self._list)))
+        """ return a read-only view of the elements in reverse order """
+        from reactive.ObservableListSlice import ObservableListSlice
+        return ObservableListSlice(self, slice(None, None, -1))
 
     def __add__(self, other):
         if not isinstance(other, ObservableList):
@@ -50,21 +103,29 @@ class ObservableList(AbstractObservableCollection):
         with self.lock:
             self.check_disposed()
             self._list.append(item)
-            self._onCollectionChanges(CollectionChange.Add(self, item))
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Add(self, item, index=len(self._list) - 1))
 
     def extend(self, items: Iterable) -> None:
         """ extend the list by appending elements from the iterable and publishes the change notification """
         with self.lock:
             self.check_disposed()
+            items = self._materialize(items)
+            start = len(self._list)
             self._list.extend(items)
-            self._onCollectionChanges(CollectionChange.Extend(self, items))
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Extend(self, items, index=start))
 
     def insert(self, item, index) -> None:
         """ inserts the object in the specified index and publishes the change notification """
         with self.lock:
             self.check_disposed()
             self._list.insert(index, item)
-            self._onCollectionChanges(CollectionChange.Add(self, item))
+            if self._observerCount:
+                # list.insert clamps the index to the list bounds; publish where the item actually landed
+                size = len(self._list) - 1
+                position = min(index, size) if index >= 0 else max(size + index, 0)
+                self._onCollectionChanges(CollectionChange.Add(self, item, index=position))
 
     def remove(self, item) -> None:
         """ remove first occurrence of the item and publishes the change notification.
@@ -72,30 +133,49 @@ class ObservableList(AbstractObservableCollection):
         with self.lock:
             self.check_disposed()
             try:
-                self._list.remove(item)
-                self._onCollectionChanges(CollectionChange.Remove(self, item))
+                if self._observerCount:
+                    try:
+                        position = self._list.index(item)
+                    except ValueError:
+                        raise ValueError('list.remove(x): x not in list') from None
+                    del self._list[position]
+                    self._onCollectionChanges(CollectionChange.Remove(self, item, index=position))
+                else:
+                    self._list.remove(item)
             except ValueError as ve:
-                self._collectionChanges.on_error(ve)
+                self._onCollectionError(ve)
             except Exception as ex:
-                self._collectionChanges.on_error(ex)                
+                self._onCollectionError(ex)                
 
-    def pop(self) -> None:
-        """ remove the last index item from the list and publishes the change notification """
+    def pop(self, index=-1):
+        """ remove and return the item at index (default last) and publishes the change notification """
         with self.lock:
             self.check_disposed()
-            self._list.pop()
-            self._onCollectionChanges(CollectionChange.Remove(self))
+            item = self._list.pop(index)
+            if self._observerCount:
+                position = index if index >= 0 else len(self._list) + 1 + index
+                self._onCollectionChanges(CollectionChange.Remove(self, item, index=position))
+            return item
 
     def clear(self) -> None:
         """ remove all the items from the list and publishes the change notification """
         with self.lock:
             self.check_disposed()
-            self._list.clear()
-            self._onCollectionChanges(CollectionChange.Clear(self))
+            del self._list[:]
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def replace_range(self, start: int, stop: int, items: Iterable) -> None:
+        """ replace the items in [start, stop) with items (any number of them) in one list operation and publish a
+        single Replace change. Same as self[start:stop] = items """
+        with self.lock:
+            self.check_disposed()
+            start, stop, _ = slice(start, stop).indices(len(self._list))
+            self._replaceRange(start, stop, items)
 
     def count(self, element) -> int:
         """ return number of occurrences of value """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._list.count(element)
 
@@ -103,15 +183,70 @@ class ObservableList(AbstractObservableCollection):
         """ sort the list in ascending / descending order and publishes the change notification if required. """
         with self.lock:
             self.check_disposed()
+            publish = not suppress and self._observerCount
+            previous = tuple(self._list) if publish else None
             self._list.sort(key=key, reverse=reverse)
-            if not suppress:
-                self._onCollectionChanges(CollectionChange.IndexChanged(self, self._list))
+            if publish:
+                self._onCollectionChanges(CollectionChange.IndexChanged(self, self._list[:], previous))
+
+    def view(self, start: int = None, stop: int = None, step: int = None, live: bool = False):
+        """ return a read-only view of self[start:stop:step] that reads the list lazily. A live view re-applies the
+        slice as the list changes; otherwise it keeps the positions selected now """
+        from reactive.ObservableListSlice import ObservableListSlice
+        return ObservableListSlice(self, slice(start, stop, step), live)
+
+    @staticmethod
+    def typed(typecode: str, items: Iterable = None, **kwargs):
+        """ return an ObservableList storing homogeneous numbers unboxed in an array.array of the typecode """
+        from reactive.TypedObservableList import TypedObservableList
+        return TypedObservableList(typecode, items, **kwargs)
+
+    def where(self, predicate):
+        """ return a read-only live view of the elements that satisfy the predicate, kept in sync incrementally """
+        from reactive.ObservableListView import FilteredListView
+        return FilteredListView(self, predicate)
+
+    def select(self, selector):
+        """ return a read-only live view of selector applied to every element, kept in sync incrementally """
+        from reactive.ObservableListView import MappedListView
+        return MappedListView(self, selector)
+
+    def group_by(self, key_fn):
+        """ return a live ObservableDict of key_fn(element) -> ObservableList of the elements sharing that key """
+        from reactive.ObservableGrouping import ObservableGrouping
+        return ObservableGrouping(self, key_fn)
+
+    def _snapshot(self):
+        return self._list[:]
+
+    def _wrap(self, items):
+        """ a new list of this type holding items """
+        return ObservableList(items)
+
+    def _materialize(self, items: Iterable):
+        """ items as a sequence the backing list accepts """
+        if not isinstance(items, (list, tuple)):
+            # one-shot iterables would be exhausted before they reach the subscribers
+            items = list(items)
+        return items
+
+    def _replaceRange(self, start: int, stop: int, items: Iterable) -> None:
+        """ replaces the normalised range [start, stop) with items; the caller holds the lock """
+        items = self._materialize(items)
+        stop = max(start, stop)
+        if not self._observerCount:
+            self._list[start:stop] = items
+            return
+        old = self._list[start:stop]
+        self._list[start:stop] = items
+        if len(old) or len(items):
+            self._onCollectionChanges(CollectionChange.Replace(self, items, start, old))
 
     def dispose(self):
         """ Clears all the values from the list, unsubscribe all the subscribers and release resources """
         with self.lock:
             self.check_disposed()
             self._beginSuppressNotification()
-            self._list.clear()
+            del self._list[:]
             self._list = None
             super().dispose()
@@ -0,0 +1,84 @@
+from reactive.ObservableList import ObservableList
+
+
+class ObservableListSlice:
+    """ A lightweight read-only view of a slice of an ObservableList, returned by slicing and reversed(). Nothing is
+    copied and no subject or lock is created: elements are read from the source list when accessed.
+    By default the view covers the positions the slice selected when it was taken (positions the source no longer
+    has are left out); a live view re-applies the slice to the source on every access, so ol.view(-10, live=True)
+    is always the last ten elements. copy() returns the elements as a new list of the source's type. """
+
+    def __init__(self, source: ObservableList, index, live: bool = False):
+        # index is a slice of the source, or for fixed views a range of its positions
+        self._source = source
+        self._slice = index
+        self.live = live
+        if not live and isinstance(index, slice):
+            self._slice = range(len(source._list))[index]
+
+    # protocol implementations
+    def __len__(self):
+        return len(self._positions())
+
+    def __getitem__(self, index):
+        positions = self._positions()
+        if isinstance(index, slice):
+            return ObservableListSlice(self._source, positions[index])
+        return self._source._list[positions[index]]
+
+    def __iter__(self):
+        return map(self._source._list.__getitem__, self._positions())
+
+    def __reversed__(self):
+        return ObservableListSlice(self._source, self._positions()[::-1])
+
+    def __contains__(self, item):
+        return item in iter(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, (ObservableListSlice, ObservableList)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        if not isinstance(other, (ObservableListSlice, ObservableList)):
+            return NotImplemented
+        return list(self) != list(other)
+
+    def __add__(self, other):
+        return self.copy() + other
+
+    def __radd__(self, other):
+        return other + self.copy()
+
+    def index(self, item):
+        for position, element in enumerate(self):
+            if element is item or element == item:
+                return position
+        raise ValueError('{!r} is not in list'.format(item))
+
+    def count(self, element) -> int:
+        """ return number of occurrences of value """
+        return sum(1 for item in self if item is element or item == element)
+
+    def copy(self):
+        """ return the elements as a new ObservableList (of the source's type), copied in one slice operation """
+        source = self._source
+        with source.read_lock:
+            source.check_disposed()
+            positions = self._positions()
+            # a range stepping down to -1 stops past the start, which a slice spells as None
+            stop = positions.stop if positions.stop >= 0 else None
+            return source._wrap(source._list[positions.start:stop:positions.step] if len(positions) else [])
+
+    # internal methods
+    def _positions(self) -> range:
+        """ the source positions the view currently covers """
+        size = len(self._source._list)
+        if self.live:
+            return range(size)[self._slice]
+        positions = self._slice
+        if positions.step > 0:
+            return positions[:len(range(positions.start, size, positions.step))]
+        # positions beyond the end of a shrunken source are at the front of a descending range
+        return positions[len(range(positions.start, size - 1, positions.step)):]
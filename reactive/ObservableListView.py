@@ -0,0 +1,328 @@
+from abc import abstractmethod
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableListView(AbstractObservableCollection):
+    """ A read-only list kept in sync with a source ObservableList (or another view) from its positional change
+    events, publishing positional changes of its own. Each source change is applied in time proportional to the
+    number of elements it touches; reorders (sort) and changes without an index are re-evaluated in full.
+    Views are exact when the source delivers its notifications immediately (the default dispatch mode). """
+
+    def __init__(self, source):
+        self._source = source
+        self._list = []
+        super().__init__()
+        with source.lock:
+            source.check_disposed()
+            self._reset(list(source))
+            self._subscription = source.when_collection_changes() \
+                .subscribe(self._onSourceChanges, self._onCollectionError)
+
+    # protocol implementations
+    def __len__(self):
+        return len(self._list)
+
+    def __getitem__(self, index):
+        return list(self._list[index]) if isinstance(index, slice) else self._list[index]
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __contains__(self, item):
+        return item in self._list
+
+    def __eq__(self, other):
+        if not isinstance(other, (ObservableListView, ObservableList)):
+            return NotImplemented
+        return self._list == other._list
+
+    def __ne__(self, other):
+        if not isinstance(other, (ObservableListView, ObservableList)):
+            return NotImplemented
+        return self._list != other._list
+
+    def index(self, item):
+        return self._list.index(item)
+
+    def count(self, element) -> int:
+        """ return number of occurrences of value """
+        with self.read_lock:
+            self.check_disposed()
+            return self._list.count(element)
+
+    def where(self, predicate):
+        """ return a live view of the elements of this view that satisfy the predicate """
+        return FilteredListView(self, predicate)
+
+    def select(self, selector):
+        """ return a live view of selector applied to every element of this view """
+        return MappedListView(self, selector)
+
+    def dispose(self):
+        """ Detaches the view from its source, unsubscribe all the subscribers and release resources """
+        with self.lock:
+            self.check_disposed()
+            self._subscription.dispose()
+            self._beginSuppressNotification()
+            self._list = None
+            super().dispose()
+
+    # source change handling
+    def _onSourceChanges(self, change: CollectionChange) -> None:
+        with self.lock:
+            action = change.Action
+            if action is CollectionChangeAction.BATCH:
+                with self.batch():
+                    for item in change.Items:
+                        self._onSourceChanges(item)
+            elif action is CollectionChangeAction.CLEAR:
+                self._clear()
+            elif change.Index is None or action is CollectionChangeAction.INDEX:
+                self._reset(list(self._source))
+            elif action is CollectionChangeAction.ADD:
+                self._insert(change.Index, (change.Items,), True)
+            elif action is CollectionChangeAction.EXTEND:
+                self._insert(change.Index, change.Items, False)
+            elif action is CollectionChangeAction.REMOVE:
+                self._delete(change.Index)
+            elif action is CollectionChangeAction.REPLACE and change.OldItems is not None:
+                self._replace(change.Index, len(change.OldItems), change.Items)
+            else:
+                self._reset(list(self._source))
+
+    @abstractmethod
+    def _insert(self, index: int, items, single: bool) -> None:
+        """ applies items inserted into the source at index """
+
+    @abstractmethod
+    def _delete(self, index: int) -> None:
+        """ applies the removal of the source element at index """
+
+    @abstractmethod
+    def _replace(self, index: int, count: int, items) -> None:
+        """ applies the replacement of count source elements at index with items """
+
+    @abstractmethod
+    def _reset(self, items: list) -> None:
+        """ re-evaluates the whole view from the source elements """
+
+    def _clear(self) -> None:
+        self._list.clear()
+        if self._observerCount:
+            self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def _publishInserted(self, index: int, values: list, single: bool) -> None:
+        if single:
+            self._onCollectionChanges(CollectionChange.Add(self, values[0], index=index))
+        else:
+            self._onCollectionChanges(CollectionChange.Extend(self, values, index=index))
+
+    def _publishReplaced(self, index: int, values: list, old: list) -> None:
+        if self._observerCount and (old or values):
+            self._onCollectionChanges(CollectionChange.Replace(self, values, index, old))
+
+    def _publishReset(self, previous: tuple) -> None:
+        if self._observerCount:
+            self._onCollectionChanges(CollectionChange.IndexChanged(self, self._list[:], previous))
+
+
+class MappedListView(ObservableListView):
+    """ A live view holding selector(x) for every element x of the source, position for position """
+
+    def __init__(self, source, selector):
+        self._selector = selector
+        super().__init__(source)
+
+    def _insert(self, index: int, items, single: bool) -> None:
+        values = [self._selector(item) for item in items]
+        self._list[index:index] = values
+        if self._observerCount:
+            self._publishInserted(index, values, single)
+
+    def _delete(self, index: int) -> None:
+        value = self._list.pop(index)
+        if self._observerCount:
+            self._onCollectionChanges(CollectionChange.Remove(self, value, index=index))
+
+    def _replace(self, index: int, count: int, items) -> None:
+        values = [self._selector(item) for item in items]
+        old = self._list[index:index + count]
+        self._list[index:index + count] = values
+        self._publishReplaced(index, values, old)
+
+    def _reset(self, items: list) -> None:
+        previous = tuple(self._list)
+        self._list[:] = [self._selector(item) for item in items]
+        self._publishReset(previous)
+
+
+class FilteredListView(ObservableListView):
+    """ A live view holding the elements of the source that satisfy the predicate, in source order.
+    A membership mask over the source positions maps source indexes to view indexes, so the predicate only runs
+    for changed elements; the mask is a _MembershipMask, whose rank queries and updates take O(log n). """
+
+    def __init__(self, source, predicate):
+        self._predicate = predicate
+        self._mask = _MembershipMask()
+        super().__init__(source)
+
+    def _insert(self, index: int, items, single: bool) -> None:
+        flags = [bool(self._predicate(item)) for item in items]
+        self._mask.insert(index, flags)
+        values = [item for item, keep in zip(items, flags) if keep]
+        if values:
+            position = self._mask.rank(index)
+            self._list[position:position] = values
+            if self._observerCount:
+                self._publishInserted(position, values, single)
+
+    def _delete(self, index: int) -> None:
+        if self._mask.pop(index):
+            position = self._mask.rank(index)
+            value = self._list.pop(position)
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Remove(self, value, index=position))
+
+    def _replace(self, index: int, count: int, items) -> None:
+        flags = [bool(self._predicate(item)) for item in items]
+        position = self._mask.rank(index)
+        removed = self._mask.delete(index, count)
+        self._mask.insert(index, flags)
+        values = [item for item, keep in zip(items, flags) if keep]
+        old = self._list[position:position + removed]
+        self._list[position:position + removed] = values
+        self._publishReplaced(position, values, old)
+
+    def _clear(self) -> None:
+        self._mask.reset(())
+        super()._clear()
+
+    def _reset(self, items: list) -> None:
+        previous = tuple(self._list)
+        flags = [bool(self._predicate(item)) for item in items]
+        self._mask.reset(flags)
+        self._list[:] = [item for item, keep in zip(items, flags) if keep]
+        self._publishReset(previous)
+
+
+class _MembershipMask:
+    """ The per-position flags of a FilteredListView. The flags are kept in blocks of at most 2 * _LOAD, with Fenwick
+    trees over the block sizes and the number of set flags per block: finding a position's block, counting the set
+    flags before it (rank) and updating a block take O(log n) plus work bounded by the block size. The trees are
+    rebuilt in O(n / _LOAD) only when blocks are split or dropped. """
+
+    _LOAD = 512
+
+    def __init__(self):
+        self.reset(())
+
+    def __len__(self):
+        return _prefix(self._sizes, len(self._blocks))
+
+    def reset(self, flags) -> None:
+        flags = list(flags)
+        load = self._LOAD
+        self._blocks = [flags[start:start + load] for start in range(0, len(flags), load)] or [[]]
+        self._rebuild()
+
+    def rank(self, index: int) -> int:
+        """ number of set flags before index """
+        block, offset = self._locate(index)
+        return _prefix(self._counts, block) + self._blocks[block][:offset].count(True)
+
+    def insert(self, index: int, flags: list) -> None:
+        if not flags:
+            return
+        block, offset = self._locate(index)
+        segment = self._blocks[block]
+        segment[offset:offset] = flags
+        if len(segment) > 2 * self._LOAD:
+            load = self._LOAD
+            self._blocks[block:block + 1] = [segment[start:start + load]
+                                             for start in range(0, len(segment), load)]
+            self._rebuild()
+        else:
+            _add(self._sizes, block, len(flags))
+            _add(self._counts, block, flags.count(True))
+
+    def pop(self, index: int) -> bool:
+        """ removes and returns the flag at index """
+        block, offset = self._locate(index)
+        flag = self._blocks[block].pop(offset)
+        self._shrunk(block, 1, flag)
+        return flag
+
+    def delete(self, index: int, count: int) -> int:
+        """ removes count flags from index on and returns how many of them were set """
+        removed = 0
+        while count > 0:
+            block, offset = self._locate(index)
+            segment = self._blocks[block]
+            taken = min(count, len(segment) - offset)
+            if taken <= 0:
+                break
+            ones = segment[offset:offset + taken].count(True)
+            del segment[offset:offset + taken]
+            self._shrunk(block, taken, ones)
+            removed += ones
+            count -= taken
+        return removed
+
+    # internal methods
+    def _locate(self, index: int) -> tuple:
+        """ (block, offset in the block) of position index; the end of the mask is the end of the last block """
+        tree = self._sizes
+        block, remaining, bit = 0, index, self._topBit
+        while bit:
+            candidate = block + bit
+            if candidate < len(tree) and tree[candidate] <= remaining:
+                block = candidate
+                remaining -= tree[candidate]
+            bit >>= 1
+        if block == len(self._blocks):
+            block -= 1
+            remaining = len(self._blocks[block])
+        return block, remaining
+
+    def _shrunk(self, block: int, size: int, ones: int) -> None:
+        if not self._blocks[block] and len(self._blocks) > 1:
+            del self._blocks[block]
+            self._rebuild()
+        else:
+            _add(self._sizes, block, -size)
+            _add(self._counts, block, -ones)
+
+    def _rebuild(self) -> None:
+        self._sizes = _fenwick([len(flags) for flags in self._blocks])
+        self._counts = _fenwick([flags.count(True) for flags in self._blocks])
+        self._topBit = 1 << (len(self._blocks).bit_length() - 1) if self._blocks else 0
+
+
+def _fenwick(values: list) -> list:
+    """ a 1-based Fenwick tree over values, built in linear time """
+    tree = [0] + values
+    for index in range(1, len(tree)):
+        parent = index + (index & -index)
+        if parent < len(tree):
+            tree[parent] += tree[index]
+    return tree
+
+
+def _add(tree: list, index: int, delta: int) -> None:
+    index += 1
+    while index < len(tree):
+        tree[index] += delta
+        index += index & -index
+
+
+def _prefix(tree: list, count: int) -> int:
+    """ sum of the first count values """
+    total = 0
+    while count:
+        total += tree[count]
+        count -= count & -count
+    return total
@@ -2,13 +2,14 @@ from collections import Iterable
 
 from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
 from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
 
 
 class ObservableSet(AbstractObservableCollection):
 
-    def __init__(self, items: Iterable=None):
+    def __init__(self, items: Iterable=None, **kwargs):
         self._set = set() if items is None else set(items)
-        super().__init__()
+        super().__init__(**kwargs)
 
     # protocol / magic method implementations
     def __len__(self):
@@ -32,18 +33,26 @@ class ObservableSet(AbstractObservableCollection):
 
     # set methods
     def add(self, element):
-        """ Add an element to an ObservableSet. Publishes change notification """
+        """ Add an element to an ObservableSet. Publishes change notification if the element was not a member """
         with self.lock:
             self.check_disposed()
-            self._set.add(element)
-            self._onCollectionChanges(CollectionChange.Add(self, element))
+            if element not in self._set:
+                self._set.add(element)
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Add(self, element))
 
     def update(self, items: Iterable) -> None:
         """ Update an ObservableSet with the union of itself and others. Publishes change notification """
         with self.lock:
             self.check_disposed()
-            self._set.update(items)
-            self._onCollectionChanges(CollectionChange.Extend(self, items))
+            if self._observerCount:
+                if not isinstance(items, (set, frozenset, list, tuple, ObservableSet)):
+                    # one-shot iterables would be exhausted before they reach the subscribers
+                    items = list(items)
+                self._set.update(items)
+                self._onCollectionChanges(CollectionChange.Extend(self, items))
+            else:
+                self._set.update(items)
 
     def discard(self, element) -> None:
         """ Remove an element from a set if it is a member. Publishes change notification if an item is removed
@@ -52,7 +61,8 @@ class ObservableSet(AbstractObservableCollection):
             self.check_disposed()
             if element in self._set:
                 self._set.discard(element)
-                self._onCollectionChanges(CollectionChange.Remove(self, element))
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, element))
 
     def remove(self, element) -> None:
         """ Remove an element from an ObservableSet; it must be a member. Publishes change notifications
@@ -61,9 +71,10 @@ class ObservableSet(AbstractObservableCollection):
             self.check_disposed()
             try:
                 self._set.remove(element)
-                self._onCollectionChanges(CollectionChange.Remove(self, element))
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, element))
             except KeyError as ke:
-                self._collectionChanges.on_error(ke)
+                self._onCollectionError(ke)
 
     def pop(self):
         """ Remove and return an arbitrary ObservableSet element. Publishes change notifications
@@ -72,31 +83,43 @@ class ObservableSet(AbstractObservableCollection):
             self.check_disposed()
             try:
                 out = self._set.pop()
-                self._onCollectionChanges(CollectionChange.Remove(self, out))
+                if self._observerCount:
+                    self._onCollectionChanges(CollectionChange.Remove(self, out))
                 return out
             except KeyError as ke:
-                self._collectionChanges.on_error(ke)
+                self._onCollectionError(ke)
 
     def clear(self):
         """ Remove all elements from this ObservableSet. Publishes change notifications """
         with self.lock:
             self.check_disposed()
             self._set.clear()
-            self._onCollectionChanges(CollectionChange.Clear(self))
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
 
     def difference_update(self, *args) -> None:
-        """ Remove all elements of another ObservableSet from this ObservableSet. Publishes change notifications """
+        """ Remove all elements of another ObservableSet from this ObservableSet. Publishes change notifications
+        whose OldItems holds the removed members """
         with self.lock:
             self.check_disposed()
-            self._set.difference_update(*args)
-            self._onCollectionChanges(CollectionChange.Extend(self, self))  # Need better name...
+            if self._observerCount:
+                removed = self._set.difference(self._set.difference(*args))
+                self._set.difference_update(removed)
+                self._onCollectionChanges(CollectionChange.Extend(self, self, old_items=removed))
+            else:
+                self._set.difference_update(*args)
 
     def intersection_update(self, *args) -> None:
-        """ Update an ObservableSet with the intersection of itself and another. Publishes change notifications """
+        """ Update an ObservableSet with the intersection of itself and another. Publishes change notifications
+        whose OldItems holds the removed members """
         with self.lock:
             self.check_disposed()
-            self._set.intersection_update(*args)
-            self._onCollectionChanges(CollectionChange.Extend(self, self))
+            if self._observerCount:
+                removed = self._set.difference(self._set.intersection(*args))
+                self._set.difference_update(removed)
+                self._onCollectionChanges(CollectionChange.Extend(self, self, old_items=removed))
+            else:
+                self._set.intersection_update(*args)
 
     def symmetric_difference_update(self, *args) -> None:
         """ Update an ObservableSet with the symmetric difference of itself and another.
@@ -104,12 +127,13 @@ class ObservableSet(AbstractObservableCollection):
         with self.lock:
             self.check_disposed()
             self._set.symmetric_difference_update(*args)
-            self._onCollectionChanges(CollectionChange.Extend(self, self))
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Extend(self, self))
 
     def difference(self, *args):
         """ Return the difference of two or more ObservableSets as a new ObservableSet.
         *Does not publish change notifications* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             out = self._set.difference(*args)
             return ObservableSet(out)
@@ -117,43 +141,76 @@ class ObservableSet(AbstractObservableCollection):
     def intersection(self, *args):
         """ Return the intersection of two ObservableSets as a new ObservableSet.
         *Does not publish change notifications* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return ObservableSet(self._set.intersection(*args))
 
     def symmetric_difference(self, *args):
         """ Return the symmetric difference of two ObservableSets as a new ObservableSet.
         *Does not publish change notifications* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return ObservableSet(self._set.symmetric_difference(*args))
 
     def union(self, *args):
         """ Return the union of ObservableSets as a new ObservableSet. *Does not publish change notification* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return ObservableSet(self._set.union(*args))
 
+    def union_view(self, other):
+        """ Return a read-only live view of the union of this and another ObservableSet, kept in sync from the
+        changes of both """
+        from reactive.ObservableSetView import ObservableSetView
+        return ObservableSetView(self, other, ObservableSetView.UNION)
+
+    def intersection_view(self, other):
+        """ Return a read-only live view of the intersection of this and another ObservableSet """
+        from reactive.ObservableSetView import ObservableSetView
+        return ObservableSetView(self, other, ObservableSetView.INTERSECTION)
+
+    def difference_view(self, other):
+        """ Return a read-only live view of the members of this ObservableSet that are not in other """
+        from reactive.ObservableSetView import ObservableSetView
+        return ObservableSetView(self, other, ObservableSetView.DIFFERENCE)
+
+    def symmetric_difference_view(self, other):
+        """ Return a read-only live view of the members that are in exactly one of this and another ObservableSet """
+        from reactive.ObservableSetView import ObservableSetView
+        return ObservableSetView(self, other, ObservableSetView.SYMMETRIC_DIFFERENCE)
+
     def isdisjoint(self, *args) -> bool:
         """ Return True if two ObservableSets have a null intersection. *Does not publish change notification* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._set.isdisjoint(*args)
 
     def issubset(self, *args) -> bool:
         """ Report whether another ObservableSet contains this ObservableSet.
         *Does not publish change notifications* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._set.issubset(*args)
 
     def issuperset(self, *args) -> bool:
         """ Report whether this ObservableSet contains another ObservableSet.
         *Does not publish change notifications* """
-        with self.lock:
+        with self.read_lock:
             self.check_disposed()
             return self._set.issuperset(*args)
 
+    def _valueChanges(self, change: CollectionChange):
+        if change.Action is CollectionChangeAction.EXTEND:
+            # difference_update / intersection_update only remove and say what; update() and
+            # symmetric_difference_update do not say which members actually changed
+            if change.Items is self and change.OldItems is not None:
+                return (), change.OldItems
+            return None
+        return super()._valueChanges(change)
+
+    def _snapshot(self):
+        return set(self._set)
+
     def dispose(self):
         """ Clears all the values from the set, unsubscribe all the subscribers and release resources """
         with self.lock:
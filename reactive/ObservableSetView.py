@@ -0,0 +1,135 @@
+from itertools import chain
+from operator import and_, ne, or_
+
+from reactive.ObservableSet import ObservableSet
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableSetView(AbstractObservableCollection):
+    """ A read-only set holding the result of a set operation over two ObservableSets (or views), kept in sync
+    from the changes of both operands. Only the elements a change touched are re-tested against the operation, and
+    every element entering or leaving the view is published as an Add or Remove. Changes that do not say which
+    elements they touched (clear, symmetric_difference_update) re-evaluate the view in full. """
+
+    UNION = staticmethod(or_)
+    INTERSECTION = staticmethod(and_)
+    DIFFERENCE = staticmethod(lambda in_left, in_right: in_left and not in_right)
+    SYMMETRIC_DIFFERENCE = staticmethod(ne)
+
+    def __init__(self, left, right, operation):
+        self._left = left
+        self._right = right
+        self._operation = operation
+        self._set = set()
+        super().__init__()
+        # the operand locks are taken in a fixed order, so views built over the same sets in the opposite order (or
+        # on other threads) cannot deadlock
+        first, second = sorted((left, right), key=id)
+        with first.lock, second.lock:
+            left.check_disposed()
+            right.check_disposed()
+            self._set = {element for element in chain(left, right) if self._test(element)}
+            self._subscriptions = [operand.when_collection_changes()
+                                   .subscribe(self._onOperandChanges, self._onCollectionError)
+                                   for operand in (left, right)]
+
+    # protocol implementations
+    def __len__(self):
+        return len(self._set)
+
+    def __contains__(self, item):
+        return item in self._set
+
+    def __iter__(self):
+        return iter(self._set)
+
+    def __eq__(self, other):
+        if not isinstance(other, (ObservableSetView, ObservableSet)):
+            return NotImplemented
+        return self._set == other._set
+
+    def __ne__(self, other):
+        if not isinstance(other, (ObservableSetView, ObservableSet)):
+            return NotImplemented
+        return self._set != other._set
+
+    def copy(self) -> ObservableSet:
+        """ return a detached ObservableSet holding the current members of the view """
+        with self.read_lock:
+            self.check_disposed()
+            return ObservableSet(self._set)
+
+    def union_view(self, other):
+        return ObservableSetView(self, other, ObservableSetView.UNION)
+
+    def intersection_view(self, other):
+        return ObservableSetView(self, other, ObservableSetView.INTERSECTION)
+
+    def difference_view(self, other):
+        return ObservableSetView(self, other, ObservableSetView.DIFFERENCE)
+
+    def symmetric_difference_view(self, other):
+        return ObservableSetView(self, other, ObservableSetView.SYMMETRIC_DIFFERENCE)
+
+    def dispose(self):
+        """ Detaches the view from its operands, unsubscribe all the subscribers and release resources """
+        with self.lock:
+            self.check_disposed()
+            for subscription in self._subscriptions:
+                subscription.dispose()
+            self._beginSuppressNotification()
+            self._set = None
+            super().dispose()
+
+    # operand change handling
+    def _test(self, element) -> bool:
+        return self._operation(element in self._left, element in self._right)
+
+    def _onOperandChanges(self, change: CollectionChange) -> None:
+        with self.lock:
+            if self.is_disposed:
+                return
+            candidates = self._candidates(change)
+            if candidates is None:
+                candidates = chain(self._set, self._left, self._right)
+            self._refresh(list(candidates))
+
+    def _candidates(self, change: CollectionChange):
+        """ the elements whose membership the change may have altered, or None when it does not say """
+        action = change.Action
+        if action is CollectionChangeAction.ADD or action is CollectionChangeAction.REMOVE:
+            return change.Items,
+        if action is CollectionChangeAction.EXTEND:
+            if change.Items is not change.Source:
+                return change.Items
+            return change.OldItems
+        if action is CollectionChangeAction.BATCH:
+            candidates = []
+            for item in change.Items:
+                touched = self._candidates(item)
+                if touched is None:
+                    return None
+                candidates.extend(touched)
+            return candidates
+        return None
+
+    def _refresh(self, candidates: list) -> None:
+        members = self._set
+        changes = []
+        for element in candidates:
+            if self._test(element):
+                if element not in members:
+                    members.add(element)
+                    changes.append(CollectionChange.Add(self, element))
+            elif element in members:
+                members.discard(element)
+                changes.append(CollectionChange.Remove(self, element))
+        if changes and self._observerCount:
+            if len(changes) == 1:
+                self._onCollectionChanges(changes[0])
+            else:
+                with self.batch():
+                    for change in changes:
+                        self._onCollectionChanges(change)
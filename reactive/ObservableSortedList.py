@@ -0,0 +1,170 @@
+from bisect import bisect_left, bisect_right
+from collections import Iterable
+
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+
+
+class ObservableSortedList(AbstractObservableCollection):
+    """ A list that keeps its items ordered by key (the items themselves by default). Items are placed by binary
+    search, so lookups are O(log n) and every insertion or removal publishes a positional Add / Remove event
+    carrying its index instead of a reorder of the whole list. """
+
+    def __init__(self, items: Iterable = None, key=None, **kwargs):
+        self._key = key
+        self._list = sorted(items, key=key) if items is not None else []
+        # without a key function the items are their own keys and share the same list
+        self._keys = [key(item) for item in self._list] if key is not None else self._list
+        super().__init__(**kwargs)
+
+    # protocol implementations
+    def __len__(self):
+        return len(self._list)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ObservableSortedList(self._list[index], key=self._key)
+        return self._list[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, ObservableSortedList):
+            return NotImplemented
+        return self._list == other._list
+
+    def __ne__(self, other):
+        if not isinstance(other, ObservableSortedList):
+            return NotImplemented
+        return self._list != other._list
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __contains__(self, item):
+        return self._find(item) >= 0
+
+    @property
+    def key(self):
+        return self._key
+
+    def index(self, item) -> int:
+        """ return the index of the first occurrence of item, raises ValueError if it is not present """
+        position = self._find(item)
+        if position < 0:
+            raise ValueError('{!r} is not in list'.format(item))
+        return position
+
+    def count(self, item) -> int:
+        """ return number of occurrences of value """
+        with self.read_lock:
+            self.check_disposed()
+            position = self._find(item)
+            if position < 0:
+                return 0
+            end = bisect_right(self._keys, self._keyOf(item), position)
+            return self._list[position:end].count(item)
+
+    def bisect_left(self, item) -> int:
+        """ return the index item would be inserted at, before any equal keys """
+        return bisect_left(self._keys, self._keyOf(item))
+
+    def bisect_right(self, item) -> int:
+        """ return the index item would be inserted at, after any equal keys """
+        return bisect_right(self._keys, self._keyOf(item))
+
+    # mutations
+    def add(self, item) -> None:
+        """ insert the item at its sorted position (after equal keys) and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            self._insert(item)
+
+    def update(self, items: Iterable) -> None:
+        """ insert every item at its sorted position. Publishes a single Batch of positional Add events """
+        with self.lock:
+            self.check_disposed()
+            with self.batch():
+                for item in items:
+                    self._insert(item)
+
+    def remove(self, item) -> None:
+        """ remove first occurrence of the item and publishes the change notification.
+        Publishes ValueError to on_error if the item is not present. """
+        with self.lock:
+            self.check_disposed()
+            position = self._find(item)
+            if position < 0:
+                self._onCollectionError(ValueError('{!r} is not in list'.format(item)))
+            else:
+                self._delete(position)
+
+    def discard(self, item) -> None:
+        """ remove first occurrence of the item if present and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            position = self._find(item)
+            if position >= 0:
+                self._delete(position)
+
+    def pop(self, index=-1):
+        """ remove and return the item at index (default last) and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            position = index if index >= 0 else len(self._list) + index
+            if not 0 <= position < len(self._list):
+                raise IndexError('pop index out of range')
+            return self._delete(position)
+
+    def clear(self) -> None:
+        """ remove all the items from the list and publishes the change notification """
+        with self.lock:
+            self.check_disposed()
+            self._list.clear()
+            if self._key is not None:
+                self._keys.clear()
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def dispose(self):
+        """ Clears all the values from the list, unsubscribe all the subscribers and release resources """
+        with self.lock:
+            self.check_disposed()
+            self._beginSuppressNotification()
+            self._list = None
+            self._keys = None
+            super().dispose()
+
+    # internal methods
+    def _keyOf(self, item):
+        return item if self._key is None else self._key(item)
+
+    def _find(self, item) -> int:
+        """ index of the first occurrence of item, or -1 """
+        key = self._keyOf(item)
+        keys = self._keys
+        position = bisect_left(keys, key)
+        # items with equal keys are not necessarily equal, walk the run of equal keys
+        while position < len(keys) and not (key < keys[position]):
+            if self._list[position] == item:
+                return position
+            position += 1
+        return -1
+
+    def _insert(self, item) -> None:
+        key = self._keyOf(item)
+        position = bisect_right(self._keys, key)
+        self._list.insert(position, item)
+        if self._key is not None:
+            self._keys.insert(position, key)
+        if self._observerCount:
+            self._onCollectionChanges(CollectionChange.Add(self, item, index=position))
+
+    def _delete(self, position: int):
+        item = self._list.pop(position)
+        if self._key is not None:
+            del self._keys[position]
+        if self._observerCount:
+            self._onCollectionChanges(CollectionChange.Remove(self, item, index=position))
+        return item
@@ -0,0 +1,420 @@
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+
+from rx import Observable
+from rx.core import ObservableBase, Disposable
+
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+_MAGIC = b'OCSD'
+_HEADER = struct.Struct('<4sIII16sQQ')     # magic, capacity, key_size, slot size, value format, count, version
+_COUNT_OFFSET = 32
+_VERSION_OFFSET = 40
+_U64 = struct.Struct('<Q')
+_EMPTY, _STR_KEY, _BYTES_KEY, _DELETED = range(4)
+
+
+class SharedObservableDict(AbstractObservableCollection):
+    """ A dictionary kept in a multiprocessing.shared_memory block (Python 3.8+) so that other processes can read
+    it in place instead of holding copies. The table has a fixed schema: up to capacity keys (str or bytes of at
+    most key_size encoded bytes) with values packed by the struct format value_format, in an open-addressing hash
+    table with linear probing and at least twice as many slots as keys. Deleted keys leave tombstones; once keys and
+    tombstones fill three quarters of the slots the table is rehashed in place, so a lookup always ends at an empty
+    slot after a short probe.
+    The creating process owns the dictionary: it alone writes, and its writes are published through
+    when_collection_changes() as with ObservableDict. Other processes attach(name) to it read-only. Every write is
+    bracketed by a version counter (a seqlock): readers retry while it is odd or when it moved during the read, so
+    they never see a half written entry, and they can poll the counter (version / when_version_changes) to learn
+    that the dictionary changed. """
+
+    def __init__(self, name: str = None, capacity: int = 1024, key_size: int = 32, value_format: str = 'd',
+                 **kwargs):
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+        slot = self._slotStruct(key_size, value_format)
+        size = _HEADER.size + self._slotCount(capacity) * slot.size
+        self._memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _owned.add(self._memory.name)
+        _HEADER.pack_into(self._memory.buf, 0, _MAGIC, capacity, key_size, slot.size, value_format.encode(), 0, 0)
+        self._setup(slot, capacity, key_size, owner=True)
+        super().__init__(**kwargs)
+
+    @classmethod
+    def attach(cls, name: str, **kwargs):
+        """ return a read-only view of the SharedObservableDict another process created under name """
+        self = cls.__new__(cls)
+        if sys.version_info >= (3, 13):
+            self._memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+            # attaching registers the block with this process's resource tracker, which would destroy it when the
+            # process exits. The owner's process (and its forked children) share the owner's tracker, whose
+            # registration must stay.
+            if os.name == 'posix' and self._memory.name not in _owned:
+                resource_tracker.unregister(self._memory._name, 'shared_memory')
+        magic, capacity, key_size, _, value_format, _, _ = _HEADER.unpack_from(self._memory.buf, 0)
+        if magic != _MAGIC:
+            self._memory.close()
+            raise ValueError('{} is not a SharedObservableDict'.format(name))
+        self._setup(cls._slotStruct(key_size, value_format.rstrip(b'\0').decode()), capacity, key_size, owner=False)
+        AbstractObservableCollection.__init__(self, **kwargs)
+        return self
+
+    # protocol / magic method implementation
+    def __eq__(self, other):
+        if not isinstance(other, AbstractObservableCollection) or not hasattr(other, 'items'):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        if not isinstance(other, AbstractObservableCollection) or not hasattr(other, 'items'):
+            return NotImplemented
+        return dict(self.items()) != dict(other.items())
+
+    def __contains__(self, key):
+        return self._read(lambda: self._find(self._encodeKey(key))[1] is not None)
+
+    def __len__(self):
+        return self._read(lambda: _U64.unpack_from(self._buf, _COUNT_OFFSET)[0])
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __getitem__(self, key):
+        encoded = self._encodeKey(key)
+        value = self._read(lambda: self._lookup(encoded))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """ set key to value. Publishes Add for a new key, or Replace with the old value in OldItems """
+        with self.lock:
+            self._checkWritable()
+            old = self._store(*self._pack(key, value))
+            if self._observerCount:
+                if old is _MISSING:
+                    self._onCollectionChanges(CollectionChange.Add(self, value, key))
+                else:
+                    self._onCollectionChanges(CollectionChange.Replace(self, value, old_items=old, key=key))
+
+    def __delitem__(self, key):
+        with self.lock:
+            self._checkWritable()
+            old = self._erase(key)
+            if old is _MISSING:
+                self._onCollectionError(KeyError(key))
+            elif self._observerCount:
+                self._onCollectionChanges(CollectionChange.Remove(self, key, key, old_items=old))
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def version(self) -> int:
+        """ the change counter, advanced by two for every write; odd while a write is in progress """
+        return _U64.unpack_from(self._buf, _VERSION_OFFSET)[0]
+
+    # dict methods
+    def get(self, key, value=None):
+        """ return the value of key. If key does not exists return default value(None) """
+        encoded = self._encodeKey(key)
+        found = self._read(lambda: self._lookup(encoded))
+        return value if found is _MISSING else found
+
+    def keys(self) -> list:
+        """ return a consistent list of the keys """
+        return [key for key, _ in self.items()]
+
+    def values(self) -> list:
+        """ return a consistent list of the values """
+        return [value for _, value in self.items()]
+
+    def items(self) -> list:
+        """ return a consistent list of the (key, value) pairs """
+        return self._read(self._items)
+
+    def update(self, other) -> None:
+        """ update the dictionary with the (key, value) pairs of other and publish an Extend event whose OldItems
+        maps every overwritten key to its old value """
+        with self.lock:
+            self._checkWritable()
+            if not hasattr(other, 'keys'):
+                other = dict(other)
+            # every key and value is packed, and the room for the new keys checked, before anything is written, so a
+            # bad pair leaves the dictionary unchanged
+            records = [(key, self._pack(key, other[key])) for key in other.keys()]
+            added = sum(1 for _, (encoded, _) in records if self._find(encoded)[1] is None)
+            if _U64.unpack_from(self._buf, _COUNT_OFFSET)[0] + added > self._capacity:
+                raise ValueError('SharedObservableDict is full ({} keys)'.format(self._capacity))
+            replaced = {}
+            for key, (encoded, record) in records:
+                old = self._store(encoded, record)
+                if old is not _MISSING:
+                    replaced[key] = old
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Extend(self, other, old_items=replaced))
+
+    def pop(self, key, *default):
+        """ remove the key and return its value, or default if given and the key is not found. Publishes Remove
+        event upon removal or publishes KeyError to on_error if the key is not found """
+        with self.lock:
+            self._checkWritable()
+            old = self._erase(key)
+            if old is _MISSING:
+                if default:
+                    return default[0]
+                self._onCollectionError(KeyError(key))
+                return None
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Remove(self, old, key, old_items=old))
+            return old
+
+    def setdefault(self, key, default_value):
+        """ return the value of key, inserting default_value first if the key is not present """
+        with self.lock:
+            self._checkWritable()
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            self[key] = default_value
+            return default_value
+
+    def clear(self) -> None:
+        """ removes all items and publishes Clear event """
+        with self.lock:
+            self._checkWritable()
+            self._beginWrite()
+            self._buf[_HEADER.size:] = bytes(len(self._buf) - _HEADER.size)
+            _U64.pack_into(self._buf, _COUNT_OFFSET, 0)
+            self._endWrite()
+            self._used = 0
+            if self._observerCount:
+                self._onCollectionChanges(CollectionChange.Clear(self))
+
+    def when_version_changes(self, interval: float = 0.01) -> ObservableBase:
+        """ Creates an Observable of the version counter, polled every interval seconds on a background thread.
+        Meant for processes that attached to the dictionary and cannot subscribe to its changes. """
+        def subscribe(observer):
+            stopped = threading.Event()
+
+            def poll():
+                seen = None
+                while not stopped.wait(interval):
+                    try:
+                        version = self.version
+                    except (TypeError, ValueError):
+                        return
+                    if version != seen and not version & 1:
+                        seen = version
+                        observer.on_next(version)
+
+            threading.Thread(target=poll, daemon=True, name='SharedObservableDict-poll').start()
+            return Disposable.create(stopped.set)
+        return Observable.create(subscribe)
+
+    def _snapshot(self):
+        return dict(self._items())
+
+    def _values(self):
+        return iter(self.values())
+
+    def _valueChanges(self, change: CollectionChange):
+        action = change.Action
+        if action is CollectionChangeAction.ADD:
+            return (change.Items,), ()
+        if action is CollectionChangeAction.REMOVE:
+            return (), (change.OldItems,)
+        if action is CollectionChangeAction.REPLACE:
+            return (change.Items,), (change.OldItems,)
+        if action is CollectionChangeAction.EXTEND:
+            return list(change.Items.values()), list(change.OldItems.values())
+        if action is CollectionChangeAction.BATCH:
+            return self._batchValueChanges(change)
+        return None
+
+    def dispose(self):
+        """ Unsubscribe all the subscribers and release the shared memory; the owner also destroys the block """
+        with self.lock:
+            self.check_disposed()
+            self._beginSuppressNotification()
+            self._buf = None
+            self._memory.close()
+            if self._owner:
+                self._memory.unlink()
+                _owned.discard(self._memory.name)
+            super().dispose()
+
+    # internal methods
+    @staticmethod
+    def _slotCount(capacity: int) -> int:
+        """ the power of two number of slots holding up to capacity keys at a load of at most a half """
+        return 1 << (2 * capacity - 1).bit_length()
+
+    @staticmethod
+    def _slotStruct(key_size: int, value_format: str) -> struct.Struct:
+        # state, key length, key bytes, then the packed value
+        return struct.Struct('<BH{}s{}'.format(key_size, value_format.lstrip('@=<>!')))
+
+    def _setup(self, slot: struct.Struct, capacity: int, key_size: int, owner: bool) -> None:
+        self._slot = slot
+        self._capacity = capacity
+        self._slots = self._slotCount(capacity)
+        # slots that are not empty (keys and tombstones); only the owner writes, so only it keeps count
+        self._used = 0
+        self._keySize = key_size
+        self._owner = owner
+        self._buf = self._memory.buf
+        self._single = len(slot.unpack_from(bytes(slot.size))) == 4
+
+    def _checkWritable(self) -> None:
+        self.check_disposed()
+        if not self._owner:
+            raise PermissionError('SharedObservableDict {} is read-only outside its owner process'.format(self.name))
+
+    def _encodeKey(self, key) -> tuple:
+        if isinstance(key, str):
+            kind, data = _STR_KEY, key.encode('utf-8')
+        elif isinstance(key, bytes):
+            kind, data = _BYTES_KEY, key
+        else:
+            raise TypeError('SharedObservableDict keys are str or bytes, not {}'.format(type(key).__name__))
+        if len(data) > self._keySize:
+            raise ValueError('key is longer than {} bytes'.format(self._keySize))
+        return kind, data
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * self._slot.size
+
+    def _find(self, encoded: tuple) -> tuple:
+        """ (index the key can be inserted at, index holding the key or None) """
+        kind, data = encoded
+        buf, mask = self._buf, self._slots - 1
+        index = zlib.crc32(data) & mask
+        free = None
+        for _ in range(self._slots):
+            state, length, stored = struct.unpack_from('<BH{}s'.format(self._keySize), buf, self._offset(index))
+            if state == _EMPTY:
+                return (free if free is not None else index), None
+            if state == _DELETED:
+                if free is None:
+                    free = index
+            elif state == kind and length == len(data) and stored[:length] == data:
+                return index, index
+            index = (index + 1) & mask
+        return free, None
+
+    def _lookup(self, encoded: tuple):
+        _, found = self._find(encoded)
+        if found is None:
+            return _MISSING
+        return self._value(self._slot.unpack_from(self._buf, self._offset(found)))
+
+    def _value(self, fields: tuple):
+        return fields[3] if self._single else fields[3:]
+
+    def _items(self) -> list:
+        buf, slot = self._buf, self._slot
+        items = []
+        for index in range(self._slots):
+            fields = slot.unpack_from(buf, self._offset(index))
+            state = fields[0]
+            if state == _STR_KEY or state == _BYTES_KEY:
+                key = fields[2][:fields[1]]
+                items.append((key.decode('utf-8') if state == _STR_KEY else key, self._value(fields)))
+        return items
+
+    def _read(self, read):
+        """ runs read until it completes without a write overlapping it """
+        buf = self._buf
+        while True:
+            before = _U64.unpack_from(buf, _VERSION_OFFSET)[0]
+            if before & 1:
+                time.sleep(0)
+                continue
+            try:
+                result = read()
+            except Exception:
+                # a read overlapping a write can fail on half written bytes (a key that does not decode); the error
+                # only stands if no write got in the way
+                if _U64.unpack_from(buf, _VERSION_OFFSET)[0] != before:
+                    continue
+                raise
+            if _U64.unpack_from(buf, _VERSION_OFFSET)[0] == before:
+                return result
+
+    def _beginWrite(self) -> None:
+        _U64.pack_into(self._buf, _VERSION_OFFSET, self.version + 1)
+
+    def _endWrite(self) -> None:
+        _U64.pack_into(self._buf, _VERSION_OFFSET, self.version + 1)
+
+    def _pack(self, key, value) -> tuple:
+        """ (encoded key, slot record), raising for a key or value the table cannot hold """
+        encoded = self._encodeKey(key)
+        return encoded, self._record(encoded, value)
+
+    def _store(self, encoded: tuple, record: bytes):
+        """ stores the record under the encoded key and returns the value it replaced, or _MISSING """
+        free, found = self._find(encoded)
+        if found is None and _U64.unpack_from(self._buf, _COUNT_OFFSET)[0] >= self._capacity:
+            raise ValueError('SharedObservableDict is full ({} keys)'.format(self._capacity))
+        old = _MISSING if found is None else self._value(self._slot.unpack_from(self._buf, self._offset(found)))
+        index = free if found is None else found
+        filled = self._buf[self._offset(index)] == _EMPTY
+        self._beginWrite()
+        self._buf[self._offset(index):][:self._slot.size] = record
+        if found is None:
+            _U64.pack_into(self._buf, _COUNT_OFFSET, _U64.unpack_from(self._buf, _COUNT_OFFSET)[0] + 1)
+        self._endWrite()
+        if filled:
+            self._used += 1
+            if self._used > self._slots * 3 // 4:
+                self._rehash()
+        return old
+
+    def _record(self, encoded: tuple, value) -> bytes:
+        values = (value,) if self._single else value
+        return self._slot.pack(encoded[0], len(encoded[1]), encoded[1], *values)
+
+    def _rehash(self) -> None:
+        """ rebuilds the table without its tombstones, as a single write """
+        items = self._items()
+        records = [(self._encodeKey(key), value) for key, value in items]
+        self._beginWrite()
+        self._buf[_HEADER.size:] = bytes(len(self._buf) - _HEADER.size)
+        for encoded, value in records:
+            index, _ = self._find(encoded)
+            self._buf[self._offset(index):][:self._slot.size] = self._record(encoded, value)
+        self._endWrite()
+        self._used = len(records)
+
+    def _erase(self, key):
+        """ removes key and returns its value, or _MISSING """
+        encoded = self._encodeKey(key)
+        _, found = self._find(encoded)
+        if found is None:
+            return _MISSING
+        old = self._value(self._slot.unpack_from(self._buf, self._offset(found)))
+        self._beginWrite()
+        self._buf[self._offset(found)] = _DELETED
+        _U64.pack_into(self._buf, _COUNT_OFFSET, _U64.unpack_from(self._buf, _COUNT_OFFSET)[0] - 1)
+        self._endWrite()
+        return old
+
+
+_MISSING = object()
+# names of the blocks created by this process
+_owned = set()
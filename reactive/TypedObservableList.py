@@ -0,0 +1,78 @@
+from array import array
+from collections import Iterable
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.CollectionChange import CollectionChange
+
+
+class TypedObservableList(ObservableList):
+    """ An ObservableList of homogeneous numbers stored unboxed in an array.array of the given typecode
+    ('b', 'i', 'q', 'd', ...). It has the mutation and notification API of ObservableList; values that do not fit
+    the typecode raise TypeError / OverflowError before the list is changed. Extending from another array (or typed
+    list) of the same typecode is a single memory copy. """
+
+    def __init__(self, typecode: str, items: Iterable = None, **kwargs):
+        if not isinstance(items, array) or items.typecode != typecode:
+            items = array(typecode, items if items is not None else ())
+        super().__init__(items, **kwargs)
+
+    # protocol implementations
+    def __eq__(self, other):
+        if not isinstance(other, ObservableList):
+            return NotImplemented
+        return self._comparable(other._list) == other._list
+
+    def __ne__(self, other):
+        if not isinstance(other, ObservableList):
+            return NotImplemented
+        return self._comparable(other._list) != other._list
+
+    def __add__(self, other):
+        if not isinstance(other, ObservableList):
+            return NotImplemented
+        if isinstance(other, TypedObservableList) and other.typecode == self.typecode:
+            return TypedObservableList(self.typecode, self._list + other._list)
+        return ObservableList(self._list.tolist() + list(other))
+
+    @property
+    def typecode(self) -> str:
+        return self._list.typecode
+
+    @property
+    def itemsize(self) -> int:
+        return self._list.itemsize
+
+    # list methods
+    def sort(self, key=None, reverse=False, suppress=False) -> None:
+        """ sort the list in ascending / descending order and publishes the change notification if required. """
+        with self.lock:
+            self.check_disposed()
+            publish = not suppress and self._observerCount
+            previous = tuple(self._list) if publish else None
+            self._list[:] = array(self._list.typecode, sorted(self._list, key=key, reverse=reverse))
+            if publish:
+                self._onCollectionChanges(CollectionChange.IndexChanged(self, self._list[:], previous))
+
+    def tobytes(self) -> bytes:
+        """ return the machine values of the elements as bytes """
+        with self.read_lock:
+            self.check_disposed()
+            return self._list.tobytes()
+
+    # internal methods
+    def _wrap(self, items):
+        return TypedObservableList(self._list.typecode, items)
+
+    def _materialize(self, items: Iterable):
+        # converted to the typecode up front, so a bad value leaves the list unchanged. An array of the same typecode
+        # (including the storage of a typed list, or this one) is copied in one slice, so the published items are not
+        # an array that keeps changing after the event
+        if isinstance(items, TypedObservableList):
+            items = items._list
+        if isinstance(items, array) and items.typecode == self._list.typecode:
+            return items[:]
+        return array(self._list.typecode, items)
+
+    def _comparable(self, items):
+        """ arrays compare element-wise with each other, but never equal a list """
+        return self._list if isinstance(items, array) else self._list.tolist()
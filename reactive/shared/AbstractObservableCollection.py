@@ -1,23 +1,65 @@
+import queue
 import threading
 
 from abc import ABC, abstractmethod
 from collections import Iterable
+from collections import deque
+from contextlib import contextmanager
 
 from rx import Observable, Observer
 from rx.core import ObservableBase, Disposable
+from rx.disposables import CompositeDisposable
 from rx.internal import DisposedException
 from rx.subjects import Subject
 
+from reactive.shared.AsyncChangeStream import AsyncChangeStream
 from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.shared.DispatchMode import DispatchMode
+from reactive.shared.DispatchingLock import DispatchingLock
+from reactive.shared.OverflowPolicy import OverflowPolicy
+from reactive.shared.SequenceGapError import SequenceGapError
+from reactive.shared.SnapshotSubscription import SnapshotSubscription
+
+_STOP = object()
 
 
 class AbstractObservableCollection(ABC, Iterable):
 
-    def __init__(self):
+    def __init__(self, dispatch: DispatchMode = DispatchMode.IMMEDIATE, lock=None, journal_size: int = 0):
         self._collectionChanges = Subject()
-        self.lock = threading.RLock()
+        # any reentrant lock works; one that exposes a read_lock (ReaderWriterLock) lets readers run side by side
+        self.lock = lock if lock is not None else threading.RLock()
+        self.read_lock = getattr(self.lock, 'read_lock', self.lock)
         self.is_disposed = False
         self._suppressNotification = False
+        self._observerCount = 0
+        self._batchDepth = 0
+        self._batchedChanges = None
+        self._actionObservers = {}
+        self.dispatch_mode = dispatch
+        self._dispatcherThread = None
+        self._sequence = 0
+        # a journal keeps the last journal_size changes, numbered in publish order, for subscribers that resume
+        # with since=; it always listens, so it counts as an observer
+        self._journal = deque(maxlen=journal_size) if journal_size else None
+        if self._journal is not None:
+            self._observerCount += 1
+        # changes are numbered once something needs to order them: a journal or a snapshot subscription
+        self._sequenced = self._journal is not None
+
+        if dispatch is DispatchMode.IMMEDIATE:
+            self._dispatch = self._deliver
+        elif dispatch is DispatchMode.DEFERRED:
+            self._pending = deque()
+            self._deliveryGuard = threading.Lock()
+            self._dispatch = self._pending.append
+            self.lock = DispatchingLock(self.lock, self._deliverPending)
+        elif dispatch is DispatchMode.THREAD:
+            self._pending = queue.Queue()
+            self._dispatch = self._enqueueForDispatcher
+        else:
+            raise ValueError('Unknown dispatch mode {}'.format(dispatch))
 
     @abstractmethod
     def __iter__(self):
@@ -43,25 +85,278 @@ class AbstractObservableCollection(ABC, Iterable):
     def dispose(self):
         """ Clears all the values from the set, unsubscribe all the subscribers and release resources """
         self.check_disposed()
+        # subscribers are told the stream has ended, so an async for over the changes stops
+        observers = {o for table in self._routingTables() for entry in table.values() for o in entry}
+        self._collectionChanges.on_completed()
         self._collectionChanges.dispose()
+        for table in self._routingTables():
+            table.clear()
+        for observer in observers:
+            observer.on_completed()
         self.is_disposed = True
+        if self._journal is not None:
+            self._journal.clear()
+        if self._dispatcherThread is not None:
+            self._pending.put(_STOP)
 
-    def when_collection_changes(self) -> ObservableBase:
-        return Observable.create(lambda obs: self._subscribe(obs))
+    @property
+    def sequence(self) -> int:
+        """ the sequence number of the last change published, 0 until changes are numbered (a journal or a
+        snapshot subscription) """
+        return self._sequence
+
+    def when_collection_changes(self, actions: Iterable = None, since: int = None) -> ObservableBase:
+        """ Creates an Observable of the changes made to the collection. When actions are given, the observer is
+        registered only for those CollectionChangeActions and is not called for any other change. Changes inside a
+        Batch are delivered one by one to observers that did not register for BATCH itself.
+        On a collection created with a journal_size, since= first replays the journaled changes numbered after
+        since and then continues with live changes. If those changes have been evicted the observer gets a
+        SequenceGapError and has to start over from a snapshot. since cannot be combined with actions. """
+        if since is not None:
+            if actions is not None:
+                raise ValueError('since cannot be combined with actions')
+            return Observable.create(lambda obs: self._subscribeSince(obs, since))
+        if actions is None:
+            return Observable.create(lambda obs: self._subscribe(obs))
+        actions = frozenset(actions)
+        return Observable.create(lambda obs: self._subscribeToActions(obs, actions))
+
+    def when_collection_changes_async(self, maxsize: int = 1024,
+                                      policy: OverflowPolicy = OverflowPolicy.BLOCK) -> AsyncChangeStream:
+        """ Returns an async iterator over the changes made from now on, buffering at most maxsize of them.
+        The policy decides what happens to a change that arrives while the buffer is full. The iteration ends
+        after the buffered changes once the collection is disposed. """
+        self.check_disposed()
+        return AsyncChangeStream(self, maxsize, policy)
 
     def _subscribe(self, observer: Observer) -> Disposable:
         if self.is_disposed:
             return Observable.throw(DisposedException('Trying to access an already disposed object')) \
                 .subscribe(observer)
         else:
-            return self._collectionChanges.subscribe(observer)
+            with self.lock:
+                self._observerCount += 1
+            subscription = self._collectionChanges.subscribe(observer)
+            return CompositeDisposable(subscription, Disposable.create(self._releaseObserver))
+
+    def subscribe_with_snapshot(self, on_next=None, on_error=None, on_completed=None) -> SnapshotSubscription:
+        """ Atomically copies the collection and subscribes to the changes made after the copy. Returns the copy,
+        the sequence number it was taken at and the subscription; the observer only gets changes numbered after
+        that version, so none is missed or applied twice whatever the dispatch mode. The lock is held for the copy
+        only. """
+        with self.lock:
+            self.check_disposed()
+            self._sequenced = True
+            snapshot = self._snapshot()
+            version = self._sequence
+            subscription = Observable.create(lambda obs: self._subscribe(obs)) \
+                .filter(lambda change: change.Sequence is not None and change.Sequence > version) \
+                .subscribe(on_next, on_error, on_completed)
+            return SnapshotSubscription(snapshot, version, subscription)
+
+    def _subscribeSince(self, observer: Observer, since: int) -> Disposable:
+        if self.is_disposed:
+            return self._subscribe(observer)
+        if self._journal is None:
+            return Observable.throw(ValueError('since requires a collection created with a journal_size')) \
+                .subscribe(observer)
+        with self.lock:
+            journal = self._journal
+            latest = self._sequence
+            oldest = journal[0].Sequence if journal else latest + 1
+            if not oldest - 1 <= since <= latest:
+                return Observable.throw(SequenceGapError(since, oldest, latest)).subscribe(observer)
+            # replayed under the lock so nothing is published in between; changes journaled but still queued for
+            # delivery (deferred / thread dispatch) are replayed here and skipped by the live subscription
+            for change in list(journal)[since - oldest + 1:]:
+                observer.on_next(change)
+            return Observable.create(lambda obs: self._subscribe(obs)) \
+                .filter(lambda change: change.Sequence > latest) \
+                .subscribe(observer)
+
+    def _releaseObserver(self) -> None:
+        with self.lock:
+            self._observerCount -= 1
+
+    def _subscribeToActions(self, observer: Observer, actions: frozenset) -> Disposable:
+        return self._subscribeToTable(self._actionObservers, actions, observer)
+
+    def _subscribeToTable(self, table: dict, entries: Iterable, observer: Observer) -> Disposable:
+        """ Registers the observer under each entry of a routing table (entry -> tuple of observers) """
+        if self.is_disposed or self._collectionChanges.is_stopped:
+            return self._subscribe(observer)
+        with self.lock:
+            # entries are replaced rather than mutated so delivery can iterate them without the lock
+            for entry in entries:
+                table[entry] = table.get(entry, ()) + (observer,)
+            self._observerCount += 1
+
+        def unsubscribe():
+            with self.lock:
+                for entry in entries:
+                    observers = tuple(o for o in table.get(entry, ()) if o is not observer)
+                    if observers:
+                        table[entry] = observers
+                    else:
+                        table.pop(entry, None)
+                self._observerCount -= 1
+
+        return Disposable.create(unsubscribe)
+
+    @contextmanager
+    def batch(self):
+        """ Holds the lock for the duration of the block and buffers every change made within it. On exit, the
+        buffered changes are published as a single Batch event whose items are the individual changes in order.
+        Nested batches are folded into the outermost one. """
+        with self.lock:
+            self.check_disposed()
+            if self._batchDepth == 0:
+                self._batchedChanges = []
+            self._batchDepth += 1
+            try:
+                yield self
+            finally:
+                self._batchDepth -= 1
+                if self._batchDepth == 0:
+                    changes, self._batchedChanges = self._batchedChanges, None
+                    if changes and not self.is_disposed:
+                        self._onCollectionChanges(CollectionChange.Batch(self, tuple(changes)))
 
     def _onCollectionChanges(self, item: CollectionChange):
-        if not self._suppressNotification:
+        if self._suppressNotification:
+            return
+        if self._batchedChanges is not None:
+            self._batchedChanges.append(item)
+        else:
+            if self._sequenced:
+                self._sequence += 1
+                item = item.tagged(self._sequence)
+                if self._journal is not None:
+                    self._journal.append(item)
+            self._dispatch(item)
+
+    def _onCollectionError(self, error: Exception):
+        """ Publishes the error to on_error, in order with the changes queued before it """
+        self._dispatch(error)
+
+    def flush_notifications(self) -> None:
+        """ Blocks until every notification queued so far has been delivered to the subscribers.
+        Does nothing when notifications are delivered immediately. """
+        if self.dispatch_mode is DispatchMode.DEFERRED:
+            self._deliverPending()
+        elif self.dispatch_mode is DispatchMode.THREAD and self._dispatcherThread is not None \
+                and self._dispatcherThread is not threading.current_thread():
+            self._pending.join()
+
+    # dispatching
+    def _deliver(self, item) -> None:
+        if isinstance(item, Exception):
+            self._fail(item)
+            return
+        try:
+            self._collectionChanges.on_next(item)
+            self._route(item)
+        except Exception as ex:
+            self._fail(ex)
+
+    def _route(self, item: CollectionChange) -> None:
+        """ Delivers a change to the observers registered in routing tables, after the shared subject """
+        if self._actionObservers:
+            self._deliverToActionObservers(item)
+
+    def _deliverToActionObservers(self, item: CollectionChange) -> None:
+        table = self._actionObservers
+        observers = table.get(item.Action, ())
+        for observer in observers:
+            observer.on_next(item)
+        if item.Action is CollectionChangeAction.BATCH:
+            for change in item.Items:
+                for observer in table.get(change.Action, ()):
+                    if observer not in observers:
+                        observer.on_next(change)
+
+    def _fail(self, error: Exception) -> None:
+        self._collectionChanges.on_error(error)
+        with self.lock:
+            observers = {o for table in self._routingTables() for entry in table.values() for o in entry}
+            for table in self._routingTables():
+                table.clear()
+        for observer in observers:
+            observer.on_error(error)
+
+    def _routingTables(self) -> tuple:
+        return self._actionObservers,
+
+    def _deliverPending(self) -> None:
+        # A single thread delivers at a time, in queue order. A writer that finds delivery in progress (including
+        # a subscriber writing back from inside on_next) leaves its notification for the active deliverer.
+        pending = self._pending
+        while pending and self._deliveryGuard.acquire(False):
+            try:
+                while pending:
+                    item = pending.popleft()
+                    if not self.is_disposed:
+                        self._deliver(item)
+            finally:
+                self._deliveryGuard.release()
+
+    def _enqueueForDispatcher(self, item) -> None:
+        if self._dispatcherThread is None:
+            self._dispatcherThread = threading.Thread(target=self._runDispatcher, daemon=True,
+                                                      name='{}-dispatcher'.format(type(self).__name__))
+            self._dispatcherThread.start()
+        self._pending.put(item)
+
+    def _runDispatcher(self) -> None:
+        pending = self._pending
+        while True:
+            item = pending.get()
             try:
-                self._collectionChanges.on_next(item)
-            except Exception as ex:
-                self._collectionChanges.on_error(ex)
+                if item is _STOP:
+                    return
+                if not self.is_disposed:
+                    self._deliver(item)
+            except DisposedException:
+                pass
+            finally:
+                pending.task_done()
+
+    def _snapshot(self):
+        """ A detached copy of the contents, taken under the lock by subscribe_with_snapshot """
+        return list(self)
+
+    # value deltas
+    def _values(self) -> Iterable:
+        """ The values aggregated over by consumers of _valueChanges """
+        return iter(self)
+
+    def _valueChanges(self, change: CollectionChange):
+        """ Describes a change as (added values, removed values), or None when it does not carry enough to say and
+        consumers have to re-read _values(). The default reads sequence-style changes. """
+        action = change.Action
+        if action is CollectionChangeAction.ADD:
+            return (change.Items,), ()
+        if action is CollectionChangeAction.REMOVE:
+            return (), (change.Items,)
+        if action is CollectionChangeAction.EXTEND:
+            return change.Items, ()
+        if action is CollectionChangeAction.REPLACE and change.OldItems is not None:
+            return change.Items, change.OldItems
+        if action is CollectionChangeAction.INDEX:
+            return (), ()
+        if action is CollectionChangeAction.BATCH:
+            return self._batchValueChanges(change)
+        return None
+
+    def _batchValueChanges(self, change: CollectionChange):
+        added, removed = [], []
+        for item in change.Items:
+            delta = self._valueChanges(item)
+            if delta is None:
+                return None
+            added.extend(delta[0])
+            removed.extend(delta[1])
+        return added, removed
 
     # internal methods
     def _beginSuppressNotification(self) -> None:
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+from collections import deque
+
+from reactive.shared.OverflowPolicy import OverflowPolicy
+
+
+def _resolve(waiter) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncChangeStream:
+    """ An async iterator over the changes of an observable collection, backed by a bounded buffer.
+
+    Writers append to the buffer directly; the event loop is only woken when the consumer is actually waiting,
+    so a busy stream costs no thread hop per change. Writers running on the event loop thread itself are never
+    blocked (that would deadlock the consumer), so under the BLOCK policy they may overfill the buffer. """
+
+    def __init__(self, source, maxsize: int = 1024, policy: OverflowPolicy = OverflowPolicy.BLOCK, loop=None):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self._buffer = deque()
+        self._condition = threading.Condition()
+        self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._loopThread = threading.get_ident() if self._loop.is_running() else None
+        self._waiter = None
+        self._error = None
+        self._closed = False
+        self._subscription = source.when_collection_changes() \
+            .subscribe(self._on_next, self._on_error, self._on_completed)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            with self._condition:
+                if self._buffer:
+                    change = self._buffer.popleft()
+                    self._condition.notify()
+                    return change
+                if self._error is not None:
+                    raise self._error
+                if self._closed:
+                    raise StopAsyncIteration
+                self._loopThread = threading.get_ident()
+                self._waiter = waiter = self._loop.create_future()
+            await waiter
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def close(self) -> None:
+        """ Unsubscribes from the collection, ends the iteration and releases any blocked writer """
+        self._subscription.dispose()
+        self._finish(None)
+
+    # observer callbacks, invoked on the writing thread
+    def _on_next(self, change) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            buffer = self._buffer
+            if len(buffer) >= self.maxsize:
+                if self.policy is OverflowPolicy.BLOCK:
+                    if threading.get_ident() != self._loopThread:
+                        while len(buffer) >= self.maxsize and not self._closed:
+                            self._condition.wait()
+                elif self.policy is OverflowPolicy.DROP_OLDEST:
+                    buffer.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += len(buffer)
+                    buffer.clear()
+            buffer.append(change)
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._wake(waiter)
+
+    def _on_error(self, error: Exception) -> None:
+        self._finish(error)
+
+    def _on_completed(self) -> None:
+        self._finish(None)
+
+    def _finish(self, error) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._wake(waiter)
+
+    def _wake(self, waiter) -> None:
+        if threading.get_ident() == self._loopThread:
+            _resolve(waiter)
+        else:
+            self._loop.call_soon_threadsafe(_resolve, waiter)
@@ -0,0 +1,308 @@
+import pickle
+import struct
+from collections.abc import Set
+
+from reactive.shared.AbstractObservableCollection import AbstractObservableCollection
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+_LENGTH = struct.Struct('<I')
+_HEADER = struct.Struct('<BB')      # action, field flags
+_INDEX = struct.Struct('<q')
+_SEQUENCE = struct.Struct('<Q')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+
+_HAS_INDEX, _HAS_SEQUENCE, _HAS_KEY, _HAS_OLD_ITEMS = 1, 2, 4, 8
+_ACTIONS = {action.value: action for action in CollectionChangeAction}
+_INT_MIN, _INT_MAX = -2 ** 63, 2 ** 63 - 1
+_new = tuple.__new__
+_TAG_INT, _TAG_FLOAT, _TAG_STR = ord('i'), ord('f'), ord('s')
+
+
+class ChangeCodec:
+    """ Encodes CollectionChanges into compact length-prefixed binary frames and back. A frame is a u32 length
+    followed by the action, a flags byte, the index and sequence number when present, then Items, Key and OldItems.
+    Values are tagged: None, bool, int (64 bit), float, str, bytes, tuple, list, dict, set and nested changes (the
+    items of a Batch) have their own encoding, other mappings, sets and observable collections are encoded by their
+    members and anything else is pickled. The source is not encoded; decoding takes the source to put on the
+    changes. Decoding reads straight from a bytes-like buffer (memoryview, mmap,
+    bytearray) without copying frames out of it. """
+
+    @staticmethod
+    def encode(change: CollectionChange) -> bytes:
+        """ return the frame for a single change """
+        out = bytearray()
+        _encodeFrame(out, change)
+        return bytes(out)
+
+    @staticmethod
+    def encode_batch(changes) -> bytes:
+        """ return the frames of all the changes back to back in one buffer """
+        out = bytearray()
+        for change in changes:
+            _encodeFrame(out, change)
+        return bytes(out)
+
+    @staticmethod
+    def encode_into(out: bytearray, change: CollectionChange) -> None:
+        """ append the frame for the change to out """
+        _encodeFrame(out, change)
+
+    @staticmethod
+    def decode(buffer, source=None) -> CollectionChange:
+        """ return the change encoded by the single frame in buffer """
+        changes, consumed = ChangeCodec.decode_frames(buffer, source)
+        if len(changes) != 1 or consumed != len(buffer):
+            raise ValueError('buffer does not hold exactly one frame')
+        return changes[0]
+
+    @staticmethod
+    def decode_batch(buffer, source=None) -> list:
+        """ return the changes of all the frames in buffer, which must end on a frame boundary """
+        changes, consumed = ChangeCodec.decode_frames(buffer, source)
+        if consumed != len(buffer):
+            raise ValueError('buffer ends with an incomplete frame')
+        return changes
+
+    @staticmethod
+    def decode_frames(buffer, source=None, offset: int = 0) -> tuple:
+        """ return (changes, end) for the complete frames in buffer from offset on, where end is the offset just
+        after the last complete frame. Incoming stream data can be decoded as it arrives and the bytes from end on
+        kept for the next read. """
+        view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        size = len(view)
+        changes = []
+        position = offset
+        while position + _LENGTH.size <= size:
+            length, = _LENGTH.unpack_from(view, position)
+            end = position + _LENGTH.size + length
+            if end > size:
+                break
+            change, position = _decodeChange(view, position + _LENGTH.size, source)
+            if position != end:
+                raise ValueError('malformed frame at offset {}'.format(end - length - _LENGTH.size))
+            changes.append(change)
+        return changes, position
+
+
+# encoding
+def _encodeFrame(out: bytearray, change: CollectionChange) -> None:
+    start = len(out)
+    out += b'\0\0\0\0'
+    _encodeChange(out, change)
+    _LENGTH.pack_into(out, start, len(out) - start - _LENGTH.size)
+
+
+def _encodeChange(out: bytearray, change: CollectionChange) -> None:
+    _, action, items, key, index, old_items, sequence = change
+    flags = (index is not None and _HAS_INDEX) | (sequence is not None and _HAS_SEQUENCE) | \
+        (key is not None and _HAS_KEY) | (old_items is not None and _HAS_OLD_ITEMS)
+    out += _HEADER.pack(action.value, flags)
+    if index is not None:
+        out += _INDEX.pack(index)
+    if sequence is not None:
+        out += _SEQUENCE.pack(sequence)
+    _encodeValue(out, items)
+    if key is not None:
+        _encodeValue(out, key)
+    if old_items is not None:
+        _encodeValue(out, old_items)
+
+
+def _encodeValue(out: bytearray, value) -> None:
+    kind = type(value)
+    # the common scalars are encoded inline, saving a call per value
+    if kind is int and _INT_MIN <= value <= _INT_MAX:
+        out += b'i'
+        out += _INT.pack(value)
+        return
+    if kind is str:
+        data = value.encode('utf-8')
+        out += b's'
+        out += _LENGTH.pack(len(data))
+        out += data
+        return
+    if kind is float:
+        out += b'f'
+        out += _FLOAT.pack(value)
+        return
+    encoder = _ENCODERS.get(kind)
+    if encoder is not None:
+        encoder(out, value)
+    elif hasattr(value, 'keys') and hasattr(value, 'items'):
+        # other mappings (an ObservableDict passed to update) travel as plain dicts
+        _encodeDict(out, value)
+    elif isinstance(value, Set) or (isinstance(value, AbstractObservableCollection) and hasattr(value, 'issubset')):
+        # other sets (an ObservableSet's in-place updates publish the set itself) travel as plain sets
+        _encodeSet(out, tuple(value))
+    elif isinstance(value, AbstractObservableCollection):
+        _encodeList(out, tuple(value))
+    else:
+        _encodePickle(out, value)
+
+
+def _encodeNone(out, value):
+    out += b'N'
+
+
+def _encodeBool(out, value):
+    out += b'T' if value else b'F'
+
+
+def _encodeInt(out, value):
+    if _INT_MIN <= value <= _INT_MAX:
+        out += b'i'
+        out += _INT.pack(value)
+    else:
+        _encodePickle(out, value)
+
+
+def _encodeFloat(out, value):
+    out += b'f'
+    out += _FLOAT.pack(value)
+
+
+def _encodeStr(out, value):
+    data = value.encode('utf-8')
+    out += b's'
+    out += _LENGTH.pack(len(data))
+    out += data
+
+
+def _encodeBytes(out, value):
+    out += b'b'
+    out += _LENGTH.pack(len(value))
+    out += value
+
+
+def _sequenceEncoder(tag: bytes):
+    def encode(out, value):
+        out += tag
+        out += _LENGTH.pack(len(value))
+        for element in value:
+            _encodeValue(out, element)
+    return encode
+
+
+def _encodeDict(out, value):
+    out += b'd'
+    out += _LENGTH.pack(len(value))
+    for key, element in value.items():
+        _encodeValue(out, key)
+        _encodeValue(out, element)
+
+
+def _encodeNested(out, value):
+    out += b'c'
+    _encodeChange(out, value)
+
+
+def _encodePickle(out, value):
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    out += b'p'
+    out += _LENGTH.pack(len(data))
+    out += data
+
+
+_encodeList = _sequenceEncoder(b'l')
+_encodeSet = _sequenceEncoder(b'S')
+
+_ENCODERS = {
+    type(None): _encodeNone, bool: _encodeBool, int: _encodeInt, float: _encodeFloat, str: _encodeStr,
+    bytes: _encodeBytes, bytearray: _encodeBytes, tuple: _sequenceEncoder(b't'), list: _encodeList,
+    set: _encodeSet, frozenset: _sequenceEncoder(b'z'), dict: _encodeDict,
+    CollectionChange: _encodeNested,
+}
+
+
+# decoding
+def _decodeChange(view: memoryview, position: int, source) -> tuple:
+    action, flags = _HEADER.unpack_from(view, position)
+    position += _HEADER.size
+    index = sequence = key = old_items = None
+    if flags & _HAS_INDEX:
+        index, = _INDEX.unpack_from(view, position)
+        position += _INDEX.size
+    if flags & _HAS_SEQUENCE:
+        sequence, = _SEQUENCE.unpack_from(view, position)
+        position += _SEQUENCE.size
+    items, position = _decodeValue(view, position, source)
+    if flags & _HAS_KEY:
+        key, position = _decodeValue(view, position, source)
+    if flags & _HAS_OLD_ITEMS:
+        old_items, position = _decodeValue(view, position, source)
+    return _new(CollectionChange, (source, _ACTIONS[action], items, key, index, old_items, sequence)), position
+
+
+def _decodeValue(view: memoryview, position: int, source) -> tuple:
+    tag = view[position]
+    position += 1
+    # the common scalars are decoded inline, saving a call per value
+    if tag == _TAG_INT:
+        return _INT.unpack_from(view, position)[0], position + _INT.size
+    if tag == _TAG_STR:
+        length, = _LENGTH.unpack_from(view, position)
+        start = position + _LENGTH.size
+        return str(view[start:start + length], 'utf-8'), start + length
+    if tag == _TAG_FLOAT:
+        return _FLOAT.unpack_from(view, position)[0], position + _FLOAT.size
+    return _DECODERS[tag](view, position, source)
+
+
+def _decodeInt(view, position, source):
+    return _INT.unpack_from(view, position)[0], position + _INT.size
+
+
+def _decodeFloat(view, position, source):
+    return _FLOAT.unpack_from(view, position)[0], position + _FLOAT.size
+
+
+def _decodeStr(view, position, source):
+    length, = _LENGTH.unpack_from(view, position)
+    start = position + _LENGTH.size
+    return str(view[start:start + length], 'utf-8'), start + length
+
+
+def _decodeBytes(view, position, source):
+    length, = _LENGTH.unpack_from(view, position)
+    start = position + _LENGTH.size
+    return view[start:start + length].tobytes(), start + length
+
+
+def _sequenceDecoder(factory):
+    def decode(view, position, source):
+        count, = _LENGTH.unpack_from(view, position)
+        position += _LENGTH.size
+        elements = []
+        for _ in range(count):
+            element, position = _decodeValue(view, position, source)
+            elements.append(element)
+        return factory(elements), position
+    return decode
+
+
+def _decodeDict(view, position, source):
+    count, = _LENGTH.unpack_from(view, position)
+    position += _LENGTH.size
+    value = {}
+    for _ in range(count):
+        key, position = _decodeValue(view, position, source)
+        value[key], position = _decodeValue(view, position, source)
+    return value, position
+
+
+def _decodePickle(view, position, source):
+    length, = _LENGTH.unpack_from(view, position)
+    start = position + _LENGTH.size
+    return pickle.loads(view[start:start + length]), start + length
+
+
+_DECODERS = {
+    ord('N'): lambda view, position, source: (None, position),
+    ord('T'): lambda view, position, source: (True, position),
+    ord('F'): lambda view, position, source: (False, position),
+    ord('i'): _decodeInt, ord('f'): _decodeFloat, ord('s'): _decodeStr, ord('b'): _decodeBytes,
+    ord('t'): _sequenceDecoder(tuple), ord('l'): _sequenceDecoder(list), ord('S'): _sequenceDecoder(set),
+    ord('z'): _sequenceDecoder(frozenset), ord('d'): _decodeDict, ord('c'): _decodeChange, ord('p'): _decodePickle,
+}
@@ -1,48 +1,87 @@
 from collections import Iterable
+from operator import itemgetter
 
 from .CollectionChangeAction import CollectionChangeAction
 
+_new = tuple.__new__
+_SINGLE = frozenset((CollectionChangeAction.ADD, CollectionChangeAction.REMOVE))
 
-class CollectionChange:
-    """ A class method that holds the collection change type, source and changed items.
-    Also provides factory methods for creating
-    type of collection change events """
 
-    def __init__(self, source=None, action=None, items=None):
-        # consider changing this into tuple as it need not be mutable.
-        self.source = source if source is not None else ()
-        self.action: CollectionChangeAction = action
-        # consider changing this into tuple as it need not be mutable.
-        self.items = items if items is not None else ()
+class CollectionChange(tuple):
+    """ An immutable record that holds the collection change type, source and changed items.
+    Also provides factory methods for creating type of collection change events.
 
-    @property
-    def Source(self):
-        return self.source
+    Built on tuple with empty __slots__, so an event is a single allocation without an instance __dict__.
+    Items are stored by reference and not copied; publishers must not mutate what they pass in.
+    Key is the dictionary key a single-key ObservableDict change applies to, None otherwise.
+    Index is the list position the change starts at and OldItems holds the values it removed, overwrote or
+    reordered, both None when they do not apply. Sequence is the number a journaling collection assigned the change
+    when it was published, None otherwise. """
 
-    @property
-    def Items(self):
-        return self.items
+    __slots__ = ()
+
+    def __new__(cls, source=None, action=None, items=None, key=None, index=None, old_items=None, sequence=None):
+        return _new(cls, (source if source is not None else (), action, items if items is not None else (), key,
+                          index, old_items, sequence))
+
+    source = property(itemgetter(0))
+    action = property(itemgetter(1))
+    items = property(itemgetter(2))
+    key = property(itemgetter(3))
+    index = property(itemgetter(4))
+    old_items = property(itemgetter(5))
+    sequence = property(itemgetter(6))
+
+    Source = source
+    Action = action
+    Items = items
+    Key = key
+    Index = index
+    OldItems = old_items
+    Sequence = sequence
 
     @property
-    def Action(self):
-        return self.action
+    def Count(self) -> int:
+        """ number of elements the change carries, one for a single-item Add or Remove or a keyed Replace """
+        if self[1] in _SINGLE or (self[3] is not None and self[1] is CollectionChangeAction.REPLACE):
+            return 1
+        return len(self[2])
+
+    def __repr__(self):
+        return 'CollectionChange(action={}, items={!r})'.format(self[1], self[2])
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def tagged(self, sequence: int):
+        """ return a copy of the change carrying the sequence number """
+        return _new(type(self), (self[0], self[1], self[2], self[3], self[4], self[5], sequence))
+
+    # factories bind their action at class creation so an event costs one tuple allocation
+    @classmethod
+    def Add(cls, source, items, key=None, index=None, _action=CollectionChangeAction.ADD):
+        return _new(cls, (source, _action, items if items is not None else (), key, index, None, None))
+
+    @classmethod
+    def Remove(cls, source, items=None, key=None, index=None, old_items=None, _action=CollectionChangeAction.REMOVE):
+        return _new(cls, (source, _action, items if items is not None else (), key, index, old_items, None))
 
     @classmethod
-    def Add(cls, source, items):
-        return cls(source=source, action=CollectionChangeAction.ADD, items=items)
+    def Extend(cls, source, items: Iterable, index=None, old_items=None, _action=CollectionChangeAction.EXTEND):
+        return _new(cls, (source, _action, items if items is not None else (), None, index, old_items, None))
 
     @classmethod
-    def Remove(cls, source, items=None):
-        return cls(source=source, action=CollectionChangeAction.REMOVE, items=items)
+    def Replace(cls, source, items, index=None, old_items=None, key=None, _action=CollectionChangeAction.REPLACE):
+        return _new(cls, (source, _action, items if items is not None else (), key, index, old_items, None))
 
     @classmethod
-    def Extend(cls, source, items: Iterable):
-        return cls(source=source, action=CollectionChangeAction.EXTEND, items=items)
+    def Clear(cls, source, _action=CollectionChangeAction.CLEAR):
+        return _new(cls, (source, _action, (), None, None, None, None))
 
     @classmethod
-    def Clear(cls, source):
-        return cls(source=source, action=CollectionChangeAction.CLEAR)
+    def IndexChanged(cls, source, items, old_items=None, _action=CollectionChangeAction.INDEX):
+        return _new(cls, (source, _action, items if items is not None else (), None, 0, old_items, None))
 
     @classmethod
-    def IndexChanged(cls, source, items):
-        return cls(source=source, action=CollectionChangeAction.INDEX, items=items)
+    def Batch(cls, source, changes: tuple, _action=CollectionChangeAction.BATCH):
+        return _new(cls, (source, _action, changes, None, None, None, None))
@@ -8,3 +8,5 @@ class CollectionChangeAction(Enum):
     REVERSED = 4
     CLEAR = 5
     INDEX = 6
+    BATCH = 7
+    REPLACE = 8
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class DispatchMode(Enum):
+    """ Controls when and on which thread change notifications reach the subscribers """
+    IMMEDIATE = 1   # delivered by the writing thread while it still holds the collection lock
+    DEFERRED = 2    # queued under the lock and delivered by the writing thread once the lock is released
+    THREAD = 3      # queued under the lock and delivered in order by a dedicated dispatcher thread
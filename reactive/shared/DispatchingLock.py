@@ -0,0 +1,29 @@
+class DispatchingLock:
+    """ Wraps a reentrant lock and invokes a callback every time the outermost hold on it is released.
+    Used by deferred dispatch to deliver the notifications queued while the lock was held. """
+
+    def __init__(self, lock, on_release):
+        self._lock = lock
+        self._on_release = on_release
+        self._depth = 0
+
+    def acquire(self, blocking=True, timeout=-1):
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._depth += 1
+        return acquired
+
+    def release(self):
+        # only the owning thread can get here, so the depth needs no extra guarding
+        self._depth -= 1
+        outermost = self._depth == 0
+        self._lock.release()
+        if outermost:
+            self._on_release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
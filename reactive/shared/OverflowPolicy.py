@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """ What a bounded change stream does with a new change when its buffer is full """
+    BLOCK = 1           # the writer waits until the consumer makes room
+    DROP_OLDEST = 2     # the oldest buffered change is discarded
+    LATEST = 3          # every buffered change is discarded, only the newest is kept
@@ -0,0 +1,109 @@
+import threading
+
+
+class ReaderWriterLock:
+    """ A reentrant reader-writer lock. The lock itself is the exclusive (writer) side and can be used anywhere a
+    threading.RLock is used; read_lock is the shared side. Waiting writers take priority over new readers so
+    mutations are not starved under read-heavy traffic. A thread holding the write lock may also take the read
+    lock, but a reader cannot upgrade to writer. """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writerDepth = 0
+        self._waitingWriters = 0
+        self._local = threading.local()
+        self.read_lock = _ReadLock(self)
+
+    # exclusive side
+    def acquire(self, blocking=True, timeout=-1) -> bool:
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writerDepth += 1
+                return True
+            if getattr(self._local, 'depth', 0):
+                raise RuntimeError('Cannot upgrade a read lock to a write lock')
+            self._waitingWriters += 1
+            try:
+                if self._writer is not None or self._readers:
+                    if not self._condition.wait_for(lambda: self._writer is None and not self._readers,
+                                                    self._waitTimeout(blocking, timeout)):
+                        # readers held back for this writer may go ahead once it has given up
+                        self._condition.notify_all()
+                        return False
+            finally:
+                self._waitingWriters -= 1
+            self._writer = me
+            self._writerDepth = 1
+            return True
+
+    def release(self) -> None:
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError('Cannot release an un-acquired write lock')
+            self._writerDepth -= 1
+            if self._writerDepth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    # shared side
+    def acquire_read(self, blocking=True, timeout=-1) -> bool:
+        local = self._local
+        depth = getattr(local, 'depth', 0)
+        with self._condition:
+            # re-entrant reads and reads by the writing thread never wait, otherwise they could deadlock
+            if not depth and (self._writer is not None or self._waitingWriters) \
+                    and self._writer != threading.get_ident():
+                if not self._condition.wait_for(lambda: self._writer is None and not self._waitingWriters,
+                                                self._waitTimeout(blocking, timeout)):
+                    return False
+            self._readers += 1
+        local.depth = depth + 1
+        return True
+
+    def release_read(self) -> None:
+        local = self._local
+        if not getattr(local, 'depth', 0):
+            raise RuntimeError('Cannot release an un-acquired read lock')
+        local.depth -= 1
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    @staticmethod
+    def _waitTimeout(blocking, timeout):
+        if not blocking:
+            return 0
+        return None if timeout < 0 else timeout
+
+
+class _ReadLock:
+    """ The shared side of a ReaderWriterLock, usable as a context manager """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner: ReaderWriterLock):
+        self._owner = owner
+
+    def acquire(self, blocking=True, timeout=-1) -> bool:
+        return self._owner.acquire_read(blocking, timeout)
+
+    def release(self) -> None:
+        self._owner.release_read()
+
+    def __enter__(self):
+        self._owner.acquire_read()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._owner.release_read()
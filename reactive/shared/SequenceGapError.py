@@ -0,0 +1,11 @@
+class SequenceGapError(Exception):
+    """ Raised to a subscriber asking to resume after a sequence number the journal can no longer replay from,
+    because the changes after it were evicted (or it was never issued). The subscriber has to start over from a
+    snapshot of the collection. """
+
+    def __init__(self, since: int, oldest: int, latest: int):
+        super().__init__('Cannot replay changes after sequence {}: the journal holds {} to {}'
+                         .format(since, oldest, latest))
+        self.since = since
+        self.oldest = oldest
+        self.latest = latest
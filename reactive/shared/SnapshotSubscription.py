@@ -0,0 +1,11 @@
+from collections import namedtuple
+
+
+class SnapshotSubscription(namedtuple('SnapshotSubscription', ('snapshot', 'version', 'subscription'))):
+    """ The result of subscribe_with_snapshot: a copy of the collection, the sequence number it reflects and the
+    subscription to the changes numbered after it """
+
+    __slots__ = ()
+
+    def dispose(self) -> None:
+        self.subscription.dispose()
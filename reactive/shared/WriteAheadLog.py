@@ -0,0 +1,188 @@
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+_HEADER = struct.Struct('<II')  # payload length, crc32 of the payload
+_SET, _DELETE, _UPDATE, _CLEAR = range(4)
+
+
+class WriteAheadLog:
+    """ An append-only log of the changes made to an ObservableDict, with a snapshot file it is compacted into.
+    Each published change becomes one record (a Batch stays atomic): a length and crc32 header followed by the
+    pickled key operations. Records are written as they are published and made durable by group commit: a
+    background thread fsyncs whatever was appended at most every sync_interval seconds, so a crash loses at most
+    that window; sync() forces it. sync_interval=0 fsyncs every record before the write returns.
+    Once the log grows past compact_bytes the dict is written to the snapshot file and the log is truncated. That
+    happens on the thread whose write crossed the limit, under the dict's lock, so that write stalls for as long as
+    pickling and fsyncing the whole dict takes. To choose the moment, set compact_bytes beyond what the log will
+    reach and call ObservableDict.compact() when the dict is quiet. """
+
+    def __init__(self, path: str, sync_interval: float = 0.05, compact_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.snapshot_path = path + '.snapshot'
+        self.sync_interval = sync_interval
+        self.compact_bytes = compact_bytes
+        self._file = None
+        self._size = 0
+        self._unsynced = False
+        self._ioLock = threading.Lock()
+        self._wakeup = threading.Condition(self._ioLock)
+        self._closed = False
+        self._syncThread = None
+
+    def recover(self) -> dict:
+        """ Rebuilds the dict from the snapshot and the log and opens the log for appending. A torn or corrupt
+        tail left by a crash is cut off at the last complete record. Returns None when nothing was persisted """
+        state = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as snapshot:
+                state = pickle.load(snapshot)
+        if os.path.exists(self.path):
+            state = state if state is not None else {}
+            with open(self.path, 'r+b') as log:
+                end = self._replay(log, state)
+                log.truncate(end)
+        self._open()
+        return state
+
+    def append(self, change: CollectionChange) -> None:
+        """ Appends the change as one record """
+        payload = pickle.dumps(tuple(_operations(change)), pickle.HIGHEST_PROTOCOL)
+        frame = _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._ioLock:
+            self._file.write(frame)
+            self._size += len(frame)
+            if not self.sync_interval:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            elif not self._unsynced:
+                self._unsynced = True
+                self._wakeup.notify()
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._size >= self.compact_bytes
+
+    def compact(self, state: dict) -> None:
+        """ Writes state to the snapshot file and empties the log. The caller holds the dict lock so no change is
+        appended in between. A crash between the two steps replays the old log over the new snapshot, which ends
+        in the same state. """
+        temporary = self.snapshot_path + '.tmp'
+        with open(temporary, 'wb') as snapshot:
+            pickle.dump(state, snapshot, pickle.HIGHEST_PROTOCOL)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary, self.snapshot_path)
+        with self._ioLock:
+            self._file.flush()
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._size = 0
+            self._unsynced = False
+
+    def sync(self) -> None:
+        """ Blocks until every record appended so far is on disk """
+        with self._ioLock:
+            if self._file is None:
+                return
+            self._file.flush()
+            self._unsynced = False
+            fd = self._file.fileno()
+        os.fsync(fd)
+
+    def close(self) -> None:
+        """ Stops the sync thread, then syncs and closes the log """
+        if self._file is None:
+            return
+        with self._ioLock:
+            self._closed = True
+            self._wakeup.notify()
+        # joined first, so it cannot fsync a descriptor that is being closed
+        if self._syncThread is not None:
+            self._syncThread.join()
+            self._syncThread = None
+        self.sync()
+        with self._ioLock:
+            self._file.close()
+            self._file = None
+
+    # internal methods
+    def _open(self) -> None:
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+        self._closed = False
+        if self.sync_interval:
+            self._syncThread = threading.Thread(target=self._runSync, daemon=True, name='WriteAheadLog-sync')
+            self._syncThread.start()
+
+    def _runSync(self) -> None:
+        while True:
+            with self._ioLock:
+                while not self._unsynced and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                # let the records of concurrent writers pile up so they share one fsync
+                self._wakeup.wait_for(lambda: self._closed, self.sync_interval)
+            self.sync()
+
+    @staticmethod
+    def _replay(log, state: dict) -> int:
+        """ Applies every complete record of the log to state and returns the offset after the last one """
+        size = os.fstat(log.fileno()).st_size
+        if not size:
+            return 0
+        with mmap.mmap(log.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                position = 0
+                while position + _HEADER.size <= size:
+                    length, checksum = _HEADER.unpack_from(view, position)
+                    start = position + _HEADER.size
+                    if start + length > size:
+                        break
+                    with view[start:start + length] as payload:
+                        if zlib.crc32(payload) != checksum:
+                            break
+                        _apply(pickle.loads(payload), state)
+                    position = start + length
+            finally:
+                view.release()
+        return position
+
+
+def _operations(change: CollectionChange):
+    """ The key operations that redo a change of an ObservableDict """
+    action = change.Action
+    if action is CollectionChangeAction.ADD or action is CollectionChangeAction.REPLACE:
+        yield _SET, change.Key, change.Items
+    elif action is CollectionChangeAction.REMOVE:
+        yield _DELETE, change.Key
+    elif action is CollectionChangeAction.EXTEND:
+        items = change.Items
+        yield _UPDATE, items if type(items) is dict else dict(items.items())
+    elif action is CollectionChangeAction.CLEAR:
+        yield _CLEAR,
+    elif action is CollectionChangeAction.BATCH:
+        for item in change.Items:
+            yield from _operations(item)
+
+
+def _apply(operations: tuple, state: dict) -> None:
+    for operation in operations:
+        code = operation[0]
+        if code == _SET:
+            state[operation[1]] = operation[2]
+        elif code == _DELETE:
+            state.pop(operation[1], None)
+        elif code == _UPDATE:
+            state.update(operation[1])
+        else:
+            state.clear()
@@ -20,5 +20,6 @@ setuptools.setup(
         "License :: OSI Approved :: MIT License",
         "Development Status :: 3 - Alpha"
     ),
-    install_requires=['rx']
+    install_requires=['rx'],
+    extras_require={'numpy': ['numpy']}
 )
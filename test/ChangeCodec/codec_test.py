@@ -0,0 +1,111 @@
+import unittest
+
+from reactive.ObservableDict import ObservableDict
+from reactive.ObservableList import ObservableList
+from reactive.ObservableSet import ObservableSet
+from reactive.shared.ChangeCodec import ChangeCodec
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ChangeCodecTests(unittest.TestCase):
+
+    def roundtrip(self, change):
+        return ChangeCodec.decode(ChangeCodec.encode(change))
+
+    def test_fields_survive_roundtrip(self):
+        # arrange
+        change = CollectionChange.Remove(None, 'value', key=('k', 1), index=3, old_items=2.5).tagged(42)
+
+        # act
+        decoded = self.roundtrip(change)
+
+        # assert
+        self.assertEqual(change, decoded)
+        self.assertEqual((42, 3, ('k', 1)), (decoded.Sequence, decoded.Index, decoded.Key))
+
+    def test_values_keep_their_types(self):
+        # arrange
+        items = [None, True, False, -1, 2 ** 63 - 1, 2 ** 80, 1.5, 'text', 'ünï', b'\x00\xff', (1, 'a'), [2],
+                 {'k': [1, 2]}, {3, 4}, frozenset({5}), complex(1, 2)]
+
+        # act
+        decoded = self.roundtrip(CollectionChange.Extend(None, items, index=0)).Items
+
+        # assert
+        self.assertEqual(items, decoded)
+        self.assertEqual([type(item) for item in items], [type(item) for item in decoded])
+
+    def test_batch_items_are_nested_changes(self):
+        # arrange
+        batch = CollectionChange.Batch(None, (CollectionChange.Add(None, 1, index=0), CollectionChange.Clear(None)))
+
+        # act
+        decoded = self.roundtrip(batch)
+
+        # assert
+        self.assertEqual(CollectionChangeAction.BATCH, decoded.Action)
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.CLEAR],
+                         [change.Action for change in decoded.Items])
+        self.assertEqual(batch, decoded)
+
+    def test_decoded_changes_carry_given_source(self):
+        # arrange
+        source = ObservableList()
+
+        # act
+        decoded = ChangeCodec.decode(ChangeCodec.encode(CollectionChange.Add(None, 1)), source)
+
+        # assert
+        self.assertIs(source, decoded.Source)
+
+    def test_mappings_are_encoded_as_dicts(self):
+        # act
+        decoded = self.roundtrip(CollectionChange.Extend(None, ObservableDict({'a': 1})))
+
+        # assert
+        self.assertEqual({'a': 1}, decoded.Items)
+
+    def test_observable_set_changes_are_encoded_by_their_members(self):
+        # arrange
+        tags = ObservableSet({'a', 'b'})
+        changes = []
+        tags.when_collection_changes().subscribe(changes.append)
+
+        # act
+        tags.update(ObservableSet({'c'}))
+        tags.difference_update({'a'})
+        decoded = [self.roundtrip(change) for change in changes]
+
+        # assert
+        self.assertEqual({'c'}, decoded[0].Items)
+        self.assertEqual(({'b', 'c'}, {'a'}), (decoded[1].Items, decoded[1].OldItems))
+        self.assertEqual(ObservableList([1, 2]), ObservableList(self.roundtrip(
+            CollectionChange.Extend(None, ObservableList([1, 2]))).Items))
+
+    def test_frames_decode_incrementally_from_memoryview(self):
+        # arrange
+        changes = [CollectionChange.Add(None, i, index=i) for i in range(3)]
+        stream = memoryview(ChangeCodec.encode_batch(changes))
+
+        # act
+        first, end = ChangeCodec.decode_frames(stream[:len(stream) - 2])
+        rest, consumed = ChangeCodec.decode_frames(stream, offset=end)
+
+        # assert
+        self.assertEqual(changes[:2], first)
+        self.assertEqual(changes[2:], rest)
+        self.assertEqual(len(stream), consumed)
+        self.assertEqual(changes, ChangeCodec.decode_batch(stream))
+
+    def test_incomplete_buffer_is_rejected(self):
+        # arrange
+        frame = ChangeCodec.encode(CollectionChange.Add(None, 'x'))
+
+        # act & assert
+        self.assertRaises(ValueError, ChangeCodec.decode, frame[:-1])
+        self.assertRaises(ValueError, ChangeCodec.decode_batch, frame + frame[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import pickle
+import unittest
+
+from reactive.shared.CollectionChange import CollectionChange
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class CollectionChangeRecordTests(unittest.TestCase):
+
+    def test_factories_populate_source_action_and_items(self):
+        # arrange
+        source = object()
+
+        # act
+        change = CollectionChange.Add(source, 1)
+
+        # assert
+        self.assertIs(source, change.Source)
+        self.assertEqual(CollectionChangeAction.ADD, change.Action)
+        self.assertEqual(1, change.Items)
+        self.assertEqual((change.source, change.action, change.items), (change.Source, change.Action, change.Items))
+
+    def test_missing_items_default_to_empty_tuple(self):
+        # arrange & act
+        remove = CollectionChange.Remove(None)
+        clear = CollectionChange.Clear(None)
+        constructed = CollectionChange(action=CollectionChangeAction.ADD)
+
+        # assert
+        self.assertEqual((), remove.Items)
+        self.assertEqual((), clear.Items)
+        self.assertEqual((), constructed.Items)
+        self.assertEqual((), constructed.Source)
+
+    def test_change_is_immutable_and_has_no_instance_dict(self):
+        # arrange
+        change = CollectionChange.Extend(None, [1, 2])
+
+        # act & assert
+        with self.assertRaises(AttributeError):
+            change.items = [3]
+        with self.assertRaises(AttributeError):
+            change.extra = 1
+        self.assertFalse(hasattr(change, '__dict__'))
+
+    def test_change_survives_pickling(self):
+        # arrange
+        change = CollectionChange.Remove('source', 3)
+
+        # act
+        restored = pickle.loads(pickle.dumps(change))
+
+        # assert
+        self.assertIsInstance(restored, CollectionChange)
+        self.assertEqual(change, restored)
+
+    def test_tagged_copies_change_with_sequence(self):
+        # arrange
+        change = CollectionChange.Add('source', 1, index=0)
+
+        # act
+        tagged = change.tagged(7)
+
+        # assert
+        self.assertIsNone(change.Sequence)
+        self.assertEqual(7, tagged.Sequence)
+        self.assertEqual(change[:6], tagged[:6])
+        self.assertEqual(tagged, pickle.loads(pickle.dumps(tagged)))
@@ -0,0 +1,158 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from reactive.DictReplication import ReplicationLeader, ReplicationFollower
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('condition not met within {}s'.format(timeout))
+        time.sleep(0.01)
+
+
+class DictReplicationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = ObservableDict({'a': 1, 'b': 2}, journal_size=1000)
+        self.leader = ReplicationLeader(self.source, os.path.join(self.directory, 'leader.sock'),
+                                        heartbeat_interval=0.05)
+        self.followers = []
+
+    def tearDown(self):
+        for follower in self.followers:
+            follower.close()
+        self.leader.close()
+        shutil.rmtree(self.directory)
+
+    def follow(self, address=None, **kwargs):
+        follower = ReplicationFollower(address or self.leader.address, reconnect_interval=0.05, **kwargs)
+        self.followers.append(follower)
+        self.assertTrue(follower.wait_synced(5))
+        return follower
+
+    def test_follower_starts_from_snapshot(self):
+        # act
+        follower = self.follow()
+
+        # assert
+        self.assertEqual(self.source, follower.dict)
+
+    def test_follower_applies_changes_and_republishes_them(self):
+        # arrange
+        follower = self.follow()
+        received = []
+        follower.dict.when_collection_changes().subscribe(lambda change: received.append(change.Action))
+
+        # act
+        self.source.setdefault('c', 3)
+        self.source.update({'a': 10, 'd': 4})
+        del self.source['b']
+        with self.source.batch():
+            self.source.setdefault('e', 5)
+            self.source.pop('c')
+        wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+        # assert
+        self.assertEqual(self.source, follower.dict)
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.EXTEND, CollectionChangeAction.REMOVE,
+                          CollectionChangeAction.BATCH], received)
+
+    def test_follower_applies_keyed_writes(self):
+        # arrange
+        follower = self.follow()
+
+        # act
+        self.source['a'] = 10
+        self.source.set_many({'b': 20, 'c': 30})
+        self.source.delete_many(['a', 'c'])
+        wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+        # assert
+        self.assertEqual(ObservableDict({'b': 20}), follower.dict)
+
+    def test_batch_starting_with_clear_is_an_ordinary_change(self):
+        # arrange
+        follower = self.follow()
+        received = []
+        follower.dict.when_collection_changes().subscribe(received.append)
+
+        # act
+        with self.source.batch():
+            self.source.clear()
+            self.source.setdefault('x', 1)
+        wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+        # assert
+        self.assertEqual(ObservableDict({'x': 1}), follower.dict)
+        self.assertEqual([CollectionChangeAction.BATCH], [change.Action for change in received])
+
+    def test_follower_resumes_after_reconnect(self):
+        # arrange
+        follower = self.follow()
+        self.source.setdefault('c', 3)
+        wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+        # act
+        follower._connection.shutdown(2)
+        self.source.setdefault('d', 4)
+        self.source.clear()
+        self.source.setdefault('z', 26)
+        wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+        # assert
+        self.assertEqual(ObservableDict({'z': 26}), follower.dict)
+
+    def test_source_error_after_resume_closes_the_connection(self):
+        # arrange
+        follower = self.follow()
+        follower._connection.shutdown(2)
+        self.source.setdefault('c', 3)
+        wait_until(lambda: follower.applied_sequence == self.source.sequence and self.leader.follower_count == 1)
+        resumed = follower._connection
+
+        # act
+        self.source.pop('missing')
+
+        # assert
+        wait_until(lambda: follower._connection is not resumed)
+
+    def test_heartbeats_report_lag(self):
+        # arrange
+        follower = self.follow()
+
+        # act
+        self.source.setdefault('c', 3)
+        wait_until(lambda: follower.leader_sequence == self.source.sequence and follower.lag == 0)
+
+        # assert
+        self.assertEqual(0, follower.lag)
+        self.assertLess(follower.lag_seconds, 5)
+
+    def test_replication_over_tcp(self):
+        # arrange
+        leader = ReplicationLeader(self.source, ('127.0.0.1', 0))
+
+        try:
+            # act
+            follower = self.follow(leader.address)
+            for i in range(500):
+                self.source.setdefault(i, str(i))
+            wait_until(lambda: follower.applied_sequence == self.source.sequence)
+
+            # assert
+            self.assertEqual(self.source, follower.dict)
+            self.assertEqual(1, leader.follower_count)
+        finally:
+            leader.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
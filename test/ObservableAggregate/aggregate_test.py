@@ -0,0 +1,150 @@
+import random
+import threading
+import unittest
+
+from reactive.ObservableAggregate import CountAggregate, SumAggregate, MeanAggregate, MinAggregate, MaxAggregate
+from reactive.ObservableDict import ObservableDict
+from reactive.ObservableList import ObservableList
+from reactive.ObservableSet import ObservableSet
+from reactive.shared.DispatchMode import DispatchMode
+
+
+class ObservableAggregateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([4, 1, 7, 3])
+
+    def test_aggregates_start_from_current_contents(self):
+        # arrange & act & assert
+        self.assertEqual(4, CountAggregate(self.ol).value)
+        self.assertEqual(15, SumAggregate(self.ol).value)
+        self.assertEqual(3.75, MeanAggregate(self.ol).value)
+        self.assertEqual(1, MinAggregate(self.ol).value)
+        self.assertEqual(7, MaxAggregate(self.ol).value)
+
+    def test_aggregates_follow_list_mutations(self):
+        # arrange
+        aggregates = [CountAggregate(self.ol), SumAggregate(self.ol), MinAggregate(self.ol), MaxAggregate(self.ol)]
+
+        # act
+        self.ol.append(10)
+        self.ol.remove(1)
+        self.ol.extend([-2, 8])
+        self.ol.pop()
+        self.ol.sort()
+
+        # assert
+        values = list(self.ol)
+        self.assertEqual([len(values), sum(values), min(values), max(values)], [a.value for a in aggregates])
+
+    def test_changes_queued_before_creation_are_not_counted_twice(self):
+        # arrange
+        ol = ObservableList([1], dispatch=DispatchMode.THREAD)
+        release = threading.Event()
+        ol.when_collection_changes().subscribe(lambda _: release.wait(1))
+        ol.append(2)
+        ol.append(3)
+
+        # act
+        count, total = CountAggregate(ol), SumAggregate(ol)
+        ol.append(4)
+        release.set()
+        ol.flush_notifications()
+
+        # assert
+        self.assertEqual((4, 10), (count.value, total.value))
+        ol.dispose()
+
+    def test_aggregate_publishes_only_when_value_changes(self):
+        # arrange
+        maximum = MaxAggregate(self.ol)
+        published = []
+        maximum.when_value_changes().subscribe(published.append)
+
+        # act
+        self.ol.append(2)
+        self.ol.append(9)
+        self.ol.remove(4)
+        self.ol.remove(9)
+
+        # assert
+        self.assertEqual([9, 7], published)
+
+    def test_empty_collection_yields_none_for_mean_min_and_max(self):
+        # arrange
+        mean, minimum, maximum = MeanAggregate(self.ol), MinAggregate(self.ol), MaxAggregate(self.ol)
+
+        # act
+        self.ol.clear()
+
+        # assert
+        self.assertEqual([None, None, None], [mean.value, minimum.value, maximum.value])
+
+    def test_selector_maps_values_before_aggregating(self):
+        # arrange
+        total = SumAggregate(self.ol, lambda x: x * 10)
+
+        # act
+        self.ol.append(1)
+
+        # assert
+        self.assertEqual(160, total.value)
+
+    def test_min_and_max_survive_random_mutations(self):
+        # arrange
+        rng = random.Random(7)
+        minimum, maximum = MinAggregate(self.ol), MaxAggregate(self.ol)
+
+        # act & assert
+        for _ in range(500):
+            if self.ol and rng.random() < 0.5:
+                self.ol.pop(rng.randrange(len(self.ol)))
+            else:
+                self.ol.append(rng.randrange(50))
+            self.assertEqual(min(self.ol, default=None), minimum.value)
+            self.assertEqual(max(self.ol, default=None), maximum.value)
+
+    def test_aggregates_over_dictionary_values(self):
+        # arrange
+        od = ObservableDict({'a': 1, 'b': 5})
+        total, maximum = SumAggregate(od), MaxAggregate(od)
+
+        # act
+        od.update({'a': 10, 'c': 2})
+        del od['b']
+        od.setdefault('d', 4)
+        od.popitem()
+        od.pop('zz', 0)
+
+        # assert
+        self.assertEqual(sum(od.values()), total.value)
+        self.assertEqual(max(od.values()), maximum.value)
+
+    def test_aggregates_over_set_reread_on_bulk_updates(self):
+        # arrange
+        os = ObservableSet({1, 2})
+        total = SumAggregate(os)
+
+        # act
+        os.add(2)
+        os.update([2, 3, 4])
+        os.discard(1)
+        os.difference_update({4})
+
+        # assert
+        self.assertEqual(5, total.value)
+
+    def test_disposed_aggregate_detaches_from_source(self):
+        # arrange
+        total = SumAggregate(self.ol)
+
+        # act
+        total.dispose()
+        self.ol.append(100)
+
+        # assert
+        self.assertEqual(15, total.value)
+        self.assertEqual(0, self.ol._observerCount)
+
+    def tearDown(self):
+        self.ol.dispose()
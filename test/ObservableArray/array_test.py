@@ -0,0 +1,137 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableAggregate import SumAggregate
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+try:
+    import numpy as np
+    from reactive.ObservableArray import ObservableArray
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class ObservableArrayTests(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = ObservableArray([1.0, 2.0, 3.0, 4.0], capacity=4)
+        self.scheduler = TestScheduler()
+        self.obs = self.scheduler.create_observer()
+
+    def change(self, i=0):
+        return self.obs.messages[i].value.value
+
+    def test_elements_are_stored_unboxed(self):
+        # assert
+        self.assertEqual(np.float64, self.arr.dtype)
+        self.assertEqual(8, self.arr.values.itemsize)
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], list(self.arr))
+
+    def test_extend_grows_buffer_and_publishes_one_range_event(self):
+        # arrange
+        self.arr.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.arr.extend(np.arange(10))
+
+        # assert
+        self.assertEqual(14, len(self.arr))
+        self.assertGreaterEqual(self.arr.capacity, 14)
+        self.assertEqual(1, len(self.obs.messages))
+        self.assertEqual(CollectionChangeAction.EXTEND, self.change().Action)
+        self.assertEqual(4, self.change().Index)
+        self.assertEqual(list(range(10)), self.change().Items.tolist())
+        self.assertFalse(self.change().Items.flags.writeable)
+
+    def test_slice_assignment_publishes_replace_with_old_values(self):
+        # arrange
+        self.arr.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.arr[1:3] = [20.0, 30.0]
+
+        # assert
+        self.assertEqual([1.0, 20.0, 30.0, 4.0], list(self.arr))
+        self.assertEqual(CollectionChangeAction.REPLACE, self.change().Action)
+        self.assertEqual(1, self.change().Index)
+        self.assertEqual([20.0, 30.0], self.change().Items.tolist())
+        self.assertEqual([2.0, 3.0], self.change().OldItems.tolist())
+
+    def test_masked_update_publishes_span_of_written_elements(self):
+        # arrange
+        self.arr.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.arr[self.arr.values < 3] = 0.0
+
+        # assert
+        self.assertEqual([0.0, 0.0, 3.0, 4.0], list(self.arr))
+        self.assertEqual(1, len(self.obs.messages))
+        self.assertEqual(0, self.change().Index)
+        self.assertEqual([1.0, 2.0], self.change().OldItems.tolist())
+
+    def test_stepped_slice_and_empty_mask(self):
+        # arrange
+        self.arr.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.arr[::-2] = [40.0, 20.0]
+        self.arr[self.arr.values > 100] = 1.0
+
+        # assert
+        self.assertEqual([1.0, 20.0, 3.0, 40.0], list(self.arr))
+        self.assertEqual(1, len(self.obs.messages))
+        self.assertEqual((1, [20.0, 3.0, 40.0]), (self.change().Index, self.change().Items.tolist()))
+
+    def test_append_and_pop(self):
+        # arrange
+        self.arr.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.arr.append(5)
+        popped = self.arr.pop()
+
+        # assert
+        self.assertEqual(5.0, popped)
+        self.assertEqual([(CollectionChangeAction.ADD, 4), (CollectionChangeAction.REMOVE, 4)],
+                         [(m.value.value.Action, m.value.value.Index) for m in self.obs.messages])
+
+    def test_aggregates_follow_range_events(self):
+        # arrange
+        total = SumAggregate(self.arr)
+
+        # act
+        self.arr[1:3] = [10.0, 10.0]
+        self.arr.extend([1.0, 1.0])
+
+        # assert
+        self.assertEqual(27.0, total.value)
+
+    def test_values_are_read_only_and_to_numpy_copies(self):
+        # act
+        copy = self.arr.to_numpy()
+        copy[0] = 100.0
+
+        # assert
+        self.assertEqual(1.0, self.arr[0])
+        with self.assertRaises(ValueError):
+            self.arr.values[0] = 100.0
+
+    def test_array_protocol_honours_copy(self):
+        # act
+        view = self.arr.__array__()
+        copy = self.arr.__array__(copy=True)
+        copy[0] = 100.0
+
+        # assert
+        self.assertFalse(view.flags.writeable)
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], list(np.asarray(self.arr)))
+        self.assertEqual(1.0, self.arr[0])
+        self.assertEqual(np.int64, self.arr.__array__(np.int64, copy=True).dtype)
+        self.assertRaises(ValueError, self.arr.__array__, copy=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
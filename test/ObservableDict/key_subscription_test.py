@@ -0,0 +1,103 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableDictKeySubscriptionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.od = ObservableDict({1: 'Crash', 2: 'Coco', 3: 'Pura', 4: 'Tiny'})
+        self.scheduler = TestScheduler()
+
+    def test_key_observer_receives_only_changes_to_its_key(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.od.when_key_changes(2) \
+            .subscribe(obs)
+
+        # act
+        self.od.pop(1)
+        self.od.pop(2)
+        del self.od[3]
+        self.od.setdefault(2, 'Polar')
+
+        # assert
+        self.assertEqual([(CollectionChangeAction.REMOVE, 'Coco'), (CollectionChangeAction.ADD, 'Polar')],
+                         [(m.value.value.Action, m.value.value.Items) for m in obs.messages])
+        self.assertTrue(all(m.value.value.Key == 2 for m in obs.messages))
+
+    def test_update_notifies_each_written_key_once(self):
+        # arrange
+        two = self.scheduler.create_observer()
+        five = self.scheduler.create_observer()
+        four = self.scheduler.create_observer()
+        self.od.when_key_changes(2).subscribe(two)
+        self.od.when_key_changes(5).subscribe(five)
+        self.od.when_key_changes(4).subscribe(four)
+
+        # act
+        self.od.update({2: 'Polar', 5: 'Dingo'})
+
+        # assert
+        self.assertEqual(['Polar'], [m.value.value.Items for m in two.messages])
+        self.assertEqual(['Dingo'], [m.value.value.Items for m in five.messages])
+        self.assertEqual([], four.messages)
+
+    def test_update_with_pairs_is_routed_by_key(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.od.when_key_changes(1).subscribe(obs)
+
+        # act
+        self.od.update(pair for pair in [(1, 'Aku'), (9, 'Uka')])
+
+        # assert
+        self.assertEqual(['Aku'], [m.value.value.Items for m in obs.messages])
+        self.assertEqual('Uka', self.od[9])
+
+    def test_clear_and_popitem_reach_key_observers(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.od.when_key_changes(4).subscribe(obs)
+
+        # act
+        self.od.popitem()
+        self.od.clear()
+
+        # assert
+        self.assertEqual([CollectionChangeAction.REMOVE, CollectionChangeAction.CLEAR],
+                         [m.value.value.Action for m in obs.messages])
+
+    def test_disposed_key_subscription_is_dropped_from_the_index(self):
+        # arrange
+        first = self.od.when_key_changes(1).subscribe(lambda x: x)
+        second = self.od.when_key_changes(1).subscribe(lambda x: x)
+
+        # act
+        first.dispose()
+        remaining = len(self.od._keyObservers[1])
+        second.dispose()
+
+        # assert
+        self.assertEqual(1, remaining)
+        self.assertEqual({}, self.od._keyObservers)
+        self.assertEqual(0, self.od._observerCount)
+
+    def test_batched_changes_are_routed_by_key(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.od.when_key_changes(3).subscribe(obs)
+
+        # act
+        with self.od.batch():
+            self.od.pop(1)
+            self.od.pop(3)
+
+        # assert
+        self.assertEqual(['Pura'], [m.value.value.Items for m in obs.messages])
+
+    def tearDown(self):
+        self.od.dispose()
@@ -0,0 +1,104 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableAggregate import SumAggregate
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableDictKeyedWriteTests(unittest.TestCase):
+
+    def setUp(self):
+        self.od = ObservableDict({1: 'Crash', 2: 'Coco'})
+        self.obs = TestScheduler().create_observer()
+
+    def test_setitem_publishes_add_for_a_new_key_and_replace_for_an_existing_one(self):
+        # arrange
+        self.od.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.od[3] = 'Pura'
+        self.od[1] = 'Cortex'
+
+        # assert
+        added, replaced = [m.value.value for m in self.obs.messages]
+        self.assertEqual((CollectionChangeAction.ADD, 3, 'Pura'), (added.Action, added.Key, added.Items))
+        self.assertEqual((CollectionChangeAction.REPLACE, 1, 'Cortex', 'Crash'),
+                         (replaced.Action, replaced.Key, replaced.Items, replaced.OldItems))
+        self.assertEqual(1, replaced.Count)
+        self.assertEqual('Cortex', self.od[1])
+
+    def test_set_many_publishes_one_extend_with_the_replaced_values(self):
+        # arrange
+        self.od.when_collection_changes().subscribe(self.obs)
+
+        # act
+        self.od.set_many({2: 'Tawna', 3: 'Pura', 4: 'Tiny'})
+
+        # assert
+        self.assertEqual(1, len(self.obs.messages))
+        change = self.obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.EXTEND, change.Action)
+        self.assertEqual({2: 'Tawna', 3: 'Pura', 4: 'Tiny'}, change.Items)
+        self.assertEqual({2: 'Coco'}, change.OldItems)
+        self.assertEqual(ObservableDict({1: 'Crash', 2: 'Tawna', 3: 'Pura', 4: 'Tiny'}), self.od)
+
+    def test_delete_many_publishes_one_batch_and_skips_missing_keys(self):
+        # arrange
+        self.od.when_collection_changes().subscribe(self.obs)
+
+        # act
+        count = self.od.delete_many([1, 5, 2])
+
+        # assert
+        self.assertEqual(2, count)
+        self.assertEqual(0, len(self.od))
+        self.assertEqual(1, len(self.obs.messages))
+        batch = self.obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.BATCH, batch.Action)
+        self.assertEqual([(1, 'Crash'), (2, 'Coco')], [(change.Key, change.OldItems) for change in batch.Items])
+
+    def test_delete_many_without_matches_publishes_nothing(self):
+        # arrange
+        self.od.when_collection_changes().subscribe(self.obs)
+
+        # act
+        count = self.od.delete_many([7, 8])
+
+        # assert
+        self.assertEqual(0, count)
+        self.assertEqual([], self.obs.messages)
+
+    def test_set_many_reaches_key_observers_like_setitem(self):
+        # arrange
+        od = ObservableDict({1: 'Crash', 2: 'Coco'}, journal_size=8)
+        new = TestScheduler().create_observer()
+        od.when_key_changes(1).subscribe(self.obs)
+        od.when_key_changes(3).subscribe(new)
+
+        # act
+        od.set_many({1: 'Cortex', 3: 'Pura'})
+
+        # assert
+        replaced = self.obs.messages[0].value.value
+        self.assertEqual((CollectionChangeAction.REPLACE, 1, 'Cortex', 'Crash', 1),
+                         (replaced.Action, replaced.Key, replaced.Items, replaced.OldItems, replaced.Sequence))
+        added = new.messages[0].value.value
+        self.assertEqual((CollectionChangeAction.ADD, 'Pura', None), (added.Action, added.Items, added.OldItems))
+
+    def test_keyed_writes_reach_key_observers_and_aggregates(self):
+        # arrange
+        numbers = ObservableDict({'a': 1, 'b': 2})
+        total = SumAggregate(numbers)
+        numbers.when_key_changes('a').subscribe(self.obs)
+
+        # act
+        numbers['a'] = 10
+        numbers.set_many({'b': 20, 'c': 30})
+        numbers.delete_many(['c'])
+
+        # assert
+        self.assertEqual([(CollectionChangeAction.REPLACE, 10)],
+                         [(m.value.value.Action, m.value.value.Items) for m in self.obs.messages])
+        self.assertEqual(30, total.value)
@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.DispatchMode import DispatchMode
+from reactive.shared.ReaderWriterLock import ReaderWriterLock
+
+
+def _in_thread(fn):
+    result = []
+    worker = threading.Thread(target=lambda: result.append(fn()))
+    worker.start()
+    worker.join()
+    return result[0]
+
+
+class ObservableDictLockTests(unittest.TestCase):
+
+    def setUp(self):
+        self.od = ObservableDict({1: 'Crash', 2: 'Coco'}, lock=ReaderWriterLock())
+
+    def test_default_lock_serves_readers_and_writers(self):
+        # arrange & act
+        od = ObservableDict({1: 'Crash'})
+
+        # assert
+        self.assertIs(od.lock, od.read_lock)
+        od.dispose()
+
+    def test_readers_proceed_while_another_reader_holds_the_lock(self):
+        # arrange & act
+        with self.od.read_lock:
+            value = _in_thread(lambda: self.od[2])
+
+        # assert
+        self.assertEqual('Coco', value)
+
+    def test_writers_are_excluded_while_a_reader_holds_the_lock(self):
+        # arrange & act
+        with self.od.read_lock:
+            acquired = _in_thread(lambda: self.od.lock.acquire(blocking=False))
+
+        # assert
+        self.assertFalse(acquired)
+
+    def test_readers_are_excluded_while_a_writer_holds_the_lock(self):
+        # arrange & act
+        with self.od.lock:
+            acquired = _in_thread(lambda: self.od.read_lock.acquire(blocking=False))
+
+        # assert
+        self.assertFalse(acquired)
+
+    def test_writer_can_read_and_reenter(self):
+        # arrange
+        seen = []
+        self.od.when_collection_changes().subscribe(lambda x: seen.append(self.od.get(5)))
+
+        # act
+        with self.od.lock:
+            self.od.update({5: 'Dingo'})
+
+        # assert
+        self.assertEqual(['Dingo'], seen)
+
+    def test_reader_cannot_upgrade_to_writer(self):
+        # arrange & act & assert
+        with self.od.read_lock:
+            with self.assertRaises(RuntimeError):
+                self.od.lock.acquire()
+
+    def test_readers_held_back_by_a_writer_that_times_out_proceed(self):
+        # arrange
+        lock = self.od.lock
+        writer = threading.Thread(target=lambda: lock.acquire(timeout=0.1))
+
+        # act
+        with self.od.read_lock:
+            writer.start()
+            while not lock._waitingWriters:
+                time.sleep(0.001)
+            started = time.perf_counter()
+            acquired = _in_thread(lambda: lock.acquire_read(timeout=2) and lock.release_read() is None)
+            waited = time.perf_counter() - started
+            writer.join()
+
+        # assert
+        self.assertTrue(acquired)
+        self.assertLess(waited, 1)
+
+    def test_reader_writer_lock_with_deferred_dispatch(self):
+        # arrange
+        od = ObservableDict({1: 'Crash'}, lock=ReaderWriterLock(), dispatch=DispatchMode.DEFERRED)
+        seen = []
+        od.when_collection_changes().subscribe(lambda x: seen.append(od[1]))
+
+        # act
+        od.update({1: 'Coco'})
+
+        # assert
+        self.assertEqual(['Coco'], seen)
+        od.dispose()
+
+    def tearDown(self):
+        self.od.dispose()
@@ -169,6 +169,67 @@ class RxNotificationObservableDictTest(unittest.TestCase):
         self.assertEqual(obs.messages[0].value.value.Items, ())
         self.assertEqual(obs.messages[0].value.value.Action, CollectionChangeAction.CLEAR)
 
+    def test_ObservableDict_batch_publishes_single_batch_event(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+
+        self.od.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.od.batch():
+            self.od.pop(1)
+            self.od.setdefault(5, 'Dingo')
+
+        # assert
+        self.assertEqual(len(obs.messages), 1)
+        self.assertEqual(obs.messages[0].value.value.Action, CollectionChangeAction.BATCH)
+        self.assertEqual([c.Items for c in obs.messages[0].value.value.Items], ['Crash', 'Dingo'])
+
+    def test_ObservableDict_removals_and_overwrites_carry_old_values(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+
+        self.od.when_collection_changes() \
+            .map(lambda x: x.OldItems) \
+            .subscribe(obs)
+
+        # act
+        del self.od[1]
+        self.od.pop(2)
+        self.od.update({3: 'Polar', 5: 'Dingo'})
+
+        # assert
+        self.assertEqual([m.value.value for m in obs.messages], ['Crash', 'Coco', {3: 'Pura'}])
+
+    def test_ObservableDict_pop_with_default_for_missing_key_publishes_nothing(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+
+        self.od.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        result = self.od.pop(5, 'Dingo')
+
+        # assert
+        self.assertEqual(result, 'Dingo')
+        self.assertEqual(obs.messages, [])
+
+    def test_ObservableDict_setdefault_with_existing_equal_value_publishes_nothing(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+
+        self.od.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        result = self.od.setdefault(2, 'Coco')
+
+        # assert
+        self.assertEqual(result, 'Coco')
+        self.assertEqual(obs.messages, [])
+
     def test_ObservableSet_with_any_operation_after_dispose_throws_DisposedException(self):
         # arrange
         obs = self.scheduler.create_observer()
@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from reactive.ObservableDict import ObservableDict
+from reactive.shared.WriteAheadLog import WriteAheadLog
+
+
+class WriteAheadLogTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'dict.wal')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def reopen(self, **kwargs):
+        return ObservableDict(wal=WriteAheadLog(self.path, **kwargs))
+
+    def test_changes_survive_reopening(self):
+        # arrange
+        od = ObservableDict({'seed': 0}, wal=WriteAheadLog(self.path))
+
+        # act
+        od.setdefault('a', 1)
+        od.update({'b': 2, 'c': 3})
+        od.pop('c')
+        del od['seed']
+        with od.batch():
+            od.setdefault('d', 4)
+            od.popitem()
+        od.dispose()
+
+        # assert
+        self.assertEqual(ObservableDict({'a': 1, 'b': 2}), self.reopen())
+
+    def test_clear_is_replayed(self):
+        # arrange
+        od = self.reopen(sync_interval=0)
+        od.update({'a': 1})
+
+        # act
+        od.clear()
+        od.setdefault('b', 2)
+        od.wal.close()
+
+        # assert
+        self.assertEqual(ObservableDict({'b': 2}), self.reopen())
+
+    def test_keyed_writes_are_replayed(self):
+        # arrange
+        od = self.reopen()
+
+        # act
+        od['a'] = 1
+        od['a'] = 2
+        od.set_many({'b': 3, 'c': 4})
+        od.delete_many(['b', 'x'])
+        od.dispose()
+
+        # assert
+        self.assertEqual(ObservableDict({'a': 2, 'c': 4}), self.reopen())
+
+    def test_torn_tail_is_discarded(self):
+        # arrange
+        od = self.reopen()
+        od.setdefault('a', 1)
+        od.setdefault('b', 2)
+        od.dispose()
+        size = os.path.getsize(self.path)
+
+        # act
+        with open(self.path, 'r+b') as log:
+            log.truncate(size - 3)
+        recovered = self.reopen()
+        recovered.setdefault('c', 3)
+        recovered.dispose()
+
+        # assert
+        self.assertEqual(ObservableDict({'a': 1, 'c': 3}), self.reopen())
+
+    def test_compaction_moves_state_to_snapshot(self):
+        # arrange
+        od = self.reopen(compact_bytes=256)
+
+        # act
+        for i in range(50):
+            od.setdefault(i, 'x' * 10)
+        od.dispose()
+
+        # assert
+        self.assertTrue(os.path.exists(self.path + '.snapshot'))
+        self.assertLess(os.path.getsize(self.path), 256)
+        self.assertEqual(ObservableDict({i: 'x' * 10 for i in range(50)}), self.reopen())
+
+    def test_explicit_compact_empties_log(self):
+        # arrange
+        od = self.reopen()
+        od.update({i: i for i in range(10)})
+
+        # act
+        od.compact()
+        od.setdefault('after', True)
+        od.dispose()
+
+        # assert
+        expected = {i: i for i in range(10)}
+        expected['after'] = True
+        self.assertEqual(ObservableDict(expected), self.reopen())
+
+    def test_close_stops_the_sync_thread(self):
+        # arrange
+        wal = WriteAheadLog(self.path)
+        od = ObservableDict(wal=wal)
+        od.setdefault('a', 1)
+        sync_thread = wal._syncThread
+
+        # act
+        od.dispose()
+
+        # assert
+        self.assertFalse(sync_thread.is_alive())
+        self.assertEqual({'a': 1}, wal.recover())
+        self.assertTrue(wal._syncThread.is_alive())
+        wal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
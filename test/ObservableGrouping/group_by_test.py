@@ -0,0 +1,171 @@
+import threading
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableDict import ObservableDict
+from reactive.ObservableList import ObservableList
+from reactive.ObservableSet import ObservableSet
+from reactive.ObservableGrouping import ObservableGrouping
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.shared.DispatchMode import DispatchMode
+
+
+class ObservableGroupingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.orders = ObservableList([('AAPL', 10), ('MSFT', 5), ('AAPL', 3)])
+        self.scheduler = TestScheduler()
+
+    def test_group_by_starts_from_current_contents(self):
+        # arrange & act
+        groups = self.orders.group_by(lambda order: order[0])
+
+        # assert
+        self.assertEqual({'AAPL', 'MSFT'}, set(groups))
+        self.assertEqual(ObservableList([('AAPL', 10), ('AAPL', 3)]), groups['AAPL'])
+        self.assertEqual(ObservableList([('MSFT', 5)]), groups['MSFT'])
+
+    def test_groups_are_created_and_dropped(self):
+        # arrange
+        groups = self.orders.group_by(lambda order: order[0])
+        obs = self.scheduler.create_observer()
+        groups.when_collection_changes().subscribe(obs)
+
+        # act
+        self.orders.append(('GOOG', 1))
+        self.orders.remove(('MSFT', 5))
+
+        # assert
+        self.assertEqual({'AAPL', 'GOOG'}, set(groups))
+        self.assertEqual((CollectionChangeAction.ADD, 'GOOG'),
+                         (obs.messages[0].value.value.Action, obs.messages[0].value.value.Key))
+        self.assertEqual((CollectionChangeAction.REMOVE, 'MSFT'),
+                         (obs.messages[1].value.value.Action, obs.messages[1].value.value.Key))
+
+    def test_batch_applies_its_changes_in_order(self):
+        # arrange
+        numbers = ObservableList([5])
+        groups = numbers.group_by(lambda x: x % 3)
+        od = ObservableDict({'a': 1})
+        values = od.group_by(lambda x: x % 2)
+
+        # act
+        with numbers.batch():
+            numbers.append(0)
+            numbers.pop()
+        with od.batch():
+            od['b'] = 2
+            od.pop('b')
+
+        # assert
+        self.assertEqual({2}, set(groups))
+        self.assertEqual(ObservableList([5]), groups[2])
+        self.assertEqual({1}, set(values))
+
+    def test_emptied_group_list_publishes_the_removal(self):
+        # arrange
+        groups = self.orders.group_by(lambda order: order[0])
+        msft = groups['MSFT']
+        obs = self.scheduler.create_observer()
+        msft.when_collection_changes().subscribe(obs)
+
+        # act
+        self.orders.remove(('MSFT', 5))
+
+        # assert
+        self.assertNotIn('MSFT', groups)
+        self.assertEqual(0, len(msft))
+        self.assertEqual([CollectionChangeAction.REMOVE], [m.value.value.Action for m in obs.messages])
+
+    def test_group_lists_publish_their_own_changes(self):
+        # arrange
+        groups = self.orders.group_by(lambda order: order[0])
+        group_obs = self.scheduler.create_observer()
+        groups_obs = self.scheduler.create_observer()
+        groups['AAPL'].when_collection_changes().subscribe(group_obs)
+        groups.when_collection_changes().subscribe(groups_obs)
+
+        # act
+        self.orders.extend([('AAPL', 7), ('AAPL', 8)])
+        self.orders.pop(0)
+
+        # assert
+        self.assertEqual(ObservableList([('AAPL', 3), ('AAPL', 7), ('AAPL', 8)]), groups['AAPL'])
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.ADD, CollectionChangeAction.REMOVE],
+                         [m.value.value.Action for m in group_obs.messages])
+        self.assertEqual(0, len(groups_obs.messages))
+
+    def test_key_function_runs_only_for_changed_elements(self):
+        # arrange
+        calls = []
+        self.orders.group_by(lambda order: calls.append(order) or order[0])
+        del calls[:]
+
+        # act
+        self.orders.append(('IBM', 2))
+        self.orders.sort()
+
+        # assert
+        self.assertEqual([('IBM', 2)], calls)
+
+    def test_group_by_dict_values(self):
+        # arrange
+        od = ObservableDict({'a': 1, 'b': 2, 'c': 3})
+        groups = od.group_by(lambda value: value % 2)
+
+        # act
+        od.update({'a': 2, 'd': 5})
+        del od['b']
+
+        # assert
+        self.assertEqual(ObservableList([3, 5]), groups[1])
+        self.assertEqual(ObservableList([2]), groups[0])
+
+    def test_clear_regroups_in_full(self):
+        # arrange
+        source = ObservableSet({1, 2, 3})
+        groups = ObservableGrouping(source, lambda value: value > 1)
+
+        # act
+        source.update({4})
+        source.clear()
+
+        # assert
+        self.assertEqual(0, len(groups))
+
+    def test_changes_queued_before_creation_are_not_grouped_twice(self):
+        # arrange
+        orders = ObservableList([('AAPL', 10)], dispatch=DispatchMode.THREAD)
+        release = threading.Event()
+        orders.when_collection_changes().subscribe(lambda _: release.wait(1))
+        orders.append(('MSFT', 5))
+        orders.append(('AAPL', 3))
+
+        # act
+        groups = orders.group_by(lambda order: order[0])
+        orders.append(('MSFT', 1))
+        release.set()
+        orders.flush_notifications()
+
+        # assert
+        self.assertEqual(ObservableList([('AAPL', 10), ('AAPL', 3)]), groups['AAPL'])
+        self.assertEqual(ObservableList([('MSFT', 5), ('MSFT', 1)]), groups['MSFT'])
+        orders.dispose()
+
+    def test_dispose_detaches_from_source(self):
+        # arrange
+        groups = self.orders.group_by(lambda order: order[0])
+        aapl = groups['AAPL']
+
+        # act
+        groups.dispose()
+        self.orders.append(('AAPL', 1))
+
+        # assert
+        self.assertTrue(groups.is_disposed)
+        self.assertEqual(2, len(aapl))
+
+
+if __name__ == '__main__':
+    unittest.main()
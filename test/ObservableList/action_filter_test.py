@@ -0,0 +1,89 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.ObservableList import ObservableList
+
+
+class ObservableListActionFilterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([1, 2, 3, 4])
+        self.scheduler = TestScheduler()
+
+    def test_filtered_observer_receives_only_requested_actions(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes(actions={CollectionChangeAction.REMOVE, CollectionChangeAction.CLEAR}) \
+            .map(lambda x: x.Action) \
+            .subscribe(obs)
+
+        # act
+        self.ol.append(5)
+        self.ol.remove(1)
+        self.ol.extend([6])
+        self.ol.clear()
+
+        # assert
+        self.assertEqual([CollectionChangeAction.REMOVE, CollectionChangeAction.CLEAR],
+                         [m.value.value for m in obs.messages])
+
+    def test_filtered_and_unfiltered_observers_coexist(self):
+        # arrange
+        everything = self.scheduler.create_observer()
+        adds = self.scheduler.create_observer()
+        self.ol.when_collection_changes().subscribe(everything)
+        self.ol.when_collection_changes(actions=[CollectionChangeAction.ADD]).subscribe(adds)
+
+        # act
+        self.ol.append(5)
+        self.ol.pop()
+
+        # assert
+        self.assertEqual(2, len(everything.messages))
+        self.assertEqual(1, len(adds.messages))
+
+    def test_disposed_filtered_subscription_is_removed_from_the_table(self):
+        # arrange
+        subscription = self.ol.when_collection_changes(actions=[CollectionChangeAction.ADD]).subscribe(lambda x: x)
+
+        # act
+        subscription.dispose()
+
+        # assert
+        self.assertEqual({}, self.ol._actionObservers)
+        self.assertEqual(0, self.ol._observerCount)
+
+    def test_batched_changes_are_split_for_filtered_observers(self):
+        # arrange
+        removes = self.scheduler.create_observer()
+        batches = self.scheduler.create_observer()
+        self.ol.when_collection_changes(actions=[CollectionChangeAction.REMOVE]).subscribe(removes)
+        self.ol.when_collection_changes(actions=[CollectionChangeAction.BATCH]).subscribe(batches)
+
+        # act
+        with self.ol.batch():
+            self.ol.remove(1)
+            self.ol.append(9)
+            self.ol.remove(2)
+
+        # assert
+        self.assertEqual([1, 2], [m.value.value.Items for m in removes.messages])
+        self.assertEqual(1, len(batches.messages))
+
+    def test_filtered_observer_receives_errors(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes(actions=[CollectionChangeAction.ADD]).subscribe(obs)
+
+        # act
+        self.ol.remove(10)
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        self.assertIsInstance(obs.messages[0].value.exception, ValueError)
+        self.assertEqual(0, self.ol._observerCount)
+
+    def tearDown(self):
+        self.ol.dispose()
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from reactive.shared.OverflowPolicy import OverflowPolicy
+from reactive.ObservableList import ObservableList
+
+
+class ObservableListAsyncStreamTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.ol = ObservableList([1, 2, 3])
+
+    def test_async_stream_yields_changes_in_order(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async()
+
+        async def consume():
+            return [(await stream.__anext__()).Items for _ in range(3)]
+
+        # act
+        self.ol.append(4)
+        self.ol.remove(1)
+        self.ol.extend([5, 6])
+        received = self.loop.run_until_complete(consume())
+
+        # assert
+        self.assertEqual([4, 1, [5, 6]], received)
+
+    def test_async_stream_receives_changes_from_another_thread(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async()
+
+        def produce():
+            for i in range(100):
+                self.ol.append(i)
+            stream.close()
+
+        async def consume():
+            threading.Thread(target=produce).start()
+            return [change.Items async for change in stream]
+
+        # act
+        received = self.loop.run_until_complete(consume())
+
+        # assert
+        self.assertEqual(list(range(100)), received)
+
+    def test_drop_oldest_policy_keeps_most_recent_changes(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async(maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+
+        # act
+        for i in range(5):
+            self.ol.append(i)
+        stream.close()
+        received = self.loop.run_until_complete(self._collect(stream))
+
+        # assert
+        self.assertEqual([3, 4], received)
+        self.assertEqual(3, stream.dropped)
+
+    def test_latest_policy_keeps_only_newest_change_on_overflow(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async(maxsize=3, policy=OverflowPolicy.LATEST)
+
+        # act
+        for i in range(4):
+            self.ol.append(i)
+        stream.close()
+        received = self.loop.run_until_complete(self._collect(stream))
+
+        # assert
+        self.assertEqual([3], received)
+
+    def test_block_policy_makes_writer_wait_for_the_consumer(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async(maxsize=1, policy=OverflowPolicy.BLOCK)
+        self.ol.append(0)
+        writer = threading.Thread(target=self.ol.append, args=(1,))
+
+        # act
+        writer.start()
+        time.sleep(0.05)
+        blocked = writer.is_alive()
+
+        async def consume():
+            return [(await stream.__anext__()).Items for _ in range(2)]
+
+        received = self.loop.run_until_complete(consume())
+        writer.join(timeout=1)
+
+        # assert
+        self.assertTrue(blocked)
+        self.assertEqual([0, 1], received)
+
+    def test_disposing_the_source_ends_the_async_stream(self):
+        # arrange
+        ol = ObservableList()
+        stream = ol.when_collection_changes_async()
+
+        def produce():
+            ol.append(1)
+            ol.append(2)
+            ol.dispose()
+
+        async def consume():
+            threading.Thread(target=produce).start()
+            return await self._collect(stream)
+
+        # act
+        received = self.loop.run_until_complete(asyncio.wait_for(consume(), 1))
+
+        # assert
+        self.assertEqual([1, 2], received)
+
+    def test_errors_end_the_async_stream(self):
+        # arrange
+        stream = self.ol.when_collection_changes_async()
+
+        # act
+        self.ol.append(4)
+        self.ol.remove(10)
+
+        # assert
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self._collect(stream))
+
+    @staticmethod
+    async def _collect(stream):
+        return [change.Items async for change in stream]
+
+    def tearDown(self):
+        self.ol.dispose()
+        self.loop.close()
+        asyncio.set_event_loop(None)
@@ -0,0 +1,98 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.ObservableList import ObservableList
+
+
+class ObservableListBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([1, 2, 3, 4])
+        self.scheduler = TestScheduler()
+
+    def test_batch_publishes_single_event_with_ordered_changes(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.ol.batch():
+            self.ol.append(5)
+            self.ol.remove(1)
+            self.ol.extend([6, 7])
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        change = obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.BATCH, change.Action)
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.REMOVE, CollectionChangeAction.EXTEND],
+                         [c.Action for c in change.Items])
+        self.assertEqual([5, 1, [6, 7]], [c.Items for c in change.Items])
+        self.assertEqual(ObservableList([2, 3, 4, 5, 6, 7]), self.ol)
+
+    def test_nested_batches_are_folded_into_the_outermost(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.ol.batch():
+            self.ol.append(5)
+            with self.ol.batch():
+                self.ol.append(6)
+            self.ol.append(7)
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        self.assertEqual([5, 6, 7], [c.Items for c in obs.messages[0].value.value.Items])
+
+    def test_empty_batch_publishes_nothing(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.ol.batch():
+            self.ol.count(1)
+
+        # assert
+        self.assertEqual([], obs.messages)
+
+    def test_batch_publishes_changes_made_before_an_exception(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.assertRaises(RuntimeError):
+            with self.ol.batch():
+                self.ol.append(5)
+                raise RuntimeError()
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        self.assertEqual(5, obs.messages[0].value.value.Items[0].Items)
+
+    def test_changes_after_batch_are_published_individually(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        with self.ol.batch():
+            self.ol.append(5)
+        self.ol.append(6)
+
+        # assert
+        self.assertEqual(2, len(obs.messages))
+        self.assertEqual(CollectionChangeAction.ADD, obs.messages[1].value.value.Action)
+
+    def tearDown(self):
+        self.ol.dispose()
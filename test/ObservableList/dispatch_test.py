@@ -0,0 +1,130 @@
+import threading
+import time
+import unittest
+
+from reactive.shared.DispatchMode import DispatchMode
+from reactive.ObservableList import ObservableList
+
+
+def _lock_is_free(lock) -> bool:
+    # probe from another thread, since the lock is reentrant for the thread delivering the notification
+    result = []
+
+    def probe():
+        acquired = lock.acquire(timeout=0.5)
+        if acquired:
+            lock.release()
+        result.append(acquired)
+
+    worker = threading.Thread(target=probe)
+    worker.start()
+    worker.join()
+    return result[0]
+
+
+class ObservableListDispatchTests(unittest.TestCase):
+
+    def test_immediate_dispatch_delivers_while_lock_is_held(self):
+        # arrange
+        ol = ObservableList([1, 2])
+        free = []
+        ol.when_collection_changes().subscribe(lambda x: free.append(_lock_is_free(ol.lock)))
+
+        # act
+        ol.append(3)
+
+        # assert
+        self.assertEqual([False], free)
+        ol.dispose()
+
+    def test_deferred_dispatch_delivers_after_lock_is_released(self):
+        # arrange
+        ol = ObservableList([1, 2], dispatch=DispatchMode.DEFERRED)
+        free = []
+        ol.when_collection_changes().subscribe(lambda x: free.append(_lock_is_free(ol.lock)))
+
+        # act
+        ol.append(3)
+        with ol.batch():
+            ol.append(4)
+
+        # assert
+        self.assertEqual([True, True], free)
+        ol.dispose()
+
+    def test_deferred_dispatch_keeps_order_when_subscriber_writes_back(self):
+        # arrange
+        ol = ObservableList(dispatch=DispatchMode.DEFERRED)
+        received = []
+
+        def on_next(change):
+            received.append(change.Items)
+            if change.Items == 1:
+                ol.append(2)
+                # the write-back is queued behind the current delivery rather than delivered re-entrantly
+                self.assertEqual([1], received)
+
+        ol.when_collection_changes().subscribe(on_next)
+
+        # act
+        ol.append(1)
+        ol.append(3)
+
+        # assert
+        self.assertEqual([1, 2, 3], received)
+        ol.dispose()
+
+    def test_deferred_dispatch_publishes_errors_in_order(self):
+        # arrange
+        ol = ObservableList([1], dispatch=DispatchMode.DEFERRED)
+        received = []
+        ol.when_collection_changes().subscribe(lambda x: received.append(x.Items), received.append)
+
+        # act
+        ol.append(2)
+        ol.remove(5)
+
+        # assert
+        self.assertEqual(2, received[0])
+        self.assertIsInstance(received[1], ValueError)
+        ol.dispose()
+
+    def test_thread_dispatch_does_not_block_writer_on_slow_subscriber(self):
+        # arrange
+        ol = ObservableList(dispatch=DispatchMode.THREAD)
+        received = []
+        threads = set()
+
+        def slow(change):
+            threads.add(threading.current_thread())
+            time.sleep(0.05)
+            received.append(change.Items)
+
+        ol.when_collection_changes().subscribe(slow)
+
+        # act
+        started = time.perf_counter()
+        for i in range(5):
+            ol.append(i)
+        elapsed = time.perf_counter() - started
+        ol.flush_notifications()
+
+        # assert
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual([0, 1, 2, 3, 4], received)
+        self.assertNotIn(threading.current_thread(), threads)
+        ol.dispose()
+
+    def test_thread_dispatcher_stops_on_dispose(self):
+        # arrange
+        ol = ObservableList(dispatch=DispatchMode.THREAD)
+        ol.when_collection_changes().subscribe(lambda x: x)
+        ol.append(1)
+        dispatcher = ol._dispatcherThread
+
+        # act
+        ol.dispose()
+        dispatcher.join(timeout=1)
+
+        # assert
+        self.assertFalse(dispatcher.is_alive())
@@ -0,0 +1,116 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.shared.DispatchMode import DispatchMode
+from reactive.shared.SequenceGapError import SequenceGapError
+
+
+class JournalTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([1, 2, 3], journal_size=4)
+        self.scheduler = TestScheduler()
+
+    def test_changes_are_numbered_in_publish_order(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes().subscribe(obs)
+
+        # act
+        self.ol.append(4)
+        with self.ol.batch():
+            self.ol.append(5)
+            self.ol.remove(1)
+
+        # assert
+        self.assertEqual([1, 2], [m.value.value.Sequence for m in obs.messages])
+        self.assertEqual(2, self.ol.sequence)
+
+    def test_since_replays_missed_changes_then_goes_live(self):
+        # arrange
+        self.ol.append(4)
+        seen = self.ol.sequence
+        self.ol.append(5)
+        self.ol.pop(0)
+        obs = self.scheduler.create_observer()
+
+        # act
+        self.ol.when_collection_changes(since=seen).subscribe(obs)
+        self.ol.append(6)
+
+        # assert
+        self.assertEqual([(CollectionChangeAction.ADD, 5), (CollectionChangeAction.REMOVE, 1),
+                          (CollectionChangeAction.ADD, 6)],
+                         [(m.value.value.Action, m.value.value.Items) for m in obs.messages])
+        self.assertEqual([2, 3, 4], [m.value.value.Sequence for m in obs.messages])
+
+    def test_replayed_sort_carries_the_order_it_produced(self):
+        # arrange
+        ol = ObservableList([3, 1, 2], journal_size=10)
+        obs = self.scheduler.create_observer()
+
+        # act
+        ol.sort()
+        ol.append(0)
+        ol.when_collection_changes(since=0).subscribe(obs)
+
+        # assert
+        self.assertEqual(CollectionChangeAction.INDEX, obs.messages[0].value.value.Action)
+        self.assertEqual([1, 2, 3], obs.messages[0].value.value.Items)
+
+    def test_since_latest_sequence_replays_nothing(self):
+        # arrange
+        self.ol.append(4)
+        obs = self.scheduler.create_observer()
+
+        # act
+        self.ol.when_collection_changes(since=self.ol.sequence).subscribe(obs)
+
+        # assert
+        self.assertEqual(0, len(obs.messages))
+
+    def test_evicted_gap_publishes_SequenceGapError(self):
+        # arrange
+        for item in range(6):
+            self.ol.append(item)
+        obs = self.scheduler.create_observer()
+
+        # act
+        self.ol.when_collection_changes(since=1).subscribe(obs)
+
+        # assert
+        self.assertEqual('E', obs.messages[0].value.kind)
+        self.assertIsInstance(obs.messages[0].value.exception, SequenceGapError)
+        self.assertEqual((1, 3, 6), (obs.messages[0].value.exception.since, obs.messages[0].value.exception.oldest,
+                                     obs.messages[0].value.exception.latest))
+
+    def test_queued_changes_are_not_delivered_twice(self):
+        # arrange
+        ol = ObservableList([], dispatch=DispatchMode.DEFERRED, journal_size=8)
+        obs = self.scheduler.create_observer()
+
+        # act
+        with ol.lock:
+            ol.append(1)
+            ol.when_collection_changes(since=0).subscribe(obs)
+            ol.append(2)
+
+        # assert
+        self.assertEqual([1, 2], [m.value.value.Items for m in obs.messages])
+
+    def test_since_without_journal_publishes_error(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+
+        # act
+        ObservableList([1]).when_collection_changes(since=0).subscribe(obs)
+
+        # assert
+        self.assertIsInstance(obs.messages[0].value.exception, ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+from reactive.ObservableList import ObservableList
+
+
+def apply(mirror: list, change) -> None:
+    """ patches a plain list from a positional change, the way a downstream mirror would """
+    if change.Action is CollectionChangeAction.ADD:
+        mirror.insert(change.Index, change.Items)
+    elif change.Action is CollectionChangeAction.EXTEND:
+        mirror[change.Index:change.Index] = change.Items
+    elif change.Action is CollectionChangeAction.REMOVE:
+        del mirror[change.Index]
+    elif change.Action is CollectionChangeAction.INDEX:
+        mirror[:] = change.Items
+    elif change.Action is CollectionChangeAction.CLEAR:
+        mirror.clear()
+
+
+class ObservableListPositionalChangeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([4, 5, 6, 7])
+        self.changes = []
+        self.ol.when_collection_changes().subscribe(self.changes.append)
+
+    def test_append_and_extend_publish_start_index(self):
+        # arrange & act
+        self.ol.append(8)
+        self.ol.extend([9, 10])
+
+        # assert
+        self.assertEqual([(4, 1), (5, 2)], [(c.Index, c.Count) for c in self.changes])
+
+    def test_insert_publishes_clamped_index(self):
+        # arrange & act
+        self.ol.insert(1, 2)
+        self.ol.insert(2, 100)
+        self.ol.insert(3, -1)
+        self.ol.insert(0, -100)
+
+        # assert
+        self.assertEqual([2, 5, 5, 0], [c.Index for c in self.changes])
+
+    def test_remove_publishes_index_of_first_occurrence(self):
+        # arrange
+        self.ol.extend([5])
+        del self.changes[:]
+
+        # act
+        self.ol.remove(5)
+
+        # assert
+        self.assertEqual(1, self.changes[0].Index)
+        self.assertEqual(5, self.changes[0].Items)
+
+    def test_pop_returns_item_and_publishes_it_with_index(self):
+        # arrange & act
+        last = self.ol.pop()
+        first = self.ol.pop(0)
+        middle = self.ol.pop(-2)
+
+        # assert
+        self.assertEqual([7, 4, 5], [last, first, middle])
+        self.assertEqual([(7, 3), (4, 0), (5, 0)], [(c.Items, c.Index) for c in self.changes])
+        self.assertEqual(ObservableList([6]), self.ol)
+
+    def test_sort_publishes_previous_order(self):
+        # arrange & act
+        self.ol.sort(reverse=True)
+
+        # assert
+        self.assertEqual((4, 5, 6, 7), self.changes[0].OldItems)
+        self.assertEqual(0, self.changes[0].Index)
+        self.assertEqual(4, self.changes[0].Count)
+
+    def test_extend_with_generator_publishes_materialised_items(self):
+        # arrange & act
+        self.ol.extend(x for x in (1, 2))
+
+        # assert
+        self.assertEqual([1, 2], self.changes[0].Items)
+
+    def test_positional_changes_keep_a_mirror_in_sync(self):
+        # arrange
+        mirror = list(self.ol)
+        self.ol.when_collection_changes().subscribe(lambda change: apply(mirror, change))
+
+        # act
+        self.ol.append(1)
+        self.ol.insert(9, 2)
+        self.ol.extend([3, 3])
+        self.ol.remove(3)
+        self.ol.pop(1)
+        self.ol.sort()
+        self.ol.insert(0, -50)
+
+        # assert
+        self.assertEqual(list(self.ol), mirror)
+
+    def tearDown(self):
+        self.ol.dispose()
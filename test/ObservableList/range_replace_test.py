@@ -0,0 +1,104 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableListRangeReplaceTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([0, 1, 2, 3, 4, 5])
+        self.obs = TestScheduler().create_observer()
+        self.ol.when_collection_changes().subscribe(self.obs)
+
+    def changes(self):
+        return [message.value.value for message in self.obs.messages]
+
+    def test_setitem_publishes_replace_of_one_element(self):
+        # act
+        self.ol[-1] = 50
+
+        # assert
+        change, = self.changes()
+        self.assertEqual((CollectionChangeAction.REPLACE, 5, (50,), (5,)),
+                         (change.Action, change.Index, change.Items, change.OldItems))
+        self.assertEqual(ObservableList([0, 1, 2, 3, 4, 50]), self.ol)
+
+    def test_slice_assignment_publishes_one_replace_with_inserted_and_removed_items(self):
+        # act
+        self.ol[1:4] = (item * 10 for item in range(5))
+
+        # assert
+        change, = self.changes()
+        self.assertEqual((CollectionChangeAction.REPLACE, 1, [0, 10, 20, 30, 40], [1, 2, 3]),
+                         (change.Action, change.Index, change.Items, change.OldItems))
+        self.assertEqual(ObservableList([0, 0, 10, 20, 30, 40, 4, 5]), self.ol)
+
+    def test_replace_range_normalises_negative_bounds(self):
+        # act
+        self.ol.replace_range(-2, 100, ['x'])
+
+        # assert
+        change, = self.changes()
+        self.assertEqual((4, ['x'], [4, 5]), (change.Index, change.Items, change.OldItems))
+        self.assertEqual(ObservableList([0, 1, 2, 3, 'x']), self.ol)
+
+    def test_delete_slice_publishes_replace_without_inserted_items(self):
+        # act
+        del self.ol[2:5]
+
+        # assert
+        change, = self.changes()
+        self.assertEqual((CollectionChangeAction.REPLACE, 2, (), [2, 3, 4]),
+                         (change.Action, change.Index, change.Items, change.OldItems))
+        self.assertEqual(ObservableList([0, 1, 5]), self.ol)
+
+    def test_empty_range_publishes_nothing(self):
+        # act
+        self.ol[3:3] = []
+        del self.ol[4:2]
+
+        # assert
+        self.assertEqual([], self.changes())
+
+    def test_extended_slices_publish_a_batch_that_replays_in_order(self):
+        # arrange
+        mirror = [0, 1, 2, 3, 4, 5]
+
+        # act
+        self.ol[::2] = ['a', 'b', 'c']
+        del self.ol[1::2]
+
+        # assert
+        for batch in self.changes():
+            self.assertEqual(CollectionChangeAction.BATCH, batch.Action)
+            for change in batch.Items:
+                if change.Action is CollectionChangeAction.REPLACE:
+                    mirror[change.Index] = change.Items[0]
+                else:
+                    del mirror[change.Index]
+        self.assertEqual(['a', 'b', 'c'], mirror)
+        self.assertEqual(ObservableList(['a', 'b', 'c']), self.ol)
+
+    def test_delitem_publishes_remove(self):
+        # act
+        del self.ol[-2]
+
+        # assert
+        change, = self.changes()
+        self.assertEqual((CollectionChangeAction.REMOVE, 4, 4), (change.Action, change.Index, change.Items))
+
+    def test_typed_list_converts_slices_to_its_typecode(self):
+        # arrange
+        typed = ObservableList.typed('i', [1, 2, 3])
+
+        # act
+        typed[0:2] = [7, 8, 9]
+
+        # assert
+        self.assertEqual(ObservableList.typed('i', [7, 8, 9, 3]), typed)
+        with self.assertRaises(TypeError):
+            typed[0:1] = ['x']
+        self.assertEqual(ObservableList.typed('i', [7, 8, 9, 3]), typed)
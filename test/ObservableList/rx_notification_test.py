@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from rx.testing import ReactiveTest, TestScheduler
 
@@ -187,5 +188,48 @@ class RxNotificationTest(unittest.TestCase):
         # assert
         self.assertEqual(obs.messages, expected_messages)
 
+    def test_ObservableList_tracks_live_observer_count(self):
+        # arrange
+        first = self.ol.when_collection_changes().subscribe(lambda x: x)
+        second = self.ol.when_collection_changes().subscribe(lambda x: x)
+
+        # act
+        first.dispose()
+        first.dispose()
+
+        # assert
+        self.assertEqual(1, self.ol._observerCount)
+        second.dispose()
+        self.assertEqual(0, self.ol._observerCount)
+
+    def test_ObservableList_without_observers_does_not_build_events(self):
+        # arrange
+        subscription = self.ol.when_collection_changes().subscribe(lambda x: x)
+        subscription.dispose()
+
+        # act
+        with mock.patch('reactive.ObservableList.CollectionChange') as change:
+            self.ol.append(1)
+            self.ol.extend([2, 3])
+            self.ol.pop()
+
+        # assert
+        change.Add.assert_not_called()
+        change.Extend.assert_not_called()
+        change.Remove.assert_not_called()
+        self.assertEqual(ObservableList([4, 5, 6, 7, 1, 2]), self.ol)
+
+    def test_ObservableList_observer_count_released_on_error(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.ol.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        self.ol.remove(1)
+
+        # assert
+        self.assertEqual(0, self.ol._observerCount)
+
     def tearDown(self):
         self.ol.dispose()
@@ -0,0 +1,72 @@
+import unittest
+
+from reactive.ObservableList import ObservableList
+from reactive.ObservableListSlice import ObservableListSlice
+
+
+class ObservableListSliceTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([0, 1, 2, 3, 4, 5, 6, 7])
+
+    def test_slice_reads_the_source_lazily(self):
+        # act
+        page = self.ol[2:5]
+        self.ol[3] = 30
+
+        # assert
+        self.assertIsInstance(page, ObservableListSlice)
+        self.assertEqual([2, 30, 4], list(page))
+        self.assertEqual(3, len(page))
+        self.assertEqual(4, page[-1])
+        self.assertIn(30, page)
+        self.assertEqual(1, page.index(30))
+
+    def test_fixed_view_drops_positions_the_source_no_longer_has(self):
+        # arrange
+        tail = self.ol[4:]
+        backwards = reversed(self.ol)
+
+        # act
+        del self.ol[5:]
+
+        # assert
+        self.assertEqual([4], list(tail))
+        self.assertEqual([4, 3, 2, 1, 0], list(backwards))
+
+    def test_live_view_reapplies_the_slice(self):
+        # arrange
+        last_two = self.ol.view(-2, live=True)
+        backwards = self.ol.view(step=-1, live=True)
+
+        # act
+        self.ol.append(8)
+
+        # assert
+        self.assertEqual([7, 8], list(last_two))
+        self.assertEqual([8, 7, 6, 5, 4, 3, 2, 1, 0], list(backwards))
+
+    def test_views_compose_and_compare_with_lists(self):
+        # act
+        odds = self.ol[1::2]
+        reversed_odds = reversed(odds)
+
+        # assert
+        self.assertEqual(ObservableList([7, 5, 3, 1]), reversed_odds)
+        self.assertEqual(ObservableList([3, 5]), odds[1:3])
+        self.assertNotEqual(self.ol[:3], self.ol[1:4])
+        self.assertEqual(ObservableList([0, 1, 2, 3]), self.ol[:2] + self.ol[2:4])
+
+    def test_copy_returns_a_detached_observable_list(self):
+        # arrange
+        page = self.ol[6:1:-2]
+
+        # act
+        copied = page.copy()
+        self.ol.clear()
+
+        # assert
+        self.assertIsInstance(copied, ObservableList)
+        self.assertEqual(ObservableList([6, 4, 2]), copied)
+        self.assertEqual(0, len(page))
+        self.assertEqual(ObservableList([]), page.copy())
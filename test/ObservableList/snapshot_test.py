@@ -0,0 +1,87 @@
+import threading
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.DispatchMode import DispatchMode
+
+
+class SnapshotSubscriptionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([1, 2, 3])
+        self.scheduler = TestScheduler()
+
+    def test_snapshot_is_a_detached_copy(self):
+        # act
+        result = self.ol.subscribe_with_snapshot()
+        self.ol.append(4)
+
+        # assert
+        self.assertEqual([1, 2, 3], result.snapshot)
+        self.assertEqual(0, result.version)
+
+    def test_deltas_follow_snapshot_version(self):
+        # arrange
+        self.ol.subscribe_with_snapshot()
+        self.ol.append(4)
+        obs = self.scheduler.create_observer()
+
+        # act
+        result = self.ol.subscribe_with_snapshot(obs)
+        self.ol.append(5)
+        self.ol.pop(0)
+
+        # assert
+        self.assertEqual([1, 2, 3, 4], result.snapshot)
+        self.assertEqual(1, result.version)
+        self.assertEqual([2, 3], [m.value.value.Sequence for m in obs.messages])
+
+    def test_changes_queued_before_snapshot_are_not_applied_twice(self):
+        # arrange
+        ol = ObservableList([], dispatch=DispatchMode.DEFERRED)
+        ol.subscribe_with_snapshot()
+        mirror = []
+
+        # act
+        with ol.lock:
+            ol.append(1)
+            result = ol.subscribe_with_snapshot(lambda change: mirror.append(change.Items))
+            mirror.extend(result.snapshot)
+            ol.append(2)
+
+        # assert
+        self.assertEqual([1, 2], mirror)
+
+    def test_mirror_built_while_writer_runs_matches_source(self):
+        # arrange
+        ol = ObservableList(list(range(1000)), dispatch=DispatchMode.THREAD)
+        writer = threading.Thread(target=lambda: [ol.append(i) for i in range(1000, 3000)])
+
+        # act
+        writer.start()
+        mirror = []
+        result = ol.subscribe_with_snapshot(lambda change: mirror.append(change.Items))
+        mirror[:0] = result.snapshot
+        writer.join()
+        ol.flush_notifications()
+
+        # assert
+        self.assertEqual(list(ol), mirror)
+
+    def test_dispose_stops_deltas(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        result = self.ol.subscribe_with_snapshot(obs)
+
+        # act
+        result.dispose()
+        self.ol.append(4)
+
+        # assert
+        self.assertEqual(0, len(obs.messages))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import sys
+import unittest
+from array import array
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableList import ObservableList
+from reactive.TypedObservableList import TypedObservableList
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class TypedObservableListTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tl = ObservableList.typed('d', [3.0, 1.0, 2.0])
+        self.scheduler = TestScheduler()
+
+    def test_typed_stores_elements_in_array(self):
+        # assert
+        self.assertIsInstance(self.tl, TypedObservableList)
+        self.assertIsInstance(self.tl._list, array)
+        self.assertEqual('d', self.tl.typecode)
+        self.assertEqual(8, self.tl.itemsize)
+        self.assertLess(sys.getsizeof(ObservableList.typed('q', range(1000))._list),
+                        sys.getsizeof(list(range(1000))) + 1000 * sys.getsizeof(1000))
+
+    def test_typed_list_compares_with_ObservableList(self):
+        # assert
+        self.assertEqual(ObservableList([3.0, 1.0, 2.0]), self.tl)
+        self.assertEqual(self.tl, ObservableList([3.0, 1.0, 2.0]))
+        self.assertNotEqual(ObservableList.typed('d', [1.0]), self.tl)
+
+    def test_mutations_publish_the_same_events_as_ObservableList(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.tl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.tl.append(4.0)
+        self.tl.insert(0.5, 0)
+        self.tl.remove(1.0)
+        self.tl.pop()
+        self.tl.sort()
+        self.tl.clear()
+
+        # assert
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.ADD, CollectionChangeAction.REMOVE,
+                          CollectionChangeAction.REMOVE, CollectionChangeAction.INDEX, CollectionChangeAction.CLEAR],
+                         [m.value.value.Action for m in obs.messages])
+        self.assertEqual((0.5, 3.0, 2.0), obs.messages[4].value.value.OldItems)
+        self.assertEqual(0, len(self.tl))
+
+    def test_extend_from_array_of_same_typecode_publishes_a_copy(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.tl.when_collection_changes().subscribe(obs)
+        chunk = array('d', [5.0, 6.0])
+
+        # act
+        self.tl.extend(chunk)
+        self.tl.extend(ObservableList.typed('d', [7.0]))
+        self.tl.extend(x for x in (8, 9))
+
+        # assert
+        self.assertEqual(chunk, obs.messages[0].value.value.Items)
+        self.assertIsNot(chunk, obs.messages[0].value.value.Items)
+        self.assertEqual(3, obs.messages[0].value.value.Index)
+        self.assertEqual([3.0, 1.0, 2.0, 5.0, 6.0, 7.0, 8.0, 9.0], list(self.tl))
+
+    def test_self_extend_publishes_the_items_it_appended(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.tl.when_collection_changes().subscribe(obs)
+        squares = self.tl.select(lambda x: x * x)
+
+        # act
+        self.tl.extend(self.tl)
+
+        # assert
+        change = obs.messages[0].value.value
+        self.assertEqual((3, 3), (change.Index, change.Count))
+        self.assertEqual([3.0, 1.0, 2.0, 3.0, 1.0, 2.0], list(self.tl))
+        self.assertEqual([x * x for x in self.tl], list(squares))
+
+    def test_published_items_do_not_follow_the_source_list(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        other = ObservableList.typed('d', [5.0])
+        self.tl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.tl.extend(other)
+        other.append(99.0)
+
+        # assert
+        self.assertEqual([5.0], list(obs.messages[0].value.value.Items))
+
+    def test_bad_values_leave_list_unchanged(self):
+        # arrange
+        il = ObservableList.typed('b', [1, 2])
+
+        # act & assert
+        self.assertRaises(TypeError, il.extend, [3, 'x'])
+        self.assertRaises(OverflowError, il.append, 1000)
+        self.assertEqual([1, 2], list(il))
+
+    def test_slices_and_reversed_stay_typed(self):
+        # act
+        head = self.tl[:2]
+        backwards = reversed(self.tl)
+
+        # assert
+        self.assertIsInstance(head.copy(), TypedObservableList)
+        self.assertEqual([3.0, 1.0], list(head))
+        self.assertEqual([2.0, 1.0, 3.0], list(backwards))
+        self.assertEqual([3.0, 1.0, 2.0, 3.0, 1.0], list(self.tl + head))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableList import ObservableList
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableListViewTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ol = ObservableList([1, 2, 3, 4, 5, 6])
+        self.scheduler = TestScheduler()
+
+    def test_where_and_select_start_from_current_contents(self):
+        # arrange & act
+        evens = self.ol.where(lambda x: x % 2 == 0)
+        squares = self.ol.select(lambda x: x * x)
+
+        # assert
+        self.assertEqual(ObservableList([2, 4, 6]), evens)
+        self.assertEqual(ObservableList([1, 4, 9, 16, 25, 36]), squares)
+
+    def test_views_follow_source_mutations(self):
+        # arrange
+        evens = self.ol.where(lambda x: x % 2 == 0)
+        squares = self.ol.select(lambda x: x * x)
+
+        # act
+        self.ol.append(8)
+        self.ol.insert(10, 0)
+        self.ol.extend([11, 12])
+        self.ol.remove(2)
+        self.ol.pop(1)
+        self.ol.sort(reverse=True)
+
+        # assert
+        self.assertEqual([x for x in self.ol if x % 2 == 0], list(evens))
+        self.assertEqual([x * x for x in self.ol], list(squares))
+
+    def test_predicate_runs_only_for_changed_elements(self):
+        # arrange
+        calls = []
+        evens = self.ol.where(lambda x: calls.append(x) or x % 2 == 0)
+        del calls[:]
+
+        # act
+        self.ol.append(7)
+        self.ol.extend([8, 9])
+        self.ol.remove(4)
+
+        # assert
+        self.assertEqual([7, 8, 9], calls)
+        self.assertEqual([2, 6, 8], list(evens))
+
+    def test_views_apply_range_replacements_incrementally(self):
+        # arrange
+        calls = []
+        evens = self.ol.where(lambda x: calls.append(x) or x % 2 == 0)
+        squares = self.ol.select(lambda x: x * x)
+        obs = self.scheduler.create_observer()
+        evens.when_collection_changes().subscribe(obs)
+        del calls[:]
+
+        # act
+        self.ol[1:4] = [10, 11]
+        del self.ol[::2]
+
+        # assert
+        self.assertEqual([10, 11], calls)
+        self.assertEqual([x for x in self.ol if x % 2 == 0], list(evens))
+        self.assertEqual([x * x for x in self.ol], list(squares))
+        replaced = obs.messages[0].value.value
+        self.assertEqual((CollectionChangeAction.REPLACE, 0, [10], [2, 4]),
+                         (replaced.Action, replaced.Index, replaced.Items, replaced.OldItems))
+
+    def test_filtered_view_stays_exact_across_mask_blocks(self):
+        # arrange
+        source = ObservableList(list(range(3000)))
+        multiples = source.where(lambda x: x % 3 == 0)
+
+        # act
+        for step in range(600):
+            source.insert(step * 7, (step * 5) % len(source))
+            source.pop((step * 11) % len(source))
+        source[100:1500] = range(50)
+        del source[::4]
+
+        # assert
+        self.assertEqual([x for x in source if x % 3 == 0], list(multiples))
+
+    def test_filtered_view_publishes_positions_in_the_view(self):
+        # arrange
+        evens = self.ol.where(lambda x: x % 2 == 0)
+        obs = self.scheduler.create_observer()
+        evens.when_collection_changes().subscribe(obs)
+
+        # act
+        self.ol.insert(0, 3)
+        self.ol.insert(7, 4)
+        self.ol.remove(4)
+        self.ol.append(9)
+
+        # assert
+        self.assertEqual([(CollectionChangeAction.ADD, 0, 1), (CollectionChangeAction.REMOVE, 4, 2)],
+                         [(m.value.value.Action, m.value.value.Items, m.value.value.Index) for m in obs.messages])
+
+    def test_views_can_be_chained(self):
+        # arrange
+        labels = self.ol.where(lambda x: x > 2).select(str).where(lambda s: s != '5')
+
+        # act
+        self.ol.extend([5, 7])
+        self.ol.remove(3)
+
+        # assert
+        self.assertEqual(['4', '6', '7'], list(labels))
+
+    def test_source_batch_is_republished_as_one_batch(self):
+        # arrange
+        squares = self.ol.select(lambda x: x * x)
+        obs = self.scheduler.create_observer()
+        squares.when_collection_changes().subscribe(obs)
+
+        # act
+        with self.ol.batch():
+            self.ol.append(7)
+            self.ol.pop(0)
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        self.assertEqual([49, 1], [c.Items for c in obs.messages[0].value.value.Items])
+        self.assertEqual([4, 9, 16, 25, 36, 49], list(squares))
+
+    def test_clear_empties_the_view(self):
+        # arrange
+        evens = self.ol.where(lambda x: x % 2 == 0)
+
+        # act
+        self.ol.clear()
+        self.ol.append(2)
+
+        # assert
+        self.assertEqual([2], list(evens))
+
+    def test_disposed_view_detaches_from_source(self):
+        # arrange
+        evens = self.ol.where(lambda x: x % 2 == 0)
+
+        # act
+        evens.dispose()
+
+        # assert
+        self.assertEqual(0, self.ol._observerCount)
+
+    def tearDown(self):
+        self.ol.dispose()
@@ -30,6 +30,20 @@ class RxNotificationObservableSetTest(unittest.TestCase):
         # assert
         self.assertEqual(expected_message, obs.messages)
 
+    def test_ObservableSet_add_existing_item_produces_nothing(self):
+        # arrange
+        expected_message = []
+        obs = self.scheduler.create_observer()
+
+        self.os.when_collection_changes() \
+            .subscribe(obs)
+
+        # act
+        self.os.add(4)
+
+        # assert
+        self.assertEqual(expected_message, obs.messages)
+
     def test_ObservableSet_add_with_iterable_produces_single_add_event(self):
         # arrange
         obs = self.scheduler.create_observer()
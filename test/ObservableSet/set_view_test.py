@@ -0,0 +1,110 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableSet import ObservableSet
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableSetViewTests(unittest.TestCase):
+
+    def setUp(self):
+        self.a = ObservableSet({1, 2, 3, 4})
+        self.b = ObservableSet({3, 4, 5, 6})
+        self.scheduler = TestScheduler()
+
+    def assertViewsMatch(self, union, intersection, difference, symmetric):
+        self.assertEqual(self.a._set | self.b._set, set(union))
+        self.assertEqual(self.a._set & self.b._set, set(intersection))
+        self.assertEqual(self.a._set - self.b._set, set(difference))
+        self.assertEqual(self.a._set ^ self.b._set, set(symmetric))
+
+    def test_views_start_from_current_contents(self):
+        # arrange & act
+        views = (self.a.union_view(self.b), self.a.intersection_view(self.b), self.a.difference_view(self.b),
+                 self.a.symmetric_difference_view(self.b))
+
+        # assert
+        self.assertViewsMatch(*views)
+        self.assertEqual(self.a.union(self.b), views[0])
+
+    def test_views_follow_both_operands(self):
+        # arrange
+        views = (self.a.union_view(self.b), self.a.intersection_view(self.b), self.a.difference_view(self.b),
+                 self.a.symmetric_difference_view(self.b))
+
+        # act
+        self.a.add(5)
+        self.b.discard(3)
+        self.a.update(x for x in (7, 8))
+        self.b.difference_update({4, 100})
+        self.a.intersection_update({1, 2, 5, 7, 8})
+        self.b.symmetric_difference_update({1, 9})
+        self.a.pop()
+        self.b.clear()
+
+        # assert
+        self.assertViewsMatch(*views)
+
+    def test_view_publishes_membership_changes_only(self):
+        # arrange
+        intersection = self.a.intersection_view(self.b)
+        obs = self.scheduler.create_observer()
+        intersection.when_collection_changes().subscribe(obs)
+
+        # act
+        self.a.add(5)
+        self.a.add(9)
+        self.b.remove(4)
+
+        # assert
+        self.assertEqual([(CollectionChangeAction.ADD, 5), (CollectionChangeAction.REMOVE, 4)],
+                         [(m.value.value.Action, m.value.value.Items) for m in obs.messages])
+
+    def test_bulk_operand_change_publishes_one_batch(self):
+        # arrange
+        union = self.a.union_view(self.b)
+        obs = self.scheduler.create_observer()
+        union.when_collection_changes().subscribe(obs)
+
+        # act
+        self.b.update([6, 7, 8])
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        batch = obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.BATCH, batch.Action)
+        self.assertEqual({7, 8}, {change.Items for change in batch.Items})
+
+    def test_set_updates_publish_removed_members(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.a.when_collection_changes().subscribe(obs)
+
+        # act
+        self.a.difference_update({1, 9})
+        self.a.intersection_update({2, 3})
+
+        # assert
+        self.assertEqual({1}, obs.messages[0].value.value.OldItems)
+        self.assertEqual({4}, obs.messages[1].value.value.OldItems)
+
+    def test_views_can_be_chained_and_disposed(self):
+        # arrange
+        c = ObservableSet({4, 6})
+        chained = self.a.union_view(self.b).difference_view(c)
+
+        # act
+        self.a.add(10)
+        c.discard(4)
+        snapshot = chained.copy()
+        chained.dispose()
+        self.a.add(11)
+
+        # assert
+        self.assertTrue(chained.is_disposed)
+        self.assertEqual(ObservableSet({1, 2, 3, 4, 5, 10}), snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.ObservableSortedList import ObservableSortedList
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+
+class ObservableSortedListTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sl = ObservableSortedList([5, 1, 4, 2])
+        self.scheduler = TestScheduler()
+
+    def test_items_are_kept_in_order(self):
+        # act
+        self.sl.add(3)
+        self.sl.update([0, 6, 3])
+
+        # assert
+        self.assertEqual([0, 1, 2, 3, 3, 4, 5, 6], list(self.sl))
+
+    def test_key_function_orders_items(self):
+        # arrange
+        sl = ObservableSortedList(['ccc', 'a', 'bb'], key=len)
+
+        # act
+        sl.add('dd')
+
+        # assert
+        self.assertEqual(['a', 'bb', 'dd', 'ccc'], list(sl))
+        self.assertEqual(2, sl.index('dd'))
+        self.assertTrue('bb' in sl)
+        self.assertFalse('xx' in sl)
+
+    def test_index_and_count(self):
+        # arrange
+        self.sl.update([4, 4])
+
+        # act & assert
+        self.assertEqual(2, self.sl.index(4))
+        self.assertEqual(3, self.sl.count(4))
+        self.assertEqual(0, self.sl.count(3))
+        self.assertRaises(ValueError, self.sl.index, 3)
+
+    def test_add_publishes_insert_position(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.sl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.sl.add(3)
+
+        # assert
+        change = obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.ADD, change.Action)
+        self.assertEqual(3, change.Items)
+        self.assertEqual(2, change.Index)
+
+    def test_update_publishes_single_batch_of_adds(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.sl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.sl.update([3, 0])
+
+        # assert
+        self.assertEqual(1, len(obs.messages))
+        batch = obs.messages[0].value.value
+        self.assertEqual(CollectionChangeAction.BATCH, batch.Action)
+        self.assertEqual([(3, 2), (0, 0)], [(c.Items, c.Index) for c in batch.Items])
+
+    def test_remove_and_pop_publish_removed_position(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.sl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.sl.remove(2)
+        popped = self.sl.pop(0)
+        self.sl.discard(42)
+
+        # assert
+        self.assertEqual(1, popped)
+        self.assertEqual(2, len(obs.messages))
+        self.assertEqual((2, 1), (obs.messages[0].value.value.Items, obs.messages[0].value.value.Index))
+        self.assertEqual((1, 0), (obs.messages[1].value.value.Items, obs.messages[1].value.value.Index))
+        self.assertEqual([4, 5], list(self.sl))
+
+    def test_remove_missing_item_publishes_error(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.sl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.sl.remove(42)
+
+        # assert
+        self.assertEqual('E', obs.messages[0].value.kind)
+        self.assertIsInstance(obs.messages[0].value.exception, ValueError)
+
+    def test_equal_keys_keep_insertion_order(self):
+        # arrange
+        sl = ObservableSortedList(key=lambda pair: pair[0])
+
+        # act
+        sl.update([(1, 'a'), (0, 'b'), (1, 'c')])
+        sl.remove((1, 'c'))
+
+        # assert
+        self.assertEqual([(0, 'b'), (1, 'a')], list(sl))
+
+    def test_clear_publishes_clear(self):
+        # arrange
+        obs = self.scheduler.create_observer()
+        self.sl.when_collection_changes().subscribe(obs)
+
+        # act
+        self.sl.clear()
+
+        # assert
+        self.assertEqual(0, len(self.sl))
+        self.assertEqual(CollectionChangeAction.CLEAR, obs.messages[0].value.value.Action)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import multiprocessing
+import os
+import struct
+import subprocess
+import sys
+import time
+import unittest
+
+from rx.testing import TestScheduler
+
+from reactive.shared.CollectionChangeAction import CollectionChangeAction
+
+try:
+    from reactive.SharedObservableDict import SharedObservableDict
+except ImportError:
+    SharedObservableDict = None
+
+
+def read_in_child(name, keys, results):
+    reader = SharedObservableDict.attach(name)
+    try:
+        results.put(([reader.get(key) for key in keys], reader.version))
+    finally:
+        reader.dispose()
+
+
+@unittest.skipIf(SharedObservableDict is None, 'multiprocessing.shared_memory needs Python 3.8+')
+class SharedObservableDictTests(unittest.TestCase):
+
+    def setUp(self):
+        self.shared = SharedObservableDict(capacity=16, key_size=8, value_format='qd')
+
+    def tearDown(self):
+        if not self.shared.is_disposed:
+            self.shared.dispose()
+
+    def test_set_get_and_delete(self):
+        # act
+        self.shared['a'] = (1, 1.5)
+        self.shared[b'b'] = (2, 2.5)
+        del self.shared['a']
+
+        # assert
+        self.assertEqual((2, 2.5), self.shared[b'b'])
+        self.assertNotIn('a', self.shared)
+        self.assertIsNone(self.shared.get('b'))
+        self.assertEqual(1, len(self.shared))
+        self.assertRaises(KeyError, lambda: self.shared['a'])
+
+    def test_writes_publish_dict_changes(self):
+        # arrange
+        obs = TestScheduler().create_observer()
+        self.shared['a'] = (1, 1.0)
+        self.shared.when_collection_changes().subscribe(obs)
+
+        # act
+        self.shared['b'] = (2, 2.0)
+        self.shared['a'] = (3, 3.0)
+        self.shared.pop('b')
+        self.shared.clear()
+
+        # assert
+        changes = [message.value.value for message in obs.messages]
+        self.assertEqual([CollectionChangeAction.ADD, CollectionChangeAction.REPLACE, CollectionChangeAction.REMOVE,
+                          CollectionChangeAction.CLEAR], [change.Action for change in changes])
+        self.assertEqual('b', changes[0].Key)
+        self.assertEqual((1, 1.0), changes[1].OldItems)
+        self.assertEqual((2, 2.0), changes[2].OldItems)
+        self.assertEqual(0, len(self.shared))
+
+    def test_deleted_slots_are_reused_and_keys_found_past_them(self):
+        # arrange
+        shared = SharedObservableDict(capacity=4, key_size=8, value_format='q')
+        self.addCleanup(shared.dispose)
+
+        # act
+        shared.update({'a': 1, 'b': 2, 'c': 3, 'd': 4})
+        self.assertRaises(ValueError, shared.__setitem__, 'e', 5)
+        del shared['a']
+        shared['e'] = 5
+
+        # assert
+        self.assertEqual({'b': 2, 'c': 3, 'd': 4, 'e': 5}, dict(shared.items()))
+
+    def test_churn_reclaims_deleted_slots(self):
+        # arrange
+        shared = SharedObservableDict(capacity=8, key_size=8, value_format='q')
+        self.addCleanup(shared.dispose)
+        shared.update({'keep': 1})
+
+        # act
+        for i in range(500):
+            shared['k{}'.format(i)] = i
+            del shared['k{}'.format(i)]
+
+        # assert
+        self.assertLessEqual(shared._used, shared._slots * 3 // 4)
+        self.assertEqual({'keep': 1}, dict(shared.items()))
+        self.assertIsNone(shared.get('k7'))
+
+    def test_read_failing_during_a_write_is_retried(self):
+        # arrange
+        attempts = []
+
+        def read():
+            attempts.append(1)
+            if len(attempts) == 1:
+                self.shared['a'] = (1, 1.0)
+                raise UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'torn key')
+            return 'read'
+
+        # act
+        result = self.shared._read(read)
+
+        # assert
+        self.assertEqual('read', result)
+        self.assertEqual(2, len(attempts))
+        self.assertRaises(KeyError, self.shared._read, lambda: {}['missing'])
+
+    def test_version_advances_by_two_per_write(self):
+        # act
+        before = self.shared.version
+        self.shared['a'] = (1, 1.0)
+        self.shared.update({'b': (2, 2.0), 'c': (3, 3.0)})
+
+        # assert
+        self.assertEqual(before + 6, self.shared.version)
+
+    def test_attached_reader_is_read_only(self):
+        # arrange
+        self.shared['a'] = (1, 1.0)
+        reader = SharedObservableDict.attach(self.shared.name)
+        self.addCleanup(reader.dispose)
+
+        # act
+        self.shared['b'] = (2, 2.0)
+
+        # assert
+        self.assertEqual({'a': (1, 1.0), 'b': (2, 2.0)}, dict(reader.items()))
+        self.assertEqual(self.shared.version, reader.version)
+        self.assertRaises(PermissionError, reader.__setitem__, 'c', (3, 3.0))
+
+    def test_another_process_reads_in_place(self):
+        # arrange
+        self.shared.update({'a': (1, 1.0), 'b': (2, 2.0)})
+        results = multiprocessing.Queue()
+
+        # act
+        child = multiprocessing.Process(target=read_in_child, args=(self.shared.name, ['a', 'b', 'c'], results))
+        child.start()
+        values, version = results.get(timeout=10)
+        child.join(10)
+
+        # assert
+        self.assertEqual([(1, 1.0), (2, 2.0), None], values)
+        self.assertEqual(self.shared.version, version)
+
+    def test_unrelated_reader_process_leaves_the_block_alive(self):
+        # arrange
+        self.shared['a'] = (1, 1.0)
+        script = 'import sys\nfrom reactive.SharedObservableDict import SharedObservableDict\n' \
+                 'reader = SharedObservableDict.attach(sys.argv[1])\nprint(reader["a"])\nreader.dispose()\n'
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        # act
+        reader = subprocess.run([sys.executable, '-c', script, self.shared.name], cwd=root, timeout=30,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+        # assert
+        self.assertEqual(('(1, 1.0)', ''), (reader.stdout.strip(), reader.stderr))
+        self.assertEqual((1, 1.0), self.shared['a'])
+        attached = SharedObservableDict.attach(self.shared.name)
+        self.addCleanup(attached.dispose)
+        self.assertEqual((1, 1.0), attached['a'])
+
+    def test_when_version_changes_polls_the_counter(self):
+        # arrange
+        reader = SharedObservableDict.attach(self.shared.name)
+        self.addCleanup(reader.dispose)
+        seen = []
+        subscription = reader.when_version_changes(interval=0.005).subscribe(seen.append)
+        self.addCleanup(subscription.dispose)
+
+        # act
+        self.shared['a'] = (1, 1.0)
+
+        # assert
+        for _ in range(200):
+            if seen and seen[-1] == self.shared.version:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.shared.version, seen[-1])
+
+    def test_failed_update_writes_nothing(self):
+        # arrange
+        obs = TestScheduler().create_observer()
+        self.shared['a'] = (1, 1.0)
+        self.shared.when_collection_changes().subscribe(obs)
+        version = self.shared.version
+
+        # act & assert
+        self.assertRaises(struct.error, self.shared.update, {'a': (2, 2.0), 'b': (3, 3.0), 'c': ('x', 4.0)})
+        self.assertRaises(ValueError, self.shared.update, {'k{}'.format(i): (i, 0.0) for i in range(16)})
+        self.assertEqual({'a': (1, 1.0)}, dict(self.shared.items()))
+        self.assertEqual(version, self.shared.version)
+        self.assertEqual([], obs.messages)
+
+    def test_keys_must_fit_the_schema(self):
+        # assert
+        self.assertRaises(ValueError, self.shared.__setitem__, 'much too long', (1, 1.0))
+        self.assertRaises(TypeError, self.shared.__setitem__, 1, (1, 1.0))